@@ -0,0 +1,99 @@
+import json
+import os
+import numpy as np
+
+# Versioned archetype parameter file (override with SPORTS_MARKET_ARCHETYPE_PARAMS)
+DEFAULT_PARAMS_PATH = os.environ.get(
+    'SPORTS_MARKET_ARCHETYPE_PARAMS',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'archetype_params.json')
+)
+
+# Parameter-file versions this loader understands
+SUPPORTED_VERSIONS = (1,)
+
+# Row 0 of every table: no archetype given, or one the file doesn't list
+DEFAULT_ARCHETYPE = 'default'
+
+
+class ArchetypeTables:
+    """
+    Archetype parameters compiled into dense NumPy tables
+
+    Every table is indexed by (archetype_id, timeframe_id[, stat_id]), so the
+    scalar and batched TimeframeAlgorithm paths read the same numbers with
+    plain array indexing instead of rebuilding dicts on every call.
+
+    Tables:
+        alphas: (archetypes, timeframes, stats) std-dev alpha per stat
+        weights: (archetypes, timeframes, stats) PPS weight per stat
+        multipliers: (archetypes, timeframes) projection multiplier
+        signature_boost: (archetypes, timeframes) factor applied to the alpha of
+            the player's highest projected counting stat (1.0 = none)
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config: dict in the archetype_params.json format
+        """
+        version = config.get('version')
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported archetype parameter version {version}, expected one of {SUPPORTED_VERSIONS}")
+
+        self.version = version
+        self.stats = tuple(config['stats'])
+        self.timeframes = tuple(config['timeframes'])
+        self.archetypes = (DEFAULT_ARCHETYPE,) + tuple(config['archetypes'])
+        self.archetype_ids = {name: i for i, name in enumerate(self.archetypes)}
+        self.timeframe_ids = {name: i for i, name in enumerate(self.timeframes)}
+
+        n_archetypes, n_timeframes, n_stats = len(self.archetypes), len(self.timeframes), len(self.stats)
+        self.alphas = np.empty((n_archetypes, n_timeframes, n_stats))
+        self.weights = np.empty((n_archetypes, n_timeframes, n_stats))
+        self.multipliers = np.ones((n_archetypes, n_timeframes))
+        self.signature_boost = np.ones((n_archetypes, n_timeframes))
+
+        # Archetypes missing from a section take that section's default row
+        for t, timeframe in enumerate(self.timeframes):
+            alphas = config['alphas'][timeframe]
+            for a, archetype in enumerate(self.archetypes):
+                self.alphas[a, t] = alphas.get(archetype, alphas[DEFAULT_ARCHETYPE])
+                self.weights[a, t] = config['weights'].get(archetype, config['weights'][DEFAULT_ARCHETYPE])
+            for archetype, multiplier in config.get('projection_multipliers', {}).get(timeframe, {}).items():
+                self.multipliers[self.archetype_ids[archetype], t] = multiplier
+            for archetype, boost in config.get('signature_alpha_boost', {}).get(timeframe, {}).items():
+                self.signature_boost[self.archetype_ids[archetype], t] = boost
+
+        for table in (self.alphas, self.weights, self.multipliers, self.signature_boost):
+            table.flags.writeable = False
+
+    @classmethod
+    def load(cls, path=DEFAULT_PARAMS_PATH):
+        """Tables from a parameter file"""
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def archetype_id(self, player_archetype):
+        """Table row for an archetype name (row 0 for None or unknown names)"""
+        return self.archetype_ids.get(player_archetype, 0) if player_archetype else 0
+
+    def archetype_id_array(self, player_archetypes):
+        """Table rows for a sequence of archetype names"""
+        return np.array([self.archetype_id(archetype) for archetype in player_archetypes], dtype=np.intp)
+
+    def timeframe_id(self, timeframe):
+        """Table column for a timeframe name"""
+        try:
+            return self.timeframe_ids[timeframe]
+        except KeyError:
+            raise ValueError("Invalid timeframe. Use 'weekly', 'monthly', or 'season'")
+
+
+_TABLES = {}
+
+
+def get_archetype_tables(path=DEFAULT_PARAMS_PATH):
+    """Compiled tables for a parameter file, loaded once per process"""
+    if path not in _TABLES:
+        _TABLES[path] = ArchetypeTables.load(path)
+    return _TABLES[path]
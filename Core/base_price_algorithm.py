@@ -1,17 +1,44 @@
 import numpy as np
+from scipy.special import ndtr
 from scipy.stats import norm
 
+# Column order of price_batch's stats matrix (the player_stats tuple order)
+PRICE_STATS = ('pts', 'reb', 'ast', 'to', 'stocks', 'ts%')
+
+# League averages and standard deviations (example values, used when no baseline snapshot is given)
+DEFAULT_LEAGUE_STATS = {
+    'pts': {'mean': 15.0, 'std': 8.0},
+    'ast': {'mean': 4.0, 'std': 3.0},
+    'reb': {'mean': 4.0, 'std': 2.5},
+    'to': {'mean': 2.0, 'std': 1.5},
+    'stocks': {'mean': 1.5, 'std': 1.0},
+    'ts%': {'mean': 0.55, 'std': 0.08}
+}
+
 class BasePriceAlgorithm:
-    def __init__(self):
-        # League averages and standard deviations (example values - should be updated with real data)
-        self.league_stats = {
-            'pts': {'mean': 15.0, 'std': 8.0},
-            'ast': {'mean': 4.0, 'std': 3.0},
-            'reb': {'mean': 4.0, 'std': 2.5},
-            'to': {'mean': 2.0, 'std': 1.5},
-            'stocks': {'mean': 1.5, 'std': 1.0},
-            'ts%': {'mean': 0.55, 'std': 0.08}
-        }
+    def __init__(self, league_stats=None, baseline_version=None):
+        """
+        Args:
+            league_stats: optional {stat: {'mean', 'std'}} table, e.g. from
+                MonteCarlo.league_baseline.LeagueBaseline.league_stats()
+            baseline_version: snapshot version the table came from (for reporting)
+        """
+        self.league_stats = {stat: dict(moments) for stat, moments in (league_stats or DEFAULT_LEAGUE_STATS).items()}
+        self.baseline_version = baseline_version
+    
+    @classmethod
+    def from_baseline(cls, baseline, version=None, season=None):
+        """
+        Pricer pinned to a LeagueBaseline snapshot (the newest if version is None)
+        
+        Falls back to the default table when the baseline has no snapshot yet.
+        """
+        snapshot = baseline.snapshot(version, season)
+        if snapshot is None:
+            if version is not None:
+                raise ValueError(f"No league baseline snapshot with version {version}")
+            return cls()
+        return cls(snapshot['league_stats'], baseline_version=snapshot['version'])
     
     def calculate_non_rookie_base_price(self, player_stats):
         """
@@ -101,4 +128,61 @@ class BasePriceAlgorithm:
         else:
             if player_stats is None:
                 raise ValueError("Player stats required for non-rookie players")
-            return self.calculate_non_rookie_base_price(player_stats) 
\ No newline at end of file
+            return self.calculate_non_rookie_base_price(player_stats)
+    
+    def price_batch(self, stats_matrix):
+        """
+        Non-rookie base prices for many players at once
+        
+        Same formula as calculate_non_rookie_base_price, with one z-score
+        pass and one normal-CDF call over the whole matrix.
+        
+        Args:
+            stats_matrix: array-like of shape (N, 6) in PRICE_STATS order
+        
+        Returns:
+            dict with 'base_price' and 'prs' arrays of shape (N,) and
+            'z_scores' / 'percentiles' arrays of shape (N, 6)
+        """
+        stats = np.asarray(stats_matrix, dtype=np.float64).reshape(-1, len(PRICE_STATS))
+        means = np.array([self.league_stats[stat]['mean'] for stat in PRICE_STATS])
+        stds = np.array([self.league_stats[stat]['std'] for stat in PRICE_STATS])
+        
+        z_scores = (stats - means) / stds
+        percentiles = ndtr(z_scores)
+        
+        # Same term order as the scalar path, so results match it exactly
+        pts, reb, ast, to, stocks, ts_pct = percentiles.T
+        prs = (0.40 * pts + 
+               0.25 * ast + 
+               0.20 * reb - 
+               0.10 * to + 
+               0.15 * stocks + 
+               0.10 * ts_pct)
+        prs = np.clip(prs, 0, 1)
+        
+        return {
+            'base_price': 10 + (prs * 50),
+            'prs': prs,
+            'z_scores': z_scores,
+            'percentiles': percentiles
+        }
+    
+    def rookie_price_batch(self, draft_picks):
+        """
+        Rookie base prices for many draft picks at once
+        
+        Args:
+            draft_picks: array-like of ints (1-60)
+        
+        Returns:
+            dict with 'base_price', 'drs' and 'draft_pick' arrays
+        """
+        draft_picks = np.asarray(draft_picks)
+        drs = np.maximum(0.1, 1 - np.log2(draft_picks) / np.log2(60))
+        
+        return {
+            'base_price': 10 + (drs * 25),
+            'drs': drs,
+            'draft_pick': draft_picks
+        } 
\ No newline at end of file
@@ -1,5 +1,12 @@
 import numpy as np
 import math
+from Core.intragame_batch import IntragameBatch
+from Core.intragame_params import (
+    DAMPENING_DOWN, DAMPENING_GAIN, DAMPENING_UP, DIS_BASE_ORDERS, DIS_ORDER_SCALE,
+    DIS_ORDER_SKEW, INTRAGAME_STATS, PPS_WEIGHTS, PROJECTION_RECENT_WEIGHT,
+    PROJECTION_SEASON_WEIGHT, RAW_DELTA_DIS_WEIGHT, RAW_DELTA_PPS_WEIGHT, STD_ALPHAS,
+    STD_FLOOR, TS_PCT_STD
+)
 
 class IntragameAlgorithm:
     def __init__(self):
@@ -12,24 +19,20 @@ class IntragameAlgorithm:
         """
         projected = []
         for i in range(len(season_avg)):
-            projected.append(0.5 * season_avg[i] + 0.5 * last_5_avg[i])
+            projected.append(PROJECTION_SEASON_WEIGHT * season_avg[i] + PROJECTION_RECENT_WEIGHT * last_5_avg[i])
         return tuple(projected)
     
     def calculate_standard_deviations(self, projected_stats):
         """
         Calculate standard deviations for each stat
         """
-        pts, reb, ast, to, stocks, threepm, ts_pct = projected_stats
+        projected = dict(zip(INTRAGAME_STATS, projected_stats))
         
         std_devs = {
-            'pts': 1.15 * math.sqrt(max(pts, 0.1)),
-            'reb': 1.00 * math.sqrt(max(reb, 0.1)),
-            'ast': 0.90 * math.sqrt(max(ast, 0.1)),
-            'to': 0.75 * math.sqrt(max(to, 0.1)),
-            'stocks': 0.75 * math.sqrt(max(stocks, 0.1)),
-            'threepm': 0.75 * math.sqrt(max(threepm, 0.1)),
-            'ts%': 0.07  # fixed
+            stat: alpha * math.sqrt(max(projected[stat], STD_FLOOR))
+            for stat, alpha in STD_ALPHAS.items()
         }
+        std_devs['ts%'] = TS_PCT_STD  # fixed
         
         return std_devs
     
@@ -58,15 +61,7 @@ class IntragameAlgorithm:
         Calculate Weighted PPS (Performance Points Score) - Intragame uses default weights only
         """
         # Default weights (same as original)
-        weights = {
-            'pts': 0.45,
-            'reb': 0.15,
-            'ast': 0.15,
-            'to': 0.05,
-            'stocks': 0.10,
-            'threepm': 0.05,
-            'ts%': 0.05
-        }
+        weights = PPS_WEIGHTS
         
         pps = sum(weights[stat] * z_scores[stat] for stat in weights.keys())
         return pps
@@ -75,11 +70,11 @@ class IntragameAlgorithm:
         """
         Calculate Demand Imbalance Score (DIS)
         """
-        buy_adj = 15 * pps
-        sell_adj = -15 * pps
+        buy_adj = DIS_ORDER_SCALE * pps
+        sell_adj = -DIS_ORDER_SCALE * pps
         
-        buys = 50 + buy_adj + 2
-        sells = 50 + sell_adj - 2
+        buys = DIS_BASE_ORDERS + buy_adj + DIS_ORDER_SKEW
+        sells = DIS_BASE_ORDERS + sell_adj - DIS_ORDER_SKEW
         
         dis = (buys - sells) / (buys + sells)
         return dis
@@ -88,16 +83,16 @@ class IntragameAlgorithm:
         """
         Calculate raw delta
         """
-        return 0.8 * pps + 0.2 * dis
+        return RAW_DELTA_PPS_WEIGHT * pps + RAW_DELTA_DIS_WEIGHT * dis
     
     def apply_dampening(self, raw_delta):
         """
         Apply conditional dampening
         """
         if raw_delta >= 0:
-            dampened = (1.0 * raw_delta) / math.sqrt(1 + 4 * raw_delta**2)
+            dampened = (DAMPENING_GAIN * raw_delta) / math.sqrt(1 + DAMPENING_UP * raw_delta**2)
         else:
-            dampened = (1.0 * raw_delta) / math.sqrt(1 + 2.5 * raw_delta**2)
+            dampened = (DAMPENING_GAIN * raw_delta) / math.sqrt(1 + DAMPENING_DOWN * raw_delta**2)
         
         return dampened
     
@@ -159,4 +154,21 @@ class IntragameAlgorithm:
             'new_price': new_price,
             'price_change_pct': price_change_pct,
             'old_price': old_price
-        } 
\ No newline at end of file
+        } 
+    
+    def simulate_intragame_batch(self, actual_stats, season_avg, last_5_avg, old_prices, player_names=None):
+        """
+        simulate_intragame for every player in a slate at once
+        
+        Args:
+            actual_stats: (N, 7) array of actual stats
+            season_avg: (N, 7) array of season averages
+            last_5_avg: (N, 7) array of last 5 games averages
+            old_prices: (N,) array of current prices
+            player_names: optional sequence of N names
+        
+        Returns:
+            IntragameBatch with new_prices / price_deltas arrays; per-player
+            result dicts come from its details() on demand
+        """
+        return IntragameBatch.from_averages(actual_stats, season_avg, last_5_avg, old_prices, player_names)
@@ -1,5 +1,6 @@
 from Core.intragame_algorithm import IntragameAlgorithm  # Capital C  # Updated path
 import math
+from Data.player_games import average_stats
 
 class IntragameAlgorithmReal(IntragameAlgorithm):
     """Modified intragame algorithm that uses Monte Carlo projections"""
@@ -59,7 +60,10 @@ class IntragameAlgorithmReal(IntragameAlgorithm):
                 
             season_avg = player_data["season_avg_2024"]
             games = player_data["games"]
-            last_5_avg = self._calculate_last_n_averages(games[-5:])
+            if hasattr(games, 'last_n_averages'):
+                last_5_avg = games.last_n_averages(5)
+            else:
+                last_5_avg = self._calculate_last_n_averages(games[-5:])
             projected_stats = self.calculate_projected_stats(season_avg, last_5_avg)
         
         # Step 2-8: Use existing logic from parent class
@@ -86,14 +90,5 @@ class IntragameAlgorithmReal(IntragameAlgorithm):
         }
     
     def _calculate_last_n_averages(self, games):
-        """Helper to calculate averages from last n games"""
-        if not games:
-            return (0, 0, 0, 0, 0, 0, 0)
-        
-        totals = [0] * 7
-        for game in games:
-            for i in range(7):
-                totals[i] += game[i]
-        
-        n_games = len(games)
-        return tuple(total / n_games for total in totals)
\ No newline at end of file
+        """Helper to calculate averages from last n games (PlayerGames or list of tuples)"""
+        return average_stats(games)
\ No newline at end of file
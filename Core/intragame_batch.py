@@ -0,0 +1,122 @@
+import numpy as np
+from Core.intragame_params import (
+    DAMPENING_DOWN, DAMPENING_GAIN, DAMPENING_UP, DIS_BASE_ORDERS, DIS_ORDER_SCALE,
+    DIS_ORDER_SKEW, INTRAGAME_STATS, PPS_WEIGHTS, PROJECTION_RECENT_WEIGHT,
+    PROJECTION_SEASON_WEIGHT, RAW_DELTA_DIS_WEIGHT, RAW_DELTA_PPS_WEIGHT, STD_ALPHAS,
+    STD_FLOOR, TS_PCT_STD
+)
+
+# Column layout of the shared constants
+_ALPHA_COLUMNS = [INTRAGAME_STATS.index(stat) for stat in STD_ALPHAS]
+_ALPHAS = np.array(list(STD_ALPHAS.values()))
+_TS_PCT_INDEX = INTRAGAME_STATS.index('ts%')
+_TO_INDEX = INTRAGAME_STATS.index('to')
+_PPS_COLUMNS = [(INTRAGAME_STATS.index(stat), weight) for stat, weight in PPS_WEIGHTS.items()]
+
+
+class IntragameBatch:
+    """
+    Intragame repricing for a whole slate in one vectorized pass
+
+    Runs the IntragameAlgorithm steps (std devs, z-scores, PPS, DIS, raw delta,
+    dampening, new price) as array operations over every player at once.
+    Results are arrays; the per-player dicts that simulate_intragame returns
+    are only built when details() asks for them.
+    """
+
+    def __init__(self, actual_stats, projected_stats, old_prices, player_names=None):
+        """
+        Args:
+            actual_stats: (N, 7) array of tonight's stats in INTRAGAME_STATS order
+            projected_stats: (N, 7) array of projections (e.g. Monte Carlo means)
+            old_prices: (N,) array of current prices
+            player_names: optional sequence of N names, for details_for()
+        """
+        self.actual_stats = np.asarray(actual_stats, dtype=np.float64).reshape(-1, len(INTRAGAME_STATS))
+        self.projected_stats = np.asarray(projected_stats, dtype=np.float64).reshape(-1, len(INTRAGAME_STATS))
+        self.old_prices = np.asarray(old_prices, dtype=np.float64)
+        self.player_names = list(player_names) if player_names is not None else None
+        self._name_index = None
+        self._price()
+
+    @classmethod
+    def from_averages(cls, actual_stats, season_avg, last_5_avg, old_prices, player_names=None):
+        """Batch with IntragameAlgorithm's projection: 0.5 × Season Avg + 0.5 × Last 5 Games Avg"""
+        projected = (PROJECTION_SEASON_WEIGHT * np.asarray(season_avg, dtype=np.float64)
+                     + PROJECTION_RECENT_WEIGHT * np.asarray(last_5_avg, dtype=np.float64))
+        return cls(actual_stats, projected, old_prices, player_names)
+
+    def _price(self):
+        """Every pricing step over the whole slate"""
+        projected = self.projected_stats
+
+        std_devs = np.empty_like(projected)
+        std_devs[:, _ALPHA_COLUMNS] = _ALPHAS * np.sqrt(np.maximum(projected[:, _ALPHA_COLUMNS], STD_FLOOR))
+        std_devs[:, _TS_PCT_INDEX] = TS_PCT_STD
+
+        # Z-scores, inverted for TO
+        z_scores = (self.actual_stats - projected) / std_devs
+        z_scores[:, _TO_INDEX] = (projected[:, _TO_INDEX] - self.actual_stats[:, _TO_INDEX]) / std_devs[:, _TO_INDEX]
+
+        # PPS summed stat by stat in the scalar order
+        pps = np.zeros(len(projected))
+        for column, weight in _PPS_COLUMNS:
+            pps = pps + weight * z_scores[:, column]
+
+        buys = DIS_BASE_ORDERS + DIS_ORDER_SCALE * pps + DIS_ORDER_SKEW
+        sells = DIS_BASE_ORDERS + -DIS_ORDER_SCALE * pps - DIS_ORDER_SKEW
+        dis = (buys - sells) / (buys + sells)
+
+        raw_delta = RAW_DELTA_PPS_WEIGHT * pps + RAW_DELTA_DIS_WEIGHT * dis
+        dampened_delta = np.where(
+            raw_delta >= 0,
+            (DAMPENING_GAIN * raw_delta) / np.sqrt(1 + DAMPENING_UP * raw_delta**2),
+            (DAMPENING_GAIN * raw_delta) / np.sqrt(1 + DAMPENING_DOWN * raw_delta**2)
+        )
+
+        self.std_devs = std_devs
+        self.z_scores = z_scores
+        self.pps = pps
+        self.dis = dis
+        self.raw_delta = raw_delta
+        self.dampened_delta = dampened_delta
+        self.new_prices = self.old_prices * (1 + dampened_delta)
+        self.price_deltas = self.new_prices - self.old_prices
+        self.price_change_pct = dampened_delta * 100
+
+    def __len__(self):
+        return len(self.old_prices)
+
+    def details(self, index):
+        """
+        simulate_intragame-style result dict for one player (built on demand)
+
+        Returns:
+            dict with projected_stats, standard_deviations, z_scores, pps, dis,
+            raw_delta, dampened_delta, new_price, price_change_pct and old_price
+        """
+        return {
+            'projected_stats': tuple(self.projected_stats[index].tolist()),
+            'standard_deviations': dict(zip(INTRAGAME_STATS, self.std_devs[index].tolist())),
+            'z_scores': dict(zip(INTRAGAME_STATS, self.z_scores[index].tolist())),
+            'pps': float(self.pps[index]),
+            'dis': float(self.dis[index]),
+            'raw_delta': float(self.raw_delta[index]),
+            'dampened_delta': float(self.dampened_delta[index]),
+            'new_price': float(self.new_prices[index]),
+            'price_change_pct': float(self.price_change_pct[index]),
+            'old_price': float(self.old_prices[index])
+        }
+
+    def details_for(self, player_name):
+        """details() for a player by name (requires player_names)"""
+        if self.player_names is None:
+            raise ValueError("IntragameBatch has no player_names; use details(index)")
+        if self._name_index is None:
+            self._name_index = {name: i for i, name in enumerate(self.player_names)}
+        return self.details(self._name_index[player_name])
+
+    def iter_details(self):
+        """Lazily yield every player's details dict"""
+        for index in range(len(self)):
+            yield self.details(index)
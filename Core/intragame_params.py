@@ -0,0 +1,48 @@
+# Intragame pricing constants, read by both IntragameAlgorithm (per player)
+# and IntragameBatch (whole slate), so the two paths can't drift apart
+
+# Stat order of the intragame stat tuples and of every IntragameBatch (N, 7) array
+INTRAGAME_STATS = ('pts', 'reb', 'ast', 'to', 'stocks', 'threepm', 'ts%')
+
+# Projected Stat = 0.5 × Season Avg + 0.5 × Last 5 Games Avg
+PROJECTION_SEASON_WEIGHT = 0.5
+PROJECTION_RECENT_WEIGHT = 0.5
+
+# Std dev = alpha × sqrt(max(projected, STD_FLOOR)) for the counting stats
+STD_ALPHAS = {
+    'pts': 1.15,
+    'reb': 1.00,
+    'ast': 0.90,
+    'to': 0.75,
+    'stocks': 0.75,
+    'threepm': 0.75
+}
+STD_FLOOR = 0.1
+
+# ts% uses a fixed std dev
+TS_PCT_STD = 0.07
+
+# Default PPS weights (intragame ignores the player archetype); PPS sums in this order
+PPS_WEIGHTS = {
+    'pts': 0.45,
+    'reb': 0.15,
+    'ast': 0.15,
+    'to': 0.05,
+    'stocks': 0.10,
+    'threepm': 0.05,
+    'ts%': 0.05
+}
+
+# DIS order flow: buys = 50 + 15 × PPS + 2, sells = 50 - 15 × PPS - 2
+DIS_BASE_ORDERS = 50
+DIS_ORDER_SCALE = 15
+DIS_ORDER_SKEW = 2
+
+# Raw delta = 0.8 × PPS + 0.2 × DIS
+RAW_DELTA_PPS_WEIGHT = 0.8
+RAW_DELTA_DIS_WEIGHT = 0.2
+
+# Dampened delta = gain × raw / sqrt(1 + k × raw²), k by the sign of raw
+DAMPENING_GAIN = 1.0
+DAMPENING_UP = 4
+DAMPENING_DOWN = 2.5
@@ -1,9 +1,15 @@
 import numpy as np
 import math
+from Core.archetype_params import DEFAULT_PARAMS_PATH, get_archetype_tables
 
 class TimeframeAlgorithm:
-    def __init__(self):
-        pass
+    def __init__(self, params_path=None):
+        """
+        Args:
+            params_path: optional archetype parameter file (defaults to Core/archetype_params.json)
+        """
+        # Alphas, PPS weights and projection multipliers per (archetype, timeframe, stat)
+        self.tables = get_archetype_tables(params_path or DEFAULT_PARAMS_PATH)
     
     def calculate_projected_stats(self, season_avg, recent_avg, timeframe, use_2023_stats=False, player_archetype=None):
         """
@@ -16,51 +22,22 @@ class TimeframeAlgorithm:
             use_2023_stats: bool, if True, use 2023-2024 stats for season projections
             player_archetype: str, player archetype for projection adjustments
         """
-        if timeframe == "weekly":
+        timeframe_id = self.tables.timeframe_id(timeframe)
+        
+        if timeframe in ("weekly", "monthly"):
             # Weekly: 0.5 × Season Avg + 0.5 × Last 4 Games Avg
-            projected = []
-            for i in range(len(season_avg)):
-                projected.append(0.5 * season_avg[i] + 0.5 * recent_avg[i])
-        elif timeframe == "monthly":
             # Monthly: 0.5 × Season Avg + 0.5 × Last 12 Games Avg
             projected = []
             for i in range(len(season_avg)):
                 projected.append(0.5 * season_avg[i] + 0.5 * recent_avg[i])
-        elif timeframe == "season":
-            if use_2023_stats:
-                # Season: Use 2023-2024 season averages as baseline
-                projected = list(season_avg)  # season_avg will be 2023-2024 stats
-            else:
-                # Season: Use 2024-2025 season averages
-                projected = list(season_avg)
         else:
-            raise ValueError("Invalid timeframe. Use 'weekly', 'monthly', or 'season'")
-        
-        # Apply archetype-specific projection multiplier
-        if player_archetype == "Superstars" and timeframe == "weekly":
-            # Boost weekly superstar projections by 3.25%
-            projected = [stat * 1.0325 for stat in projected]
-        elif player_archetype == "Elite Playmakers" and timeframe == "weekly":
-            # Boost weekly elite playmaker projections by 3.25% (2.5% + 0.75%)
-            projected = [stat * 1.0325 for stat in projected]
-        elif player_archetype == "Versatile" and timeframe == "weekly":
-            # Boost weekly versatile projections by 4.25% (3% + 1% + 0.5% - 0.25%)
-            projected = [stat * 1.0425 for stat in projected]
-        elif player_archetype == "One Dimensional" and timeframe == "weekly":
-            # Boost weekly one dimensional projections by 0.5%
-            projected = [stat * 1.005 for stat in projected]
-        elif player_archetype == "Role Players" and timeframe == "weekly":
-            # Boost weekly role player projections by 0.55% (0.3% + 0.25%)
-            projected = [stat * 1.0055 for stat in projected]
-        elif player_archetype == "Turnover Prone" and timeframe == "weekly":
-            # Reduce weekly turnover prone projections by 2%
-            projected = [stat * 0.98 for stat in projected]
-        elif player_archetype == "Rebounding Machines" and timeframe == "weekly":
-            # Reduce weekly rebounding machine projections by 1.3%
-            projected = [stat * 0.987 for stat in projected]
-        elif player_archetype == "High Volume Scorers" and timeframe == "weekly":
-            # Reduce weekly high volume scorer projections by 1.3%
-            projected = [stat * 0.987 for stat in projected]
+            # Season: season averages as baseline (2023-2024 stats when use_2023_stats)
+            projected = list(season_avg)
+        
+        # Apply archetype-specific projection multiplier (e.g. weekly Superstars +3.25%)
+        multiplier = float(self.tables.multipliers[self.tables.archetype_id(player_archetype), timeframe_id])
+        if multiplier != 1.0:
+            projected = [stat * multiplier for stat in projected]
         
         return tuple(projected)
     
@@ -68,159 +45,37 @@ class TimeframeAlgorithm:
         """
         Calculate standard deviations using timeframe-specific alpha values
         """
-        pts, reb, ast, to, stocks, threepm, ts_pct = projected_stats
-        
-        # Define alpha values for each timeframe
-        if timeframe == "weekly":
-            alphas = self._get_weekly_alphas(player_archetype, projected_stats)
-        elif timeframe == "monthly":
-            alphas = {
-                'pts': 0.809,
-                'reb': 0.539,
-                'ast': 0.539,
-                'to': 0.547,
-                'stocks': 0.547,
-                'threepm': 0.547,
-                'ts%': 0.07
-            }
-        else:  # season
-            alphas = {
-                'pts': 0.794,
-                'reb': 0.529,
-                'ast': 0.529,
-                'to': 0.537,
-                'stocks': 0.537,
-                'threepm': 0.537,
-                'ts%': 0.07
-            }
+        alphas = self._alphas(timeframe, player_archetype, projected_stats)
         
         std_devs = {
-            'pts': alphas['pts'] * math.sqrt(max(pts, 0.1)),
-            'reb': alphas['reb'] * math.sqrt(max(reb, 0.1)),
-            'ast': alphas['ast'] * math.sqrt(max(ast, 0.1)),
-            'to': alphas['to'] * math.sqrt(max(to, 0.1)),
-            'stocks': alphas['stocks'] * math.sqrt(max(stocks, 0.1)),
-            'threepm': alphas['threepm'] * math.sqrt(max(threepm, 0.1)),
-            'ts%': alphas['ts%']  # fixed
+            stat: alphas[stat] * math.sqrt(max(value, 0.1))
+            for stat, value in zip(self.tables.stats[:-1], projected_stats)
         }
+        std_devs['ts%'] = alphas['ts%']  # fixed
         
         return std_devs
     
+    def _alpha_row(self, archetype_id, timeframe_id, projected_stats):
+        """Alpha table row, with the signature-stat boost applied where the archetype has one"""
+        alphas = self.tables.alphas[archetype_id, timeframe_id]
+        boost = self.tables.signature_boost[archetype_id, timeframe_id]
+        if boost != 1.0:
+            # Signature stat: highest projected stat excluding ts%
+            alphas = alphas.copy()
+            alphas[int(np.argmax(projected_stats[:-1]))] *= boost
+        return alphas
+    
+    def _alphas(self, timeframe, player_archetype, projected_stats):
+        """Alpha per stat for a timeframe and archetype"""
+        row = self._alpha_row(self.tables.archetype_id(player_archetype),
+                              self.tables.timeframe_id(timeframe), projected_stats)
+        return dict(zip(self.tables.stats, row.tolist()))
+    
     def _get_weekly_alphas(self, player_archetype, projected_stats):
         """
         Get archetype-specific weekly alpha values
         """
-        # Default weekly alphas
-        default_alphas = {
-            'pts': 1.418,
-            'reb': 0.945,
-            'ast': 0.945,
-            'to': 0.958,
-            'stocks': 0.958,
-            'threepm': 0.958,
-            'ts%': 0.07
-        }
-        
-        if not player_archetype:
-            return default_alphas
-        
-        # Archetype-specific alpha values
-        if player_archetype == "Superstars":
-            return {
-                'pts': 1.6,      # +12.8%
-                'reb': 1.1,      # +16.4%
-                'ast': 1.1,      # +16.4%
-                'to': 0.958,     # unchanged
-                'stocks': 0.958, # unchanged
-                'threepm': 0.958, # unchanged
-                'ts%': 0.07      # unchanged
-            }
-        elif player_archetype == "Versatile":
-            return {
-                'pts': 1.702,    # +20%
-                'reb': 1.134,    # +20%
-                'ast': 1.134,    # +20%
-                'to': 1.150,     # +20%
-                'stocks': 1.150, # +20%
-                'threepm': 1.150, # +20%
-                'ts%': 0.084     # +20%
-            }
-        elif player_archetype == "Elite Playmakers":
-            return {
-                'pts': 1.418,    # unchanged
-                'reb': 0.945,    # unchanged
-                'ast': 1.2,      # +27.0%
-                'to': 0.958,     # unchanged
-                'stocks': 0.958, # unchanged
-                'threepm': 0.958, # unchanged
-                'ts%': 0.07      # unchanged
-            }
-        elif player_archetype == "High Volume Scorers":
-            return {
-                'pts': 1.3,      # -8.3%
-                'reb': 0.945,    # unchanged
-                'ast': 0.945,    # unchanged
-                'to': 0.958,     # unchanged
-                'stocks': 0.958, # unchanged
-                'threepm': 0.958, # unchanged
-                'ts%': 0.07      # unchanged
-            }
-        elif player_archetype == "Rebounding Machines":
-            return {
-                'pts': 1.418,    # unchanged
-                'reb': 0.85,     # -10.1%
-                'ast': 0.945,    # unchanged
-                'to': 0.958,     # unchanged
-                'stocks': 0.958, # unchanged
-                'threepm': 0.958, # unchanged
-                'ts%': 0.07      # unchanged
-            }
-        elif player_archetype == "Bench Warmers":
-            return {
-                'pts': 1.45,     # +2.3%
-                'reb': 0.945,    # unchanged
-                'ast': 0.945,    # unchanged
-                'to': 0.958,     # unchanged
-                'stocks': 0.958, # unchanged
-                'threepm': 0.958, # unchanged
-                'ts%': 0.07      # unchanged
-            }
-        elif player_archetype == "Turnover Prone":
-            return {
-                'pts': 1.418,    # unchanged
-                'reb': 0.945,    # unchanged
-                'ast': 0.945,    # unchanged
-                'to': 1.1,       # +14.8%
-                'stocks': 0.958, # unchanged
-                'threepm': 0.958, # unchanged
-                'ts%': 0.07      # unchanged
-            }
-        elif player_archetype == "One Dimensional":
-            # Find signature stat (highest stat excluding ts%)
-            pts, reb, ast, to, stocks, threepm, ts_pct = projected_stats
-            stats = [pts, reb, ast, to, stocks, threepm]
-            stat_names = ['pts', 'reb', 'ast', 'to', 'stocks', 'threepm']
-            max_index = stats.index(max(stats))
-            signature_stat = stat_names[max_index]
-            
-            # Start with default alphas
-            alphas = default_alphas.copy()
-            # Raise signature stat by 8%
-            alphas[signature_stat] *= 1.08
-            return alphas
-        elif player_archetype == "Role Players":
-            return {
-                'pts': 1.489,    # +5%
-                'reb': 0.992,    # +5%
-                'ast': 0.992,    # +5%
-                'to': 1.006,     # +5%
-                'stocks': 1.006, # +5%
-                'threepm': 1.006, # +5%
-                'ts%': 0.074     # +5%
-            }
-        else:
-            # Default for Elite Shooters, Elite Defenders, High Efficiency
-            return default_alphas
+        return self._alphas("weekly", player_archetype, projected_stats)
     
     def calculate_actual_averages(self, actual_totals, num_games):
         """
@@ -251,25 +106,11 @@ class TimeframeAlgorithm:
         
         return z_scores
     
-    def calculate_pps(self, z_scores, player_archetype=None):
+    def calculate_pps(self, z_scores, player_archetype=None, timeframe=None):
         """
         Calculate PPS (Performance Points Score) with archetype-specific weightings
         """
-        # Default weights
-        default_weights = {
-            'pts': 0.45,
-            'reb': 0.15,
-            'ast': 0.15,
-            'to': 0.05,
-            'stocks': 0.10,
-            'threepm': 0.05,
-            'ts%': 0.05
-        }
-        
-        if not player_archetype:
-            weights = default_weights
-        else:
-            weights = self._get_archetype_weights(player_archetype)
+        weights = self._get_archetype_weights(player_archetype, timeframe)
         
         # Calculate PPS with hard cap for weekly superstars
         if player_archetype == "Superstars":
@@ -281,141 +122,13 @@ class TimeframeAlgorithm:
         
         return pps
     
-    def _get_archetype_weights(self, player_archetype):
+    def _get_archetype_weights(self, player_archetype, timeframe=None):
         """
         Get archetype-specific PPS weights for weekly, monthly, and season algorithms
         """
-        if player_archetype == "Superstars":
-            return {
-                'pts': 0.35,
-                'reb': 0.125,
-                'ast': 0.125,
-                'to': 0.075,
-                'stocks': 0.125,
-                'threepm': 0.10,
-                'ts%': 0.10
-            }
-        elif player_archetype == "Elite Shooters":
-            return {
-                'pts': 0.45,
-                'reb': 0.15,
-                'ast': 0.15,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.05
-            }
-        elif player_archetype == "Elite Defenders":
-            return {
-                'pts': 0.45,
-                'reb': 0.15,
-                'ast': 0.15,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.05
-            }
-        elif player_archetype == "High Volume Scorers":
-            return {
-                'pts': 0.425,
-                'reb': 0.125,
-                'ast': 0.125,
-                'to': 0.05,
-                'stocks': 0.075,
-                'threepm': 0.10,
-                'ts%': 0.10
-            }
-        elif player_archetype == "Elite Playmakers":
-            return {
-                'pts': 0.375,
-                'reb': 0.15,
-                'ast': 0.225,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.05
-            }
-        elif player_archetype == "Rebounding Machines":
-            return {
-                'pts': 0.375,
-                'reb': 0.15,
-                'ast': 0.225,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.05
-            }
-        elif player_archetype == "Bench Warmers":
-            return {
-                'pts': 0.30,
-                'reb': 0.20,
-                'ast': 0.20,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.10
-            }
-        elif player_archetype == "High Efficiency":
-            return {
-                'pts': 0.45,
-                'reb': 0.125,
-                'ast': 0.15,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.075
-            }
-        elif player_archetype == "Turnover Prone":
-            return {
-                'pts': 0.45,
-                'reb': 0.15,
-                'ast': 0.15,
-                'to': 0.025,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.075
-            }
-        elif player_archetype == "One Dimensional":
-            return {
-                'pts': 0.35,
-                'reb': 0.175,
-                'ast': 0.175,
-                'to': 0.05,
-                'stocks': 0.125,
-                'threepm': 0.03,
-                'ts%': 0.095
-            }
-        elif player_archetype == "Versatile":
-            return {
-                'pts': 0.35,
-                'reb': 0.125,
-                'ast': 0.125,
-                'to': 0.075,
-                'stocks': 0.125,
-                'threepm': 0.10,
-                'ts%': 0.10
-            }
-        elif player_archetype == "Role Players":
-            return {
-                'pts': 0.425,
-                'reb': 0.175,
-                'ast': 0.175,
-                'to': 0.05,
-                'stocks': 0.075,
-                'threepm': 0.05,
-                'ts%': 0.05
-            }
-        else:
-            # Default weights for unknown archetypes
-            return {
-                'pts': 0.45,
-                'reb': 0.15,
-                'ast': 0.15,
-                'to': 0.05,
-                'stocks': 0.10,
-                'threepm': 0.05,
-                'ts%': 0.05
-            }
+        timeframe_id = self.tables.timeframe_id(timeframe) if timeframe else 0
+        row = self.tables.weights[self.tables.archetype_id(player_archetype), timeframe_id]
+        return dict(zip(self.tables.stats, row.tolist()))
     
     def calculate_dis(self, pps, player_archetype=None):
         """
@@ -495,7 +208,7 @@ class TimeframeAlgorithm:
         z_scores = self.calculate_z_scores(actual_avg, projected_stats, std_devs)
         
         # Step 5: Calculate PPS
-        pps = self.calculate_pps(z_scores, player_archetype)
+        pps = self.calculate_pps(z_scores, player_archetype, timeframe)
         
         # Step 6: Calculate DIS
         dis = self.calculate_dis(pps, player_archetype)
@@ -523,4 +236,120 @@ class TimeframeAlgorithm:
             'old_price': old_price,
             'timeframe': timeframe,
             'num_games': num_games
-        } 
\ No newline at end of file
+        }
+
+    def simulate_timeframe_batch(self, actual_totals, num_games, season_avg, recent_avg, old_prices,
+                                 timeframes, player_archetypes=None):
+        """
+        Settle many players (and timeframes) in one vectorized pass
+        
+        Same steps, parameter tables and operation order as simulate_timeframe,
+        so every row matches the scalar result for that player (to the last
+        bit up to PPS; squaring in the dampening step can differ by one ulp).
+        
+        Args:
+            actual_totals: (N, 7) array of stat totals over each player's timeframe
+            num_games: (N,) array of games played in the timeframe (no zeros;
+                ZeroDivisionError like the scalar path)
+            season_avg: (N, 7) array of season averages
+            recent_avg: (N, 7) array of recent-games averages
+            old_prices: (N,) array of current prices
+            timeframes: 'weekly' / 'monthly' / 'season', or a sequence of them (one per player)
+            player_archetypes: optional sequence of archetype names (None allowed)
+                or an int array of archetype ids from self.tables
+        
+        Returns:
+            dict of arrays: 'projected_stats', 'standard_deviations',
+            'actual_averages' and 'z_scores' are (N, 7) in stat order
+            (pts, reb, ast, to, stocks, threepm, ts%); 'pps', 'dis',
+            'raw_delta', 'dampened_delta', 'new_price', 'price_change_pct',
+            'old_price', 'num_games', 'timeframe_id' and 'archetype_id' are (N,)
+        """
+        tables = self.tables
+        actual_totals = np.asarray(actual_totals, dtype=np.float64)
+        season_avg = np.asarray(season_avg, dtype=np.float64)
+        recent_avg = np.asarray(recent_avg, dtype=np.float64)
+        old_prices = np.asarray(old_prices, dtype=np.float64)
+        num_games = np.asarray(num_games)
+        n = len(old_prices)
+        if np.any(num_games == 0):
+            # The scalar path divides by num_games too; don't settle on inf/nan averages
+            raise ZeroDivisionError(f"num_games is 0 for rows {np.flatnonzero(num_games == 0).tolist()}")
+        
+        if isinstance(timeframes, str):
+            timeframe_ids = np.full(n, tables.timeframe_id(timeframes), dtype=np.intp)
+        else:
+            timeframe_ids = np.array([tables.timeframe_id(timeframe) for timeframe in timeframes], dtype=np.intp)
+        
+        if player_archetypes is None:
+            archetype_ids = np.zeros(n, dtype=np.intp)
+        else:
+            archetype_ids = np.asarray(player_archetypes)
+            if archetype_ids.dtype.kind not in 'iu':
+                archetype_ids = tables.archetype_id_array(player_archetypes)
+        
+        # Step 1: Projected stats (weekly/monthly blend season and recent; season uses season)
+        blended = np.isin(timeframe_ids, [tables.timeframe_id("weekly"), tables.timeframe_id("monthly")])
+        projected = np.where(blended[:, None], 0.5 * season_avg + 0.5 * recent_avg, season_avg)
+        projected = projected * tables.multipliers[archetype_ids, timeframe_ids][:, None]
+        
+        # Step 2: Standard deviations (alpha rows, signature-stat boost, fixed ts%)
+        alphas = tables.alphas[archetype_ids, timeframe_ids]
+        boost = tables.signature_boost[archetype_ids, timeframe_ids]
+        boosted = np.flatnonzero(boost != 1.0)
+        if boosted.size:
+            alphas = alphas.copy()
+            signature = np.argmax(projected[boosted, :-1], axis=1)
+            alphas[boosted, signature] *= boost[boosted]
+        std_devs = np.empty_like(projected)
+        std_devs[:, :-1] = alphas[:, :-1] * np.sqrt(np.maximum(projected[:, :-1], 0.1))
+        std_devs[:, -1] = alphas[:, -1]
+        
+        # Step 3: Actual per-game averages
+        actual_avg = actual_totals / num_games[:, None]
+        
+        # Step 4: Z-scores (inverted for TO)
+        z_scores = (actual_avg - projected) / std_devs
+        to_index = tables.stats.index('to')
+        z_scores[:, to_index] = (projected[:, to_index] - actual_avg[:, to_index]) / std_devs[:, to_index]
+        
+        # Step 5: PPS, summed stat by stat in the scalar order; Superstars score 0 as in calculate_pps
+        weights = tables.weights[archetype_ids, timeframe_ids]
+        pps = np.zeros(n)
+        for i in range(len(tables.stats)):
+            pps = pps + weights[:, i] * z_scores[:, i]
+        pps = np.where(archetype_ids == tables.archetype_id("Superstars"), 0.0, pps)
+        
+        # Step 6: DIS
+        buys = 50 + 15 * pps + 2
+        sells = 50 + -15 * pps - 2
+        dis = (buys - sells) / (buys + sells)
+        
+        # Step 7: Raw delta
+        raw_delta = 0.8 * pps + 0.2 * dis
+        
+        # Step 8: Dampening (upside capped at 10 weekly/monthly, 50 season)
+        cap = np.where(timeframe_ids == tables.timeframe_id("season"), 50.0, 10.0)
+        upside = np.minimum(raw_delta / np.sqrt(np.maximum(1 - 0.1 * raw_delta**2, 0.001)), cap)
+        downside = -1 * (np.abs(raw_delta)**2 / (np.abs(raw_delta)**2 + 0.18))
+        dampened_delta = np.where(raw_delta >= 0, upside, downside)
+        
+        # Step 9: New prices
+        new_price = old_prices * (1 + dampened_delta)
+        
+        return {
+            'projected_stats': projected,
+            'standard_deviations': std_devs,
+            'actual_averages': actual_avg,
+            'z_scores': z_scores,
+            'pps': pps,
+            'dis': dis,
+            'raw_delta': raw_delta,
+            'dampened_delta': dampened_delta,
+            'new_price': new_price,
+            'price_change_pct': dampened_delta * 100,
+            'old_price': old_prices,
+            'num_games': num_games,
+            'timeframe_id': timeframe_ids,
+            'archetype_id': archetype_ids
+        }
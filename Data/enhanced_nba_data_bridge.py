@@ -17,6 +17,8 @@ except ImportError:
     from MonteCarlo.main import NBAMonteCarloSimulator as EnhancedNBAMonteCarloSimulator
 
 from Data.nba_data_bridge import NBADataBridge
+from MonteCarlo.bulk_fetch import prefetch_game_logs
+from MonteCarlo.team_index import same_team
 
 class EnhancedNBADataBridge(NBADataBridge):
     """Enhanced bridge with real game validation and contextual adjustments"""
@@ -75,6 +77,10 @@ class EnhancedNBADataBridge(NBADataBridge):
         """
         print("🎯 Searching for optimal demo game...")
         
+        # Warm every priority player's logs concurrently so the search below
+        # reads from the local store instead of one request per attempt
+        prefetch_game_logs(self.mc_simulator, self.priority_players, seasons=("2023-24",))
+        
         attempts = 0
         while attempts < max_attempts:
             attempts += 1
@@ -94,7 +100,7 @@ class EnhancedNBADataBridge(NBADataBridge):
                 "Hornets", "Pacers", "Magic", "Pistons", "Rockets", "Kings"
             ]
             
-            opponent_teams = [t for t in all_teams if t != player_team]
+            opponent_teams = [t for t in all_teams if not same_team(t, player_team)]
             opponent_team = random.choice(opponent_teams)
             
             # Try to find real games between these teams
@@ -150,7 +156,7 @@ class EnhancedNBADataBridge(NBADataBridge):
         # Use enhanced simulator if available
         if hasattr(self.mc_simulator, 'run_enhanced_monte_carlo_simulation'):
             simulation_results, adjustments, metadata = self.mc_simulator.run_enhanced_monte_carlo_simulation(
-                player_name, opponent_team, game_date, player_team, n_simulations
+                player_name, opponent_team, game_date, player_team, n_simulations, joint=True
             )
             
             if simulation_results is None:
@@ -159,24 +165,12 @@ class EnhancedNBADataBridge(NBADataBridge):
             # Calculate percentiles
             percentiles = self.mc_simulator.calculate_enhanced_percentiles(simulation_results)
             
-            # Convert to the format expected by the market system
+            # Convert to the format expected by the market system; the joint
+            # run covers all 7 stats, so no season-average back-fill is needed
             projections = {}
-            for stat in ['PTS', 'REB', 'AST']:
+            for stat in percentiles:
                 projections[stat] = percentiles[stat]['mean']
-            
-            # Add other required stats (using player data or defaults)
-            player_data = self.get_real_player_data(player_name)
-            if player_data:
-                season_avg = player_data['season_avg_2024']
-                projections['TO'] = season_avg[3]
-                projections['STOCKS'] = season_avg[4]
-                projections['3PM'] = season_avg[5]
-                projections['TS%'] = season_avg[6]
-            else:
-                projections['TO'] = 2.0
-                projections['STOCKS'] = 1.5
-                projections['3PM'] = 2.0
-                projections['TS%'] = 0.55
+            projections = self._complete_market_projections(player_name, projections)
             
             # Return projections with context
             return {
@@ -5,6 +5,19 @@ import pandas as pd
 from nba_api.stats.endpoints import playergamelog, leaguedashplayerstats
 from nba_api.stats.static import players, teams
 from nba_api.stats.library.parameters import Season, SeasonType
+from MonteCarlo.training_set import MARKET_STATS, game_log_matrix
+from Data.player_games import PlayerGames, average_stats
+
+# Used when neither the simulation nor the game logs provide a stat
+FALLBACK_PROJECTIONS = {
+    'PTS': 0.0,
+    'REB': 0.0,
+    'AST': 0.0,
+    'TO': 2.0,
+    'STOCKS': 1.5,
+    '3PM': 2.0,
+    'TS%': 0.55
+}
 
 class NBADataBridge:
     """Bridge between NBA API data and Sports Market system"""
@@ -29,69 +42,24 @@ class NBADataBridge:
         if game_logs is None or len(game_logs) == 0:
             return None
             
-        # Convert to sports market format
-        games_list = []
-        for _, game in game_logs.iterrows():
-            # Calculate STOCKS (steals + blocks) and other derived stats
-            stocks = game.get('STL', 0) + game.get('BLK', 0)
-            
-            # Calculate True Shooting % if not available
-            if 'TS_PCT' not in game:
-                fga = game.get('FGA', 0)
-                fta = game.get('FTA', 0)
-                pts = game.get('PTS', 0)
-                if (fga + 0.44 * fta) > 0:
-                    ts_pct = pts / (2 * (fga + 0.44 * fta))
-                else:
-                    ts_pct = 0
-            else:
-                ts_pct = game['TS_PCT']
-            
-            game_tuple = (
-                float(game.get('PTS', 0)),
-                float(game.get('REB', 0)),
-                float(game.get('AST', 0)),
-                float(game.get('TOV', 0)),
-                float(stocks),
-                float(game.get('FG3M', 0)),
-                float(ts_pct)
-            )
-            games_list.append(game_tuple)
+        # Normalize to the (games, 7) market stat matrix with game dates alongside
+        games = PlayerGames(game_log_matrix(game_logs), dates=game_logs['GAME_DATE'].to_numpy())
         
         # Calculate season averages
-        season_avg = self._calculate_season_averages(games_list)
+        season_avg = games.season_averages()
         
         # Get previous season data for comparison
         prev_season = self._get_previous_season(season)
         prev_game_logs = self.mc_simulator.fetch_player_game_logs(player_name, prev_season)
         
         if prev_game_logs is not None and len(prev_game_logs) > 0:
-            prev_games_list = []
-            for _, game in prev_game_logs.iterrows():
-                stocks = game.get('STL', 0) + game.get('BLK', 0)
-                fga = game.get('FGA', 0)
-                fta = game.get('FTA', 0)
-                pts = game.get('PTS', 0)
-                ts_pct = pts / (2 * (fga + 0.44 * fta)) if (fga + 0.44 * fta) > 0 else 0
-                
-                prev_game_tuple = (
-                    float(game.get('PTS', 0)),
-                    float(game.get('REB', 0)),
-                    float(game.get('AST', 0)),
-                    float(game.get('TOV', 0)),
-                    float(stocks),
-                    float(game.get('FG3M', 0)),
-                    float(ts_pct)
-                )
-                prev_games_list.append(prev_game_tuple)
-            
-            prev_season_avg = self._calculate_season_averages(prev_games_list)
+            prev_season_avg = PlayerGames(game_log_matrix(prev_game_logs)).season_averages()
         else:
             # Use current season avg as fallback
             prev_season_avg = season_avg
         
         player_data = {
-            "games": games_list,
+            "games": games,
             "season_avg_2023": prev_season_avg,  # Previous season
             "season_avg_2024": season_avg        # Current season
         }
@@ -100,17 +68,8 @@ class NBADataBridge:
         return player_data
     
     def _calculate_season_averages(self, games):
-        """Calculate season averages from game data"""
-        if not games:
-            return (0, 0, 0, 0, 0, 0, 0)
-        
-        totals = [0] * 7
-        for game in games:
-            for i in range(7):
-                totals[i] += game[i]
-        
-        n_games = len(games)
-        return tuple(total / n_games for total in totals)
+        """Calculate season averages from game data (PlayerGames or list of tuples)"""
+        return average_stats(games)
     
     def _get_previous_season(self, season):
         """Get previous season string"""
@@ -120,35 +79,69 @@ class NBADataBridge:
     
     def get_monte_carlo_projection(self, player_name, opponent_team, game_date, n_simulations=10000):
         """Get projection from Monte Carlo simulation"""
-        sim_results, _ = self.mc_simulator.run_monte_carlo_simulation(
-            player_name, opponent_team, game_date, n_simulations
-        )
+        if hasattr(self.mc_simulator, 'run_enhanced_monte_carlo_simulation'):
+            # Joint 7-stat run: every market stat comes from the same simulation
+            sim_results, _, _ = self.mc_simulator.run_enhanced_monte_carlo_simulation(
+                player_name, opponent_team, game_date, n_simulations=n_simulations, joint=True
+            )
+        else:
+            sim_results, _ = self.mc_simulator.run_monte_carlo_simulation(
+                player_name, opponent_team, game_date, n_simulations
+            )
         
         if sim_results is None:
             return None
             
         # Calculate mean projections
         projections = {}
-        for stat in ['PTS', 'REB', 'AST']:
-            projections[stat] = np.mean(sim_results[stat])
+        for stat, values in sim_results.items():
+            projections[stat] = float(np.mean(values))
         
-        # We need to add projections for other stats required by the market system
-        # For now, use historical averages
-        player_data = self.get_real_player_data(player_name)
-        if player_data:
-            season_avg = player_data['season_avg_2024']
-            projections['TO'] = season_avg[3]  # Turnovers
-            projections['STOCKS'] = season_avg[4]  # Steals + Blocks
-            projections['3PM'] = season_avg[5]  # 3-pointers made
-            projections['TS%'] = season_avg[6]  # True shooting %
-        else:
-            # Fallback values
-            projections['TO'] = 2.0
-            projections['STOCKS'] = 1.5
-            projections['3PM'] = 2.0
-            projections['TS%'] = 0.55
-            
-        return projections
+        return self._complete_market_projections(player_name, projections)
+    
+    def _complete_market_projections(self, player_name, projections):
+        """
+        Order projections as the market stat tuple, back-filling any stat the
+        simulator did not produce from historical averages
+        """
+        missing = [stat for stat in MARKET_STATS if stat not in projections]
+        if missing:
+            player_data = self.get_real_player_data(player_name)
+            for stat in missing:
+                if player_data:
+                    projections[stat] = player_data['season_avg_2024'][MARKET_STATS.index(stat)]
+                else:
+                    # Fallback values
+                    projections[stat] = FALLBACK_PROJECTIONS.get(stat, 0.0)
+        
+        return {stat: projections[stat] for stat in MARKET_STATS}
+    
+    def project_slate(self, requests, n_simulations=10000):
+        """
+        Project a whole slate of matchups in one batched simulation
+        
+        Args:
+            requests: list of dicts with 'player_name', 'opponent_team',
+                'game_date' and optionally 'player_team'
+            n_simulations: int, draws per request
+        
+        Returns:
+            columnar slate result from the simulator (per-stat mean/std/percentile
+            arrays), plus 'projections': one market projection dict per request
+            (None where no projection could be made)
+        """
+        slate = self.mc_simulator.project_slate(requests, n_simulations=n_simulations)
+        
+        slate['projections'] = []
+        for i in range(len(requests)):
+            if slate['valid'][i]:
+                slate['projections'].append(
+                    {stat: float(slate['stats'][stat]['mean'][i]) for stat in MARKET_STATS}
+                )
+            else:
+                slate['projections'].append(None)
+        
+        return slate
     
     def clear_cache(self):
         """Clear the data cache"""
@@ -0,0 +1,166 @@
+# player_games.py
+import numpy as np
+from collections.abc import Sequence
+
+# Columns of the per-game stat matrix (the market stat tuple order)
+GAME_STAT_COLUMNS = ('PTS', 'REB', 'AST', 'TO', 'STOCKS', '3PM', 'TS%')
+
+
+def average_stats(games):
+    """
+    Per-stat averages of a game collection as a 7-tuple
+
+    Accepts a PlayerGames or a plain list of 7-stat tuples; an empty
+    collection averages to all zeros.
+    """
+    if isinstance(games, PlayerGames):
+        return games.season_averages()
+    if not games:
+        return (0, 0, 0, 0, 0, 0, 0)
+    return tuple(np.asarray(games, dtype=float).mean(axis=0).tolist())
+
+
+class PlayerGames(Sequence):
+    """
+    A player's games as one (games, 7) float array with dates alongside
+
+    Behaves like the old list of 7-float tuples: len(), iteration,
+    games[i] (a tuple), games[-n:] (a PlayerGames view), random.choice and
+    random.sample all work unchanged.
+
+    Cumulative sums and sums of squares (built lazily, once) make any
+    "last N games before date D" average or std two prefix-sum lookups.
+    """
+
+    def __init__(self, stats, dates=None):
+        """
+        Args:
+            stats: array-like of shape (games, 7) in GAME_STAT_COLUMNS order
+            dates: optional array-like of game dates (one per row); rows
+                are reordered by date when given out of order
+        """
+        stats = np.asarray(stats, dtype=np.float64).reshape(-1, len(GAME_STAT_COLUMNS))
+        dates = None if dates is None else np.asarray(dates, dtype='datetime64[ns]')
+        if dates is not None and len(dates) != len(stats):
+            raise ValueError(f"Got {len(dates)} dates for {len(stats)} games")
+        # Date windows binary-search the dates and "last n" means the latest
+        # rows, so dated games are kept in ascending date order
+        if dates is not None and np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind='stable')
+            stats, dates = stats[order], dates[order]
+        self._stats = stats
+        self._dates = dates
+        self._prefix = None
+
+    @classmethod
+    def from_tuples(cls, games, dates=None):
+        """Build from a list of 7-stat tuples"""
+        if not games:
+            return cls(np.empty((0, len(GAME_STAT_COLUMNS))), dates)
+        return cls(games, dates)
+
+    @property
+    def matrix(self):
+        """Read-only (games, 7) stat matrix"""
+        view = self._stats.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def dates(self):
+        """Game dates (datetime64) or None when unknown"""
+        return self._dates
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            dates = None if self._dates is None else self._dates[index]
+            return PlayerGames(self._stats[index], dates)
+        return tuple(self._stats[index].tolist())
+
+    def __iter__(self):
+        return iter(map(tuple, self._stats.tolist()))
+
+    def __repr__(self):
+        return f"PlayerGames({len(self)} games)"
+
+    def season_averages(self):
+        """Average of every stat over all games (zeros when there are none)"""
+        if len(self) == 0:
+            return (0, 0, 0, 0, 0, 0, 0)
+        return tuple(self._stats.mean(axis=0).tolist())
+
+    def _prefix_sums(self):
+        """(cumulative sums, cumulative sums of squares), each (games + 1, 7) with a zero first row"""
+        if self._prefix is None:
+            zeros = np.zeros((1, self._stats.shape[1]))
+            self._prefix = (
+                np.vstack([zeros, np.cumsum(self._stats, axis=0)]),
+                np.vstack([zeros, np.cumsum(self._stats * self._stats, axis=0)])
+            )
+        return self._prefix
+
+    def index_before(self, date):
+        """Number of games played strictly before date (requires dates)"""
+        if self._dates is None:
+            raise ValueError("PlayerGames has no dates; pass dates to use date windows")
+        return int(np.searchsorted(self._dates, np.datetime64(date, 'ns'), side='left'))
+
+    def window_moments(self, n, before=None):
+        """
+        Mean and std of every stat over the last n games (before a date)
+
+        Args:
+            n: int, window length (all available games if fewer; <= 0 means all)
+            before: optional date; only games strictly before it count
+
+        Returns:
+            (mean, std) - float arrays of length 7, zeros when no games qualify
+        """
+        end = len(self) if before is None else self.index_before(before)
+        start = 0 if n <= 0 else max(0, end - n)
+        count = end - start
+        if count == 0:
+            zeros = np.zeros(self._stats.shape[1])
+            return zeros, zeros.copy()
+
+        sums, squares = self._prefix_sums()
+        mean = (sums[end] - sums[start]) / count
+        variance = np.maximum((squares[end] - squares[start]) / count - mean * mean, 0)
+        return mean, np.sqrt(variance)
+
+    def last_n_averages(self, n, before=None):
+        """Average of every stat over the last n games before a date (all games if fewer)"""
+        if len(self) == 0 or (before is not None and self.index_before(before) == 0):
+            return (0, 0, 0, 0, 0, 0, 0)
+        return tuple(self.window_moments(n, before)[0].tolist())
+
+    def last_n_std(self, n, before=None):
+        """Population std of every stat over the last n games before a date"""
+        return tuple(self.window_moments(n, before)[1].tolist())
+
+    def rolling_moments(self, n):
+        """
+        Window mean and std entering every game, for backtests
+
+        Row i covers the (up to) n games before game i, so each game is
+        paired with what was known when it tipped off. Rows with no earlier
+        games are NaN.
+
+        Returns:
+            (means, stds) - arrays of shape (games, 7)
+        """
+        sums, squares = self._prefix_sums()
+        end = np.arange(len(self))
+        start = np.maximum(0, end - n)
+        count = (end - start)[:, None].astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = (sums[end] - sums[start]) / count
+            variance = np.maximum((squares[end] - squares[start]) / count - means * means, 0)
+        return means, np.sqrt(variance)
+
+    def to_tuples(self):
+        """Plain list of 7-stat tuples"""
+        return list(self)
@@ -1,5 +1,7 @@
 from Data.sports_market import SportsMarket  # Updated path
 from Data.nba_data_bridge import NBADataBridge
+from MonteCarlo.player_index import PlayerIndex
+from MonteCarlo.bulk_fetch import prefetch_game_logs
 
 class RealSportsMarket(SportsMarket):
     """Sports Market that uses real NBA player data"""
@@ -8,6 +10,7 @@ class RealSportsMarket(SportsMarket):
         self.data_bridge = NBADataBridge(monte_carlo_simulator)
         self.players = {}  # Will be populated on demand
         self.available_players = self._get_available_players()
+        self._player_index = PlayerIndex.from_names(self.available_players)
     
     def _get_available_players(self):
         """Get list of available NBA players"""
@@ -46,14 +49,22 @@ class RealSportsMarket(SportsMarket):
                 return None
         return self.players.get(player_name)
     
+    def warm_players(self, player_names=None, seasons=("2023-24", "2022-23")):
+        """
+        Prefetch game logs for many players concurrently (all available
+        players by default) into the on-disk store, bounded by the API rate limit
+        """
+        return prefetch_game_logs(
+            self.data_bridge.mc_simulator, player_names or self.available_players, seasons
+        )
+    
     def list_players(self):
         """List available NBA players"""
         return self.available_players
     
     def search_player(self, search_term):
-        """Search for players by name"""
-        matches = []
-        for player in self.available_players:
-            if search_term.lower() in player.lower():
-                matches.append(player)
-        return matches
\ No newline at end of file
+        """Search for players by name (accent/case-insensitive, best match first)"""
+        if not search_term or not search_term.strip():
+            # Every name contains the empty string, as the original substring scan had it
+            return list(self.available_players)
+        return [player['full_name'] for player in self._player_index.search(search_term)]
\ No newline at end of file
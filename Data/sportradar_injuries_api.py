@@ -4,22 +4,104 @@ Sportradar NBA Injuries API Integration
 Handles fetching and processing NBA injury data for contextual adjustments
 """
 
+import asyncio
 import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import time
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
+from requests.adapters import HTTPAdapter
+from MonteCarlo.injury_cache import InjuryCache
+from MonteCarlo.rate_limit import TokenBucket, call_with_retry
+from MonteCarlo.replay import FixtureNotFoundError, get_replay_transport
+from MonteCarlo.team_index import resolve_team
+
+# Trial keys allow one request per second; shared by every client in the process
+SPORTRADAR_LIMITER = TokenBucket(rate=1.0, capacity=1)
+SPORTRADAR_ATTEMPTS = 3
+SPORTRADAR_POOL_SIZE = 8
+
+# Seconds the current snapshot (and today's daily report) stays cached; past dates never expire
+LIVE_INJURIES_TTL = 300
+
+
+class SportradarRetryableError(OSError):
+    """429 / 5xx response that is worth retrying after a backoff"""
+
+
+class InjuredPlayer(NamedTuple):
+    player_id: Optional[str]
+    name: str
+    status: str
+    tier: str
+
+
+class TeamInjuryIndex:
+    """
+    One injuries payload parsed once: team ID -> injured players
+    
+    Built the first time a payload is used, so every later team lookup for
+    that date is a dict access; per-team boosts are memoized alongside.
+    """
+    
+    def __init__(self, payload: Dict, categorize):
+        """
+        Args:
+            payload: daily or current injuries response ({'teams': [...]})
+            categorize: callable(player_name, team_injuries) -> impact tier
+        """
+        self.payload = payload
+        self.injuries = {}  # team_id -> raw injury dicts
+        self.players = {}   # team_id -> list of InjuredPlayer
+        self.boosts = {}    # team_id -> (boost, details)
+        
+        for team in payload.get('teams', []):
+            team_id = SportradarInjuriesAPI._payload_team_id(team)
+            if team_id is None or team_id in self.injuries:
+                continue
+            team_injuries = []
+            for player in team.get('players', []):
+                if 'injuries' in player and player['injuries']:
+                    team_injuries.extend(player['injuries'])
+            
+            injured = []
+            for injury in team_injuries:
+                if 'player' not in injury:
+                    continue
+                player = injury['player']
+                player_name = player.get('full_name', 'Unknown Player')
+                injured.append(InjuredPlayer(
+                    player.get('id'), player_name, injury.get('status', 'Unknown'),
+                    categorize(player_name, team_injuries)
+                ))
+            
+            self.injuries[team_id] = team_injuries
+            self.players[team_id] = injured
+
 
 class SportradarInjuriesAPI:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, limiter: Optional[TokenBucket] = None,
+                 cache: Optional[InjuryCache] = None):
         self.api_key = api_key
         self.base_url = "https://api.sportradar.com/nba/trial/v8/en"
         self.headers = {
             "accept": "application/json"
         }
-        self.cache = {}  # Simple cache to avoid repeated API calls
-        self.last_request_time = 0
-        self.rate_limit_delay = 1  # 1 second between requests for trial API
+        self.cache = cache if cache is not None else InjuryCache()  # Shared on-disk cache, survives restarts
+        self.limiter = limiter or SPORTRADAR_LIMITER
+        
+        # One keep-alive connection pool for every request this client makes
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=SPORTRADAR_POOL_SIZE))
+        
+        # Concurrent callers of the same endpoint wait for one fetch
+        self._fetch_locks = {}
+        self._fetch_locks_guard = threading.Lock()
+        
+        # Parsed team-injury index per cache key, rebuilt only when the payload changes
+        self._injury_indexes = {}
         
         # Player impact categories based on typical NBA roles
         self.superstar_keywords = [
@@ -33,12 +115,30 @@ class SportradarInjuriesAPI:
             # For now, we'll use a threshold-based approach
         ]
     
+    def close(self):
+        """Release the pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _fetch_lock(self, key: str) -> threading.Lock:
+        """Per-cache-key lock, so one thread fetches while the others wait for the cache"""
+        with self._fetch_locks_guard:
+            return self._fetch_locks.setdefault(key, threading.Lock())
+    
     def _make_request(self, endpoint: str) -> Optional[Dict]:
-        """Make API request with rate limiting"""
-        # Rate limiting
-        current_time = time.time()
-        if current_time - self.last_request_time < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - (current_time - self.last_request_time))
+        """
+        Make API request through the pooled session
+        
+        Every attempt takes a token from the shared limiter (only the calling
+        thread waits). 429 / 5xx responses and connection errors are retried
+        with jittered exponential backoff, at most SPORTRADAR_ATTEMPTS times.
+        """
+        transport = get_replay_transport()
         
         # Add API key as query parameter (not header)
         if '?' in endpoint:
@@ -46,40 +146,52 @@ class SportradarInjuriesAPI:
         else:
             url = f"{self.base_url}{endpoint}?api_key={self.api_key}"
         
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            self.last_request_time = time.time()
-            
+        def request_endpoint():
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                print("⚠️  Rate limit exceeded. Waiting 60 seconds...")
-                time.sleep(60)
-                return self._make_request(endpoint)  # Retry once
-            else:
-                print(f"❌ API Error {response.status_code}: {response.text}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
+                return {'status_code': 200, 'json': response.json()}
+            return {'status_code': response.status_code, 'text': response.text}
+        
+        def attempt():
+            # Fixtures are keyed by endpoint only, so the API key is never recorded
+            response = transport.call('sportradar', {'endpoint': endpoint}, request_endpoint)
+            if response['status_code'] == 429 or response['status_code'] >= 500:
+                print(f"⚠️  API returned {response['status_code']}, backing off...")
+                raise SportradarRetryableError(f"HTTP {response['status_code']} for {endpoint}")
+            return response
+        
+        try:
+            # Replayed responses never reach the API, so they skip the limiter
+            response = call_with_retry(
+                attempt, attempts=SPORTRADAR_ATTEMPTS, base_delay=1.0, max_delay=16.0,
+                retry_on=(requests.exceptions.RequestException, OSError),
+                limiter=None if transport.active else self.limiter
+            )
+        except (requests.exceptions.RequestException, OSError, FixtureNotFoundError) as e:
             print(f"❌ Request failed: {e}")
             return None
+        
+        if response['status_code'] == 200:
+            return response['json']
+        print(f"❌ API Error {response['status_code']}: {response['text']}")
+        return None
     
     def get_current_injuries(self) -> Optional[Dict]:
         """Get current NBA injuries snapshot"""
         cache_key = "current_injuries"
         
-        # Check cache (valid for 5 minutes due to 300 second TTL)
-        if cache_key in self.cache:
-            cached_time, cached_data = self.cache[cache_key]
-            if time.time() - cached_time < 300:  # 5 minutes
+        with self._fetch_lock(cache_key):
+            # Check cache (valid for 5 minutes due to 300 second TTL)
+            cached_data = self.cache.get(cache_key)
+            if cached_data is not None:
                 return cached_data
-        
-        print("🏥 Fetching current NBA injuries...")
-        data = self._make_request("/league/injuries.json")
-        
-        if data:
-            self.cache[cache_key] = (time.time(), data)
-            return data
+            
+            print("🏥 Fetching current NBA injuries...")
+            data = self._make_request("/league/injuries.json")
+            
+            if data:
+                self.cache.put(cache_key, data, ttl=LIVE_INJURIES_TTL)
+                return data
         
         return None
     
@@ -97,19 +209,21 @@ class SportradarInjuriesAPI:
             
             cache_key = f"daily_injuries_{date}"
             
-            # Check cache
-            if cache_key in self.cache:
-                cached_time, cached_data = self.cache[cache_key]
-                if time.time() - cached_time < 3600:  # 1 hour for historical data
+            with self._fetch_lock(cache_key):
+                # Check cache
+                cached_data = self.cache.get(cache_key)
+                if cached_data is not None:
                     return cached_data
-            
-            print(f"🏥 Fetching injuries for {date}...")
-            endpoint = f"/league/{year}/{month}/{day}/daily_injuries.json"
-            data = self._make_request(endpoint)
-            
-            if data:
-                self.cache[cache_key] = (time.time(), data)
-                return data
+                
+                print(f"🏥 Fetching injuries for {date}...")
+                endpoint = f"/league/{year}/{month}/{day}/daily_injuries.json"
+                data = self._make_request(endpoint)
+                
+                if data:
+                    # Past reports are final, so they are kept for good; today's can still change
+                    is_past = date_obj.date() < datetime.now().date()
+                    self.cache.put(cache_key, data, ttl=None if is_past else LIVE_INJURIES_TTL)
+                    return data
             
             return None
             
@@ -117,95 +231,46 @@ class SportradarInjuriesAPI:
             print(f"❌ Invalid date format: {date}. Use YYYY-MM-DD")
             return None
     
+    def _injury_index(self, cache_key: str, payload: Optional[Dict]) -> Optional[TeamInjuryIndex]:
+        """TeamInjuryIndex for a payload, parsed once per payload object"""
+        if not payload or 'teams' not in payload:
+            return None
+        index = self._injury_indexes.get(cache_key)
+        if index is None or index.payload is not payload:
+            index = TeamInjuryIndex(payload, self.categorize_player_impact)
+            self._injury_indexes[cache_key] = index
+        return index
+    
+    def _team_injury_index_for_date(self, team_id: str, date: str) -> Optional[TeamInjuryIndex]:
+        """Index holding the team: the date's daily report, else the current snapshot"""
+        # Try Daily Injuries endpoint first (more accurate for historical dates)
+        index = self._injury_index(f"daily_injuries_{date}", self.get_daily_injuries(date))
+        if index is not None and team_id in index.injuries:
+            return index
+        
+        # Fallback to current injuries if daily injuries unavailable
+        index = self._injury_index("current_injuries", self.get_current_injuries())
+        if index is not None and team_id in index.injuries:
+            return index
+        return None
+    
     def get_team_injuries_for_date(self, team_name: str, date: str) -> List[Dict]:
         """
         Get injuries for a specific team on a specific date
         Now uses the proper Daily Injuries endpoint
         """
-        # Try Daily Injuries endpoint first (more accurate for historical dates)
-        daily_injuries = self.get_daily_injuries(date)
-        
-        if daily_injuries and 'teams' in daily_injuries:
-            for team in daily_injuries['teams']:
-                if self._team_name_matches(team.get('name', ''), team_name):
-                    team_players = team.get('players', [])
-                    injured_players = []
-                    
-                    for player in team_players:
-                        if 'injuries' in player and player['injuries']:
-                            injured_players.extend(player['injuries'])
-                    
-                    return injured_players
+        team_id = resolve_team(team_name)
+        if team_id is None:
+            return []
         
-        # Fallback to current injuries if daily injuries unavailable
-        current_injuries = self.get_current_injuries()
-        
-        if current_injuries and 'teams' in current_injuries:
-            for team in current_injuries['teams']:
-                if self._team_name_matches(team.get('name', ''), team_name):
-                    team_players = team.get('players', [])
-                    injured_players = []
-                    
-                    for player in team_players:
-                        if 'injuries' in player and player['injuries']:
-                            injured_players.extend(player['injuries'])
-                    
-                    return injured_players
-        
-        return []
+        index = self._team_injury_index_for_date(team_id, date)
+        return index.injuries[team_id] if index is not None else []
     
-    def _team_name_matches(self, api_team_name: str, search_team_name: str) -> bool:
-        """Check if team names match (flexible matching)"""
-        api_name_lower = api_team_name.lower()
-        search_name_lower = search_team_name.lower()
-        
-
-        if not api_team_name or not search_team_name:
-            return False
-            
-        api_name_lower = api_team_name.lower()
-        search_name_lower = search_team_name.lower()
-        
-        # Common team name mappings
-        team_mappings = {
-            'warriors': ['golden state', 'gsw', 'golden state warriors'],
-            'lakers': ['los angeles lakers', 'lal', 'la lakers'],
-            'celtics': ['boston', 'bos', 'boston celtics'],
-            'heat': ['miami', 'mia', 'miami heat'],
-            'nuggets': ['denver', 'den', 'denver nuggets'],
-            'bucks': ['milwaukee', 'mil', 'milwaukee bucks'],
-            'suns': ['phoenix', 'phx', 'phoenix suns'],
-            '76ers': ['philadelphia', 'sixers', 'phi', 'philadelphia 76ers'],
-            'clippers': ['la clippers', 'lac', 'los angeles clippers'],
-            'nets': ['brooklyn', 'bkn', 'brooklyn nets'],
-            'knicks': ['new york', 'nyk', 'new york knicks'],
-            'bulls': ['chicago', 'chi', 'chicago bulls'],
-            'cavaliers': ['cleveland', 'cle', 'cleveland cavaliers'],
-            'hawks': ['atlanta', 'atl', 'atlanta hawks'],
-            'hornets': ['charlotte', 'cha', 'charlotte hornets'],
-            'pistons': ['detroit', 'det', 'detroit pistons'],
-            'pacers': ['indiana', 'ind', 'indiana pacers'],
-            'magic': ['orlando', 'orl', 'orlando magic'],
-            'wizards': ['washington', 'was', 'washington wizards'],
-            'raptors': ['toronto', 'tor', 'toronto raptors'],
-            'timberwolves': ['minnesota', 'min', 'minnesota timberwolves'],
-            'thunder': ['oklahoma city', 'okc', 'oklahoma city thunder'],
-            'trail blazers': ['portland', 'por', 'portland trail blazers', 'blazers'],
-            'jazz': ['utah', 'uta', 'utah jazz'],
-            'kings': ['sacramento', 'sac', 'sacramento kings'],
-            'mavericks': ['dallas', 'dal', 'dallas mavericks'],
-            'rockets': ['houston', 'hou', 'houston rockets'],
-            'grizzlies': ['memphis', 'mem', 'memphis grizzlies'],
-            'pelicans': ['new orleans', 'nop', 'new orleans pelicans'],
-            'spurs': ['san antonio', 'sas', 'san antonio spurs']
-        }
-        
-        for key, variations in team_mappings.items():
-            if (key in search_name_lower and any(var in api_name_lower for var in variations)) or \
-               (key in api_name_lower and any(var in search_name_lower for var in variations)):
-                return True
-        
-        return False
+    @staticmethod
+    def _payload_team_id(team: Dict) -> Optional[str]:
+        """Canonical team ID of a team entry in an injuries payload"""
+        return (resolve_team(team.get('name', '')) or resolve_team(team.get('alias', ''))
+                or resolve_team(f"{team.get('market', '')} {team.get('name', '')}"))
     
     def categorize_player_impact(self, player_name: str, team_injuries: List[Dict] = None) -> str:
         """
@@ -249,26 +314,28 @@ class SportradarInjuriesAPI:
         Calculate total stat boost from missing players
         Returns: (boost_percentage, injured_player_details)
         """
-        team_injuries = self.get_team_injuries_for_date(team_name, date)
+        team_id = resolve_team(team_name)
+        if team_id is None:
+            return 0.0, []
         
-        if not team_injuries:
+        index = self._team_injury_index_for_date(team_id, date)
+        if index is None:
             return 0.0, []
         
+        # Memoized per payload, so a slate only computes each team once per date
+        if team_id not in index.boosts:
+            index.boosts[team_id] = self._boost_from_players(index.players[team_id])
+        total_boost, injury_details = index.boosts[team_id]
+        return total_boost, list(injury_details)
+    
+    def _boost_from_players(self, injured_players: List[InjuredPlayer]) -> Tuple[float, List[str]]:
+        """Boost and detail lines for one team's injured players"""
         total_boost = 0.0
         injury_details = []
         
-        for injury in team_injuries:
-            if 'player' not in injury:
-                continue
-                
-            player = injury['player']
-            player_name = player.get('full_name', 'Unknown Player')
-            injury_status = injury.get('status', 'Unknown')
-            
+        for _, player_name, injury_status, impact_level in injured_players:
             # Only count players who are definitively OUT
             if injury_status.upper() in ['OUT', 'INACTIVE']:
-                impact_level = self.categorize_player_impact(player_name, team_injuries)
-                
                 if impact_level == "superstar":
                     boost = 0.05  # 5%
                     injury_details.append(f"{player_name} - OUT (Superstar impact: +5.0%)")
@@ -283,8 +350,6 @@ class SportradarInjuriesAPI:
             
             elif injury_status.upper() in ['QUESTIONABLE', 'DOUBTFUL']:
                 # Partial impact for questionable players
-                impact_level = self.categorize_player_impact(player_name, team_injuries)
-                
                 if impact_level == "superstar":
                     boost = 0.02  # 2% for questionable superstar
                     injury_details.append(f"{player_name} - Questionable (Superstar impact: +2.0%)")
@@ -306,10 +371,32 @@ class SportradarInjuriesAPI:
         """
         print(f"🏥 Analyzing injury context for {date}...")
         
-        # Get injury boosts for both teams
-        player_team_boost, player_team_injuries = self.calculate_injury_boost(player_team, date)
-        opponent_team_boost, opponent_team_injuries = self.calculate_injury_boost(opponent_team, date)
+        # Get injury boosts for both teams concurrently (a shared snapshot is fetched once)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            player_team_future = executor.submit(self.calculate_injury_boost, player_team, date)
+            opponent_team_future = executor.submit(self.calculate_injury_boost, opponent_team, date)
+            player_team_boost, player_team_injuries = player_team_future.result()
+            opponent_team_boost, opponent_team_injuries = opponent_team_future.result()
         
+        return self._build_injury_context(player_team_boost, player_team_injuries,
+                                          opponent_team_boost, opponent_team_injuries)
+    
+    async def get_injury_context_for_game_async(self, player_team: str, opponent_team: str, date: str) -> Dict:
+        """get_injury_context_for_game for asyncio code (both teams fetched concurrently)"""
+        print(f"🏥 Analyzing injury context for {date}...")
+        
+        (player_team_boost, player_team_injuries), (opponent_team_boost, opponent_team_injuries) = \
+            await asyncio.gather(
+                asyncio.to_thread(self.calculate_injury_boost, player_team, date),
+                asyncio.to_thread(self.calculate_injury_boost, opponent_team, date)
+            )
+        
+        return self._build_injury_context(player_team_boost, player_team_injuries,
+                                          opponent_team_boost, opponent_team_injuries)
+    
+    def _build_injury_context(self, player_team_boost: float, player_team_injuries: List[str],
+                              opponent_team_boost: float, opponent_team_injuries: List[str]) -> Dict:
+        """Combine both teams' boosts into the market adjustment context"""
         # Player benefits from their own team's injuries (more usage)
         # Player may benefit slightly from opponent injuries (easier defense)
         total_boost = player_team_boost + (opponent_team_boost * 0.1)  # 10% of opponent injuries
@@ -1,6 +1,7 @@
 import numpy as np
 from scipy.stats import norm
 import math
+from Data.player_games import PlayerGames, average_stats
 
 class SportsMarket:
     def __init__(self):
@@ -170,7 +171,8 @@ class SportsMarket:
                         round(game_ts, 3)
                     ))
                 
-                # Store player data
+                # Store player data (games as a (games, 7) matrix)
+                games_2024 = PlayerGames.from_tuples(games_2024)
                 players[player_name] = {
                     "games": games_2024,
                     "season_avg_2023": (
@@ -182,7 +184,7 @@ class SportsMarket:
                         round(threepm_2023, 1),
                         round(ts_2023, 3)
                     ),
-                    "season_avg_2024": self._calculate_season_averages(games_2024)
+                    "season_avg_2024": games_2024.season_averages()
                 }
                 
                 player_id += 1
@@ -190,17 +192,8 @@ class SportsMarket:
         return players
     
     def _calculate_season_averages(self, games):
-        """Calculate season averages from game data"""
-        if not games:
-            return (0, 0, 0, 0, 0, 0, 0)
-        
-        totals = [0] * 7
-        for game in games:
-            for i in range(7):
-                totals[i] += game[i]
-        
-        n_games = len(games)
-        return tuple(total / n_games for total in totals)
+        """Calculate season averages from game data (PlayerGames or list of tuples)"""
+        return average_stats(games)
     
     def get_player_data(self, player_name):
         """Get player data by name"""
@@ -217,20 +210,32 @@ class SportsMarket:
             return []
         return player_data["games"][-n:]
     
-    def calculate_last_n_averages(self, games, n):
-        """Calculate averages for last n games"""
+    def calculate_last_n_averages(self, games, n, before_date=None):
+        """
+        Calculate averages for last n games
+        
+        PlayerGames answer from prefix sums, optionally counting only games
+        before before_date (e.g. the 4 / 12 game recent_avg for a timeframe).
+        """
+        if isinstance(games, PlayerGames):
+            return games.last_n_averages(n, before=before_date)
+        
         if len(games) < n:
             return self._calculate_season_averages(games)
-        
-        last_n = games[-n:]
-        return self._calculate_season_averages(last_n)
+        return self._calculate_season_averages(games[-n:])
+    
+    def calculate_last_n_std(self, games, n, before_date=None):
+        """Per-stat standard deviation over the last n games (before before_date)"""
+        if not isinstance(games, PlayerGames):
+            games = PlayerGames.from_tuples(list(games))
+        return games.last_n_std(n, before=before_date)
     
     def calculate_random_recent_averages(self, games, n, pool_size=None):
         """
         Calculate averages from randomly sampled recent games
         
         Args:
-            games: list of game tuples
+            games: PlayerGames or list of game tuples
             n: number of games to sample
             pool_size: size of recent games pool to sample from (defaults to 2*n)
         
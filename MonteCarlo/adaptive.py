@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Adaptive Monte Carlo simulation count
+- Draws in batches and stops once every stat's projection has converged
+- Tracks the standard error of each stat's mean and of chosen percentiles
+- Percentile standard errors use the distribution-free order-statistic
+  interval, so integer-valued stats are handled without density estimates
+"""
+
+import numpy as np
+
+# Percentiles whose standard error must also meet the tolerance
+DEFAULT_TRACKED_PERCENTILES = (10, 50, 90)
+
+# z for the 95% order-statistic interval used to derive percentile SEs
+_Z_95 = 1.96
+
+
+def mean_standard_error(values):
+    """Standard error of the sample mean"""
+    return np.std(values) / np.sqrt(len(values))
+
+
+def percentile_standard_error(values, q):
+    """
+    Standard error of the q-th percentile from the order-statistic interval
+
+    The 95% interval for the p-quantile spans ranks n*p +/- z*sqrt(n*p*(1-p));
+    its width in value space divided by 2z approximates the standard error.
+    """
+    n = len(values)
+    p = q / 100.0
+    half_width = _Z_95 * np.sqrt(n * p * (1 - p))
+    lo = int(max(0, np.floor(n * p - half_width)))
+    hi = int(min(n - 1, np.ceil(n * p + half_width)))
+    bounds = np.partition(values, [lo, hi])
+    return (bounds[hi] - bounds[lo]) / (2 * _Z_95)
+
+
+def has_converged(draws, tolerance, percentiles=DEFAULT_TRACKED_PERCENTILES):
+    """
+    True when every stat's mean and tracked percentiles have a standard error
+    of at most tolerance * |mean| (a relative tolerance per stat)
+
+    Integer stats cannot resolve a percentile finer than one unit, so for them
+    an interval spanning two adjacent values also counts as converged.
+    """
+    for values in draws.values():
+        limit = tolerance * abs(np.mean(values))
+        if mean_standard_error(values) > limit:
+            return False
+
+        percentile_limit = limit
+        if np.issubdtype(values.dtype, np.integer):
+            percentile_limit = max(limit, 1 / (2 * _Z_95))
+        for q in percentiles:
+            if percentile_standard_error(values, q) > percentile_limit:
+                return False
+    return True
+
+
+def run_adaptive_draws(draw_batch, tolerance=0.01, max_simulations=100000,
+                       batch_size=1000, min_simulations=2000,
+                       percentiles=DEFAULT_TRACKED_PERCENTILES):
+    """
+    Draw in batches until the projections converge or the cap is reached
+
+    Args:
+        draw_batch: callable(n) -> dict of stat -> array of n draws
+        tolerance: float, max standard error as a fraction of each stat's mean
+        max_simulations: int, upper cap on total draws
+        batch_size: int, draws per batch
+        min_simulations: int, draws taken before convergence is first checked
+        percentiles: percentiles whose standard errors are tracked
+
+    Returns:
+        (draws, n_used, converged) - draws is a dict of stat -> array of n_used
+    """
+    if max_simulations < 1:
+        raise ValueError(f"max_simulations must be at least 1, got {max_simulations}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    batches = []
+    n_used = 0
+    converged = False
+
+    while n_used < max_simulations:
+        n = min(batch_size, max_simulations - n_used)
+        batches.append(draw_batch(n))
+        n_used += n
+
+        if n_used < min_simulations:
+            continue
+
+        draws = {stat: np.concatenate([batch[stat] for batch in batches]) for stat in batches[0]}
+        batches = [draws]
+        if has_converged(draws, tolerance, percentiles):
+            converged = True
+            break
+
+    draws = {stat: np.concatenate([batch[stat] for batch in batches]) for stat in batches[0]}
+    return draws, n_used, converged
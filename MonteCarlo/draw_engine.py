@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Vectorized Monte Carlo draw engine
+- Draws every simulation for a stat as whole NumPy arrays (no per-iteration loop)
+- Same sampling model as the original loop: resample a historical game,
+  add tighter relative noise, apply the contextual multiplier
+- Games are resampled by weight from a WeightedTrainingSet (no list replication)
+- Joint mode resamples whole game rows so correlations between the 7
+  market stats are kept, in a single vectorized pass
+- Stacked mode draws a whole slate of training sets in one computation
+- Optional variance-reduction sampling (antithetic, stratified, Sobol)
+  replaces the i.i.d. picks and noise (see variance_reduction.py)
+- Opponent adjustments are applied once to the full arrays by the simulator
+"""
+
+import numpy as np
+
+try:
+    from .variance_reduction import normal_scores, sorted_inverse_cdf, uniform_matrix
+except ImportError:
+    from variance_reduction import normal_scores, sorted_inverse_cdf, uniform_matrix
+
+# Relative noise around each resampled game (mirrors enhanced_config.json)
+ENHANCED_VARIANCE = {
+    'PTS': 0.10,  # Reduced from 0.15
+    'REB': 0.15,  # Reduced from 0.25
+    'AST': 0.15   # Reduced from 0.25
+}
+
+# Relative noise for the joint 7-stat simulation
+JOINT_VARIANCE = dict(ENHANCED_VARIANCE, **{
+    'TO': 0.15,
+    'STOCKS': 0.15,
+    '3PM': 0.15,
+    'TS%': 0.05
+})
+
+# Rate stats stay fractional and are not scaled by the contextual adjustment
+RATE_STATS = ('TS%',)
+
+# Percentile bands reported for every projection
+PERCENTILE_LEVELS = {
+    '5th': 5,
+    '10th': 10,
+    '25th': 25,
+    '50th': 50,
+    '75th': 75,
+    '90th': 90,
+    '95th': 95
+}
+
+
+def draw_stat(pool, probabilities, n_simulations, variance_scale, total_adjustment,
+              rng=None, uniforms=None):
+    """
+    Draw n_simulations integer stat lines for a single stat
+
+    Args:
+        pool: array of positive historical values to resample from
+        probabilities: sampling probability of each pool entry
+        n_simulations: int, number of draws
+        variance_scale: float, noise std as a fraction of the resampled value
+        total_adjustment: float, contextual adjustment (e.g. 0.02 for +2%)
+        rng: numpy Generator or the np.random module (default)
+        uniforms: optional (n_simulations, 2) uniforms driving the game pick
+            and the noise (variance-reduction modes); i.i.d. draws when None
+
+    Returns:
+        int64 array of length n_simulations
+    """
+    if rng is None:
+        rng = np.random
+
+    if len(pool) == 0:
+        # No positive games to resample from - project zero instead of failing
+        return np.zeros(n_simulations, dtype=np.int64)
+
+    if uniforms is None:
+        samples = rng.choice(pool, size=n_simulations, p=probabilities)
+        noisy = rng.normal(samples, samples * variance_scale)
+    else:
+        samples = pool[sorted_inverse_cdf(pool, probabilities, uniforms[:, 0])]
+        noisy = samples + samples * variance_scale * normal_scores(uniforms[:, 1])
+
+    return _truncate_counts(noisy, 1 + total_adjustment)
+
+
+def _truncate_counts(noisy, multiplier):
+    """int() truncation of non-negative values, then the contextual multiplier (truncated again)"""
+    stats = np.maximum(noisy, 0).astype(np.int64)
+    return np.maximum(stats * multiplier, 0).astype(np.int64)
+
+
+def run_vectorized_draws(training_set, n_simulations, total_adjustment,
+                         variance=None, rng=None, sampling='iid'):
+    """
+    Run the full set of draws for every stat in the training set
+
+    Args:
+        training_set: WeightedTrainingSet of historical games
+        n_simulations: int, number of simulations
+        total_adjustment: float, contextual adjustment applied to every draw
+        variance: optional dict of stat -> relative noise (defaults to ENHANCED_VARIANCE)
+        rng: numpy Generator or the np.random module (default)
+        sampling: 'iid' (default), 'antithetic', 'stratified' or 'sobol'
+
+    Returns:
+        dict of stat -> int64 array of length n_simulations
+    """
+    variance = variance or ENHANCED_VARIANCE
+
+    uniforms = None
+    if sampling != 'iid':
+        # Two uniform columns (game pick, noise) per stat
+        uniforms = uniform_matrix(sampling, n_simulations, 2 * len(training_set.values), rng)
+
+    draws = {}
+    for i, stat in enumerate(training_set.values):
+        pool, probabilities = training_set.sampling_distribution(stat)
+        draws[stat] = draw_stat(
+            pool, probabilities, n_simulations,
+            variance.get(stat, 0.15), total_adjustment, rng,
+            uniforms=None if uniforms is None else uniforms[:, 2 * i:2 * i + 2]
+        )
+    return draws
+
+
+def run_joint_draws(training_set, n_simulations, total_adjustment,
+                    variance=None, rng=None, sampling='iid'):
+    """
+    Draw every stat in the training set jointly by resampling whole game rows
+
+    Each simulation picks one historical game (by weight) for all stats at
+    once, then adds per-stat relative noise, so e.g. high-scoring nights keep
+    their higher 3PM and TS% instead of being paired with random games.
+
+    Args:
+        training_set: WeightedTrainingSet (typically built with MARKET_STATS)
+        n_simulations: int, number of simulations
+        total_adjustment: float, contextual adjustment for counting stats
+        variance: optional dict of stat -> relative noise (defaults to JOINT_VARIANCE)
+        rng: numpy Generator or the np.random module (default)
+        sampling: 'iid' (default), 'antithetic', 'stratified' or 'sobol';
+            non-i.i.d. modes order games by the first stat (PTS) for the pick
+
+    Returns:
+        dict of stat -> array of length n_simulations (int64 for counting
+        stats, float for rate stats)
+    """
+    if rng is None:
+        rng = np.random
+    variance = variance or JOINT_VARIANCE
+
+    stats = list(training_set.values)
+    rows, probabilities = training_set.joint_sampling_distribution()
+    if len(rows) == 0:
+        return {stat: np.zeros(n_simulations, dtype=float if stat in RATE_STATS else np.int64)
+                for stat in stats}
+
+    matrix = training_set.stat_matrix()
+    scales = np.array([variance.get(stat, 0.15) for stat in stats])
+    if sampling == 'iid':
+        picks = rows[rng.choice(len(rows), size=n_simulations, p=probabilities)]
+        samples = matrix[picks]
+        noisy = np.maximum(rng.normal(samples, samples * scales), 0)
+    else:
+        # One uniform column for the game pick, one per stat for the noise
+        uniforms = uniform_matrix(sampling, n_simulations, 1 + len(stats), rng)
+        picks = rows[sorted_inverse_cdf(matrix[rows, 0], probabilities, uniforms[:, 0])]
+        samples = matrix[picks]
+        noisy = np.maximum(samples + samples * scales * normal_scores(uniforms[:, 1:]), 0)
+
+    # Counting stats are truncated exactly like draw_stat, so a stat's joint
+    # and per-stat projections agree
+    draws = {}
+    for col, stat in enumerate(stats):
+        if stat in RATE_STATS:
+            draws[stat] = noisy[:, col]
+        else:
+            draws[stat] = _truncate_counts(noisy[:, col], 1 + total_adjustment)
+    return draws
+
+
+def run_stacked_joint_draws(training_sets, n_simulations, total_adjustments,
+                            variance=None, rng=None):
+    """
+    Joint draws for many training sets as one stacked array computation
+
+    All sets' game rows are concatenated and each set's cumulative sampling
+    weights are shifted into its own unit interval [r, r + 1), so a single
+    searchsorted call resamples games for every request at once.
+
+    Args:
+        training_sets: list of WeightedTrainingSet sharing the same stats
+        n_simulations: int, draws per training set
+        total_adjustments: sequence of contextual adjustments, one per set
+        variance: optional dict of stat -> relative noise (defaults to JOINT_VARIANCE)
+        rng: numpy Generator or the np.random module (default)
+
+    Returns:
+        dict of stat -> array of shape (len(training_sets), n_simulations)
+    """
+    if rng is None:
+        rng = np.random
+    variance = variance or JOINT_VARIANCE
+
+    stats = list(training_sets[0].values)
+    matrices = []
+    cdfs = []
+    for r, training_set in enumerate(training_sets):
+        rows, probabilities = training_set.joint_sampling_distribution()
+        if len(rows) == 0:
+            # Nothing to resample - a single all-zero game
+            matrices.append(np.zeros((1, len(stats))))
+            cdfs.append(np.array([r + 1.0]))
+            continue
+        cdf = np.cumsum(probabilities)
+        cdf[-1] = 1.0
+        matrices.append(training_set.stat_matrix()[rows])
+        cdfs.append(cdf + r)
+
+    all_rows = np.vstack(matrices)
+    all_cdf = np.concatenate(cdfs)
+
+    n_sets = len(training_sets)
+    u = rng.random((n_sets, n_simulations)) + np.arange(n_sets)[:, None]
+    picks = np.minimum(np.searchsorted(all_cdf, u, side='right'), len(all_rows) - 1)
+
+    samples = all_rows[picks]
+    scales = np.array([variance.get(stat, 0.15) for stat in stats])
+    noisy = np.maximum(rng.normal(samples, samples * scales), 0)
+    multipliers = 1 + np.asarray(total_adjustments, dtype=float)[:, None]
+
+    draws = {}
+    for col, stat in enumerate(stats):
+        if stat in RATE_STATS:
+            draws[stat] = noisy[:, :, col]
+        else:
+            draws[stat] = _truncate_counts(noisy[:, :, col], multipliers)
+    return draws
+
+
+def summarize_draws(draws):
+    """
+    Mean, std and percentile bands along the last axis of a draw array
+
+    Returns:
+        dict with the calculate_enhanced_percentiles keys ('5th' ... 'mean', 'std'),
+        each an array with the draw axis reduced away
+    """
+    levels = np.percentile(draws, list(PERCENTILE_LEVELS.values()), axis=-1)
+    summary = {key: levels[i] for i, key in enumerate(PERCENTILE_LEVELS)}
+    summary['mean'] = np.mean(draws, axis=-1)
+    summary['std'] = np.std(draws, axis=-1)
+    return summary
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk game-log store
+- SQLite file keyed by (player_id, season), one row per game, so logs
+  survive the process and are shared by every simulator and bridge
+- Columnar: every nba_api PlayerGameLog column is a typed SQLite column, so
+  loads are one query straight into a DataFrame; unknown columns ride along
+  in a small JSON side column
+- Freshness metadata per (player_id, season): when it was fetched, the last
+  game date stored and whether the season is complete
+- Completed seasons are never refetched; the current season is refreshed
+  after max_age_hours by appending only games after the last stored date
+- Location: SPORTS_MARKET_GAME_LOG_STORE, else ~/.cache/sports_market/game_logs.sqlite
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+DEFAULT_STORE_PATH = os.environ.get(
+    'SPORTS_MARKET_GAME_LOG_STORE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'sports_market', 'game_logs.sqlite')
+)
+
+# Current-season logs older than this are topped up from nba_api
+DEFAULT_MAX_AGE_HOURS = 12
+
+# nba_api date format for date_from_nullable
+NBA_API_DATE_FORMAT = '%m/%d/%Y'
+
+# nba_api PlayerGameLog columns stored as typed SQLite columns (Player_ID,
+# Game_ID and GAME_DATE are the player_id / game_id / game_date keys)
+LOG_COLUMNS = (
+    ('SEASON_ID', 'TEXT'),
+    ('MATCHUP', 'TEXT'),
+    ('WL', 'TEXT'),
+    ('MIN', 'NUMERIC'),  # minutes, or 'MM:SS' from some endpoints
+    ('FGM', 'INTEGER'),
+    ('FGA', 'INTEGER'),
+    ('FG_PCT', 'REAL'),
+    ('FG3M', 'INTEGER'),
+    ('FG3A', 'INTEGER'),
+    ('FG3_PCT', 'REAL'),
+    ('FTM', 'INTEGER'),
+    ('FTA', 'INTEGER'),
+    ('FT_PCT', 'REAL'),
+    ('OREB', 'INTEGER'),
+    ('DREB', 'INTEGER'),
+    ('REB', 'INTEGER'),
+    ('AST', 'INTEGER'),
+    ('STL', 'INTEGER'),
+    ('BLK', 'INTEGER'),
+    ('TOV', 'INTEGER'),
+    ('PF', 'INTEGER'),
+    ('PTS', 'INTEGER'),
+    ('PLUS_MINUS', 'INTEGER'),
+    ('TS_PCT', 'REAL'),
+    ('VIDEO_AVAILABLE', 'INTEGER')
+)
+_LOG_COLUMN_NAMES = tuple(name for name, _ in LOG_COLUMNS)
+_KEY_COLUMNS = ('Player_ID', 'Game_ID', 'GAME_DATE')
+
+# Bumped whenever the game_logs layout changes (PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+# Fetch failures that fall back to the stored (possibly stale) logs
+FETCH_ERRORS = (OSError, ValueError)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_logs (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    game_date TEXT NOT NULL,
+    %s,
+    extra_json TEXT,
+    PRIMARY KEY (player_id, season, game_id)
+);
+CREATE TABLE IF NOT EXISTS log_meta (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_game_date TEXT,
+    complete INTEGER NOT NULL,
+    PRIMARY KEY (player_id, season)
+);
+""" % ',\n    '.join(f'{name} {sql_type}' for name, sql_type in LOG_COLUMNS)
+
+_INSERT_SQL = (
+    'INSERT OR REPLACE INTO game_logs (player_id, season, game_id, game_date, %s, extra_json) '
+    'VALUES (%s)' % (', '.join(_LOG_COLUMN_NAMES), ', '.join('?' * (len(LOG_COLUMNS) + 5)))
+)
+
+
+def game_log_select(alias='g'):
+    """SELECT list producing nba_api-named columns from game_logs rows"""
+    return ', '.join(
+        [f'{alias}.player_id AS Player_ID', f'{alias}.game_id AS Game_ID', f'{alias}.game_date AS GAME_DATE']
+        + [f'{alias}.{name}' for name in _LOG_COLUMN_NAMES]
+        + [f'{alias}.extra_json']
+    )
+
+
+def read_game_logs(conn, sql, params=()):
+    """
+    DataFrame from a query selecting game_log_select() columns
+
+    Columns that are NULL in every row (absent from the source logs) are
+    dropped, and extra_json columns are spread back out.
+    """
+    game_logs = pd.read_sql_query(sql, conn, params=params)
+    extras = game_logs.pop('extra_json')
+    if extras.notna().any():
+        extra_frame = pd.DataFrame.from_records(
+            [json.loads(extra) if extra else {} for extra in extras], index=game_logs.index
+        )
+        game_logs = pd.concat([game_logs, extra_frame], axis=1)
+    return game_logs.dropna(axis=1, how='all')
+
+
+def _game_log_records(player_id, season, game_logs):
+    """game_logs rows for a frame of nba_api logs, one tuple per game"""
+    game_logs = game_logs.assign(
+        GAME_DATE=pd.to_datetime(game_logs['GAME_DATE']).dt.strftime('%Y-%m-%d')
+    )
+    columns = game_logs.reindex(columns=list(_LOG_COLUMN_NAMES))
+    typed = columns.astype(object).where(pd.notna(columns), None).values.tolist()
+
+    extra_names = [name for name in game_logs.columns
+                   if name not in _LOG_COLUMN_NAMES and name not in _KEY_COLUMNS]
+    if extra_names:
+        # to_json converts numpy scalars and NaN to plain JSON values
+        extras = [json.dumps(row) for row in json.loads(game_logs[extra_names].to_json(orient='records'))]
+    else:
+        extras = [None] * len(game_logs)
+
+    game_ids = game_logs['Game_ID'] if 'Game_ID' in game_logs else game_logs.get('GAME_ID')
+    records = []
+    for index, game_date in enumerate(game_logs['GAME_DATE']):
+        game_id = game_ids.iloc[index] if game_ids is not None else None
+        game_id = str(game_id) if game_id is not None and pd.notna(game_id) else f"{game_date}_{index}"
+        records.append((int(player_id), season, game_id, game_date, *typed[index], extras[index]))
+    return records
+
+
+def season_is_complete(season, today=None):
+    """True once a 'YYYY-YY' regular season is over (after June of its end year)"""
+    today = today or datetime.now()
+    end_year = int(season[:4]) + 1
+    return today >= datetime(end_year, 7, 1)
+
+
+class GameLogStore:
+    """Read-through SQLite store of nba_api player game logs"""
+
+    def __init__(self, path=DEFAULT_STORE_PATH, max_age_hours=DEFAULT_MAX_AGE_HOURS):
+        self.path = path
+        self.max_age_seconds = max_age_hours * 3600
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            self._migrate(conn)
+            conn.executescript(_SCHEMA)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    @classmethod
+    def temporary(cls, max_age_hours=DEFAULT_MAX_AGE_HOURS):
+        """Empty store in a private temporary directory, removed along with the store"""
+        tmp_dir = tempfile.TemporaryDirectory(prefix='sports_market_game_logs_')
+        store = cls(os.path.join(tmp_dir.name, 'game_logs.sqlite'), max_age_hours)
+        store._tmp_dir = tmp_dir
+        return store
+
+    @contextmanager
+    def _connect(self):
+        """New connection per operation, so threads and processes can share the file"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _migrate(self, conn):
+        """Move version-1 stores (one JSON blob per game) to the typed columns"""
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(game_logs)')]
+        if 'row_json' not in columns:
+            return
+        rows = conn.execute('SELECT player_id, season, game_id, row_json FROM game_logs').fetchall()
+        conn.execute('DROP TABLE game_logs')
+        conn.executescript(_SCHEMA)
+        records = []
+        for player_id, season, game_id, row_json in rows:
+            record = _game_log_records(player_id, season, pd.DataFrame([json.loads(row_json)]))[0]
+            records.append(record[:2] + (game_id,) + record[3:])
+        conn.executemany(_INSERT_SQL, records)
+
+    def freshness(self, player_id, season):
+        """
+        Freshness metadata for (player_id, season)
+
+        Returns:
+            dict with 'fetched_at' (epoch seconds), 'last_game_date' and
+            'complete', or None if nothing is stored
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT fetched_at, last_game_date, complete FROM log_meta WHERE player_id = ? AND season = ?',
+                (int(player_id), season)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'fetched_at': row[0], 'last_game_date': row[1], 'complete': bool(row[2])}
+
+    def is_fresh(self, player_id, season):
+        """True when the stored logs can be used without asking nba_api"""
+        return self._meta_is_fresh(self.freshness(player_id, season))
+
+    def _meta_is_fresh(self, meta):
+        """Freshness rule: complete seasons never expire, others after max_age"""
+        if meta is None:
+            return False
+        return meta['complete'] or time.time() - meta['fetched_at'] < self.max_age_seconds
+
+    def load(self, player_id, season):
+        """Stored game logs sorted by GAME_DATE (parsed), or None if none are stored"""
+        with self._connect() as conn:
+            game_logs = read_game_logs(
+                conn,
+                f'SELECT {game_log_select()} FROM game_logs g '
+                'WHERE g.player_id = ? AND g.season = ? ORDER BY g.game_date',
+                (int(player_id), season)
+            )
+        if len(game_logs) == 0:
+            return None
+        game_logs['GAME_DATE'] = pd.to_datetime(game_logs['GAME_DATE'])
+        return game_logs.sort_values('GAME_DATE').reset_index(drop=True)
+
+    def append(self, player_id, season, game_logs):
+        """
+        Upsert games into the store and refresh the freshness metadata
+
+        An empty or None frame still records the fetch, so an up-to-date
+        season is not asked for again until it goes stale.
+        """
+        records = []
+        if game_logs is not None and len(game_logs) > 0:
+            records = _game_log_records(player_id, season, game_logs)
+
+        with self._connect() as conn:
+            conn.executemany(_INSERT_SQL, records)
+            last_game_date = conn.execute(
+                'SELECT MAX(game_date) FROM game_logs WHERE player_id = ? AND season = ?',
+                (int(player_id), season)
+            ).fetchone()[0]
+            conn.execute(
+                'INSERT OR REPLACE INTO log_meta (player_id, season, fetched_at, last_game_date, complete) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (int(player_id), season, time.time(), last_game_date, int(season_is_complete(season)))
+            )
+
+    def read_through(self, player_id, season, fetch):
+        """
+        Game logs for (player_id, season), fetching from the source only when stale
+
+        Args:
+            player_id: int, nba_api player id
+            season: str, e.g. '2023-24'
+            fetch: callable(date_from) -> DataFrame or None; date_from is None
+                for a full season or an nba_api 'MM/DD/YYYY' string to fetch
+                only games on or after that date
+
+        Returns:
+            DataFrame sorted by GAME_DATE, or None if no games are available
+        """
+        meta = self.freshness(player_id, season)
+        if self._meta_is_fresh(meta):
+            return self.load(player_id, season)
+
+        date_from = None
+        if meta is not None and meta['last_game_date']:
+            next_day = datetime.strptime(meta['last_game_date'], '%Y-%m-%d') + timedelta(days=1)
+            date_from = next_day.strftime(NBA_API_DATE_FORMAT)
+
+        try:
+            new_logs = fetch(date_from)
+        except FETCH_ERRORS as e:
+            # Source unavailable - serve whatever is stored (possibly stale)
+            print(f"⚠️  Could not refresh game logs for player {player_id} ({season}): {e}; "
+                  f"using stored logs")
+            return self.load(player_id, season)
+
+        if new_logs is None:
+            return self.load(player_id, season)
+
+        self.append(player_id, season, new_logs)
+        return self.load(player_id, season)
+
+    def clear(self, player_id=None, season=None):
+        """Drop stored logs (all of them, one player's, or one player-season)"""
+        where, params = '', ()
+        if player_id is not None:
+            where, params = ' WHERE player_id = ?', (int(player_id),)
+            if season is not None:
+                where, params = ' WHERE player_id = ? AND season = ?', (int(player_id), season)
+        with self._connect() as conn:
+            conn.execute('DELETE FROM game_logs' + where, params)
+            conn.execute('DELETE FROM log_meta' + where, params)
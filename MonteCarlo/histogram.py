@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Integer-histogram summaries of simulated stat lines
+- Counting stats are small non-negative integers, so one np.bincount holds
+  the whole distribution in O(max_value) memory
+- Every percentile, the mean and the std come from the counts and their
+  cumulative sum, with no sorting or partitioning of the draws
+- Percentiles match np.percentile's default (linear) interpolation exactly
+- Histograms can be updated batch by batch and merged across shards
+"""
+
+import numpy as np
+
+try:
+    from .draw_engine import PERCENTILE_LEVELS, summarize_draws
+except ImportError:
+    from draw_engine import PERCENTILE_LEVELS, summarize_draws
+
+# Largest value the histogram path accepts before falling back to np.percentile
+MAX_HISTOGRAM_VALUE = 1_000_000
+
+
+def is_histogram_compatible(values):
+    """True when values are non-negative integers small enough to bincount"""
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.integer) or values.size == 0:
+        return False
+    return values.min() >= 0 and values.max() <= MAX_HISTOGRAM_VALUE
+
+
+class IntegerHistogram:
+    """Counts of non-negative integer draws, updatable and mergeable"""
+
+    def __init__(self, counts=None):
+        """
+        Args:
+            counts: optional array where counts[v] is the number of draws equal to v
+        """
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_values(cls, values):
+        """Histogram of an array of non-negative integer draws"""
+        histogram = cls()
+        histogram.update(values)
+        return histogram
+
+    def _grow(self, size):
+        """Extend the counts array to at least size bins"""
+        if size > len(self.counts):
+            self.counts = np.concatenate([self.counts, np.zeros(size - len(self.counts), dtype=np.int64)])
+
+    def update(self, values):
+        """Add a batch of non-negative integer draws (float arrays must hold whole numbers)"""
+        values = np.asarray(values).ravel()
+        if values.size == 0:
+            return self
+        if not np.issubdtype(values.dtype, np.integer):
+            # Casting would silently truncate fractional draws
+            if not np.all(np.mod(values, 1) == 0):
+                raise ValueError("IntegerHistogram only accepts whole-number draws; round them first")
+            values = values.astype(np.int64)
+        batch = np.bincount(values)
+        self._grow(len(batch))
+        self.counts[:len(batch)] += batch
+        return self
+
+    def merge(self, other):
+        """Add another histogram's counts into this one"""
+        self._grow(len(other.counts))
+        self.counts[:len(other.counts)] += other.counts
+        return self
+
+    @property
+    def n(self):
+        """Total number of draws"""
+        return int(self.counts.sum())
+
+    def mean(self):
+        """Mean of the draws"""
+        n = self.n
+        if n == 0:
+            return np.nan
+        return float(np.dot(np.arange(len(self.counts)), self.counts) / n)
+
+    def std(self):
+        """Population standard deviation of the draws (as np.std)"""
+        n = self.n
+        if n == 0:
+            return np.nan
+        deviations = np.arange(len(self.counts)) - self.mean()
+        return float(np.sqrt(np.dot(self.counts, deviations * deviations) / n))
+
+    def percentiles(self, qs):
+        """
+        Percentiles of the draws with np.percentile's linear interpolation
+
+        The value at sorted rank k is the first bin whose cumulative count
+        exceeds k, so every rank lookup is one searchsorted on the cumsum.
+        """
+        qs = np.asarray(qs, dtype=float)
+        n = self.n
+        if n == 0:
+            return np.full(qs.shape, np.nan)
+
+        cumulative = np.cumsum(self.counts)
+        position = (n - 1) * qs / 100.0
+        lower_rank = np.floor(position)
+        upper_rank = np.minimum(lower_rank + 1, n - 1)
+        lower = np.searchsorted(cumulative, lower_rank, side='right')
+        upper = np.searchsorted(cumulative, upper_rank, side='right')
+        return lower + (position - lower_rank) * (upper - lower)
+
+    def summary(self):
+        """Percentile bands, mean and std (calculate_enhanced_percentiles keys)"""
+        levels = self.percentiles(list(PERCENTILE_LEVELS.values()))
+        summary = {key: float(levels[i]) for i, key in enumerate(PERCENTILE_LEVELS)}
+        summary['mean'] = self.mean()
+        summary['std'] = self.std()
+        return summary
+
+
+def summarize_values(values):
+    """
+    Percentile bands, mean and std of one stat's draws
+
+    Integer draws go through IntegerHistogram; anything else (e.g. TS%)
+    uses a single np.percentile call for all bands.
+    """
+    values = np.asarray(values)
+    if is_histogram_compatible(values):
+        return IntegerHistogram.from_values(values).summary()
+
+    levels = np.percentile(values, list(PERCENTILE_LEVELS.values()))
+    summary = {key: float(levels[i]) for i, key in enumerate(PERCENTILE_LEVELS)}
+    summary['mean'] = float(np.mean(values))
+    summary['std'] = float(np.std(values))
+    return summary
+
+
+def summarize_rows(draws):
+    """
+    Percentile bands, mean and std for every row of a (requests, draws) array
+
+    Integer draws are binned with one offset np.bincount into a (rows, bins)
+    count matrix, so a whole slate is summarized without sorting; other
+    draws fall back to draw_engine.summarize_draws.
+
+    Returns:
+        dict with the calculate_enhanced_percentiles keys, each an array of
+        one value per row
+    """
+    draws = np.asarray(draws)
+    if draws.ndim != 2 or draws.shape[1] == 0 or not is_histogram_compatible(draws):
+        return summarize_draws(draws)
+
+    n_rows, n = draws.shape
+    n_bins = int(draws.max()) + 1
+    offsets = (np.arange(n_rows) * n_bins)[:, None]
+    counts = np.bincount((draws + offsets).ravel(), minlength=n_rows * n_bins).reshape(n_rows, n_bins)
+    cumulative = np.cumsum(counts, axis=1)
+
+    qs = np.array(list(PERCENTILE_LEVELS.values()), dtype=float)
+    position = (n - 1) * qs / 100.0
+    lower_rank = np.floor(position)
+    upper_rank = np.minimum(lower_rank + 1, n - 1)
+    # Value at rank k = number of bins whose cumulative count is <= k
+    lower = (cumulative[:, None, :] <= lower_rank[None, :, None]).sum(axis=2)
+    upper = (cumulative[:, None, :] <= upper_rank[None, :, None]).sum(axis=2)
+    levels = lower + (position - lower_rank) * (upper - lower)
+
+    bins = np.arange(n_bins)
+    mean = counts @ bins / n
+    variance = (counts * (bins[None, :] - mean[:, None]) ** 2).sum(axis=1) / n
+
+    summary = {key: levels[:, i] for i, key in enumerate(PERCENTILE_LEVELS)}
+    summary['mean'] = mean
+    summary['std'] = np.sqrt(variance)
+    return summary
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Persistent injury snapshot cache
+- SQLite file of Sportradar payloads keyed by cache key ('current_injuries',
+  'daily_injuries_YYYY-MM-DD'), shared by the Streamlit workers and batch CLIs
+- Entries stored without a TTL never expire (past dates never change);
+  entries with a TTL (today's and the current snapshot) expire after it
+- Size-bounded: once max_entries is exceeded the least recently used entries
+  are evicted
+- Decoded payloads are also kept in memory, so repeat hits in one process
+  skip SQLite and JSON parsing; their recency is written back on the next put
+- Location: SPORTS_MARKET_INJURY_CACHE, else ~/.cache/sports_market/injuries.sqlite
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'SPORTS_MARKET_INJURY_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'sports_market', 'injuries.sqlite')
+)
+
+# Snapshots kept on disk before least-recently-used eviction
+DEFAULT_MAX_ENTRIES = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS injury_snapshots (
+    cache_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS injury_snapshots_last_used ON injury_snapshots (last_used);
+"""
+
+
+class InjuryCache:
+    """Disk-backed, TTL-aware LRU cache of injury payloads"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._memory = {}
+        self._touched = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """New connection per operation, so threads and processes can share the file"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        """Cached payload for key, or None if it is missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at is None or now < expires_at:
+                with self._lock:
+                    self._touched[key] = now
+                return payload
+
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT payload, expires_at FROM injury_snapshots WHERE cache_key = ?', (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and now >= row[1]):
+                return None
+            conn.execute('UPDATE injury_snapshots SET last_used = ? WHERE cache_key = ?', (now, key))
+
+        payload = json.loads(row[0])
+        with self._lock:
+            self._memory[key] = (row[1], payload)
+        return payload
+
+    def put(self, key, payload, ttl=None):
+        """
+        Store a payload
+
+        Args:
+            key: str cache key
+            payload: JSON-serializable response
+            ttl: float seconds until the entry expires, or None to keep it
+                until it is evicted
+        """
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO injury_snapshots (cache_key, payload, fetched_at, expires_at, last_used) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, json.dumps(payload), now, expires_at, now)
+            )
+            self._evict(conn)
+        with self._lock:
+            self._memory[key] = (expires_at, payload)
+
+    def _evict(self, conn):
+        """Drop expired entries, then the least recently used beyond max_entries"""
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        conn.executemany(
+            'UPDATE injury_snapshots SET last_used = MAX(last_used, ?) WHERE cache_key = ?',
+            [(used, key) for key, used in touched.items()]
+        )
+        conn.execute('DELETE FROM injury_snapshots WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),))
+        count = conn.execute('SELECT COUNT(*) FROM injury_snapshots').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            evicted = [row[0] for row in conn.execute(
+                'SELECT cache_key FROM injury_snapshots ORDER BY last_used LIMIT ?', (excess,)
+            )]
+            conn.executemany('DELETE FROM injury_snapshots WHERE cache_key = ?', [(key,) for key in evicted])
+            with self._lock:
+                for key in evicted:
+                    self._memory.pop(key, None)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM injury_snapshots').fetchone()[0]
+
+    def clear(self):
+        """Drop every cached snapshot"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM injury_snapshots')
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Data-driven league baselines for base pricing
+- Per-stat league mean and std of eligible players' per-game averages,
+  computed from the on-disk game-log store in BasePriceAlgorithm's
+  league_stats format
+- Eligibility: at least min_games games and min_minutes minutes per game
+- Incremental: a refresh reads only the games stored since the last one
+  folded in for each player; that player's old average leaves the running
+  moments and the new one joins (Welford add/remove), so seasons are never
+  rescanned
+- Every refresh that changes the baseline writes a numbered snapshot, and
+  pricers pin one with league_stats(version=...)
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .game_log_store import GameLogStore, game_log_select, read_game_logs
+    from .training_set import game_log_matrix
+except ImportError:
+    from game_log_store import GameLogStore, game_log_select, read_game_logs
+    from training_set import game_log_matrix
+
+# BasePriceAlgorithm.league_stats keys and the game-log stats they come from
+PRICE_STATS = ('pts', 'reb', 'ast', 'to', 'stocks', 'ts%')
+_LOG_STATS = ('PTS', 'REB', 'AST', 'TO', 'STOCKS', 'TS%')
+
+DEFAULT_MIN_GAMES = 10
+DEFAULT_MIN_MINUTES = 15.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS baseline_players (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    minutes REAL NOT NULL,
+    sums TEXT NOT NULL,
+    last_game_date TEXT NOT NULL,
+    PRIMARY KEY (player_id, season)
+);
+CREATE TABLE IF NOT EXISTS baseline_moments (
+    season TEXT PRIMARY KEY,
+    min_games INTEGER NOT NULL,
+    min_minutes REAL NOT NULL,
+    n INTEGER NOT NULL,
+    mean TEXT NOT NULL,
+    m2 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS baseline_snapshots (
+    version INTEGER PRIMARY KEY AUTOINCREMENT,
+    season TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    players INTEGER NOT NULL,
+    stats TEXT NOT NULL
+);
+"""
+
+
+def _minutes(game_logs):
+    """Minutes per game as floats ('MIN' may be numeric or 'MM:SS')"""
+    if 'MIN' not in game_logs:
+        return np.zeros(len(game_logs))
+    minutes = game_logs['MIN']
+    if minutes.dtype == object:
+        parts = minutes.astype(str).str.split(':', n=1, expand=True)
+        whole = pd.to_numeric(parts[0], errors='coerce').fillna(0)
+        seconds = pd.to_numeric(parts[1], errors='coerce').fillna(0) if parts.shape[1] > 1 else 0
+        return (whole + seconds / 60).to_numpy(dtype=float)
+    return pd.to_numeric(minutes, errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+class RunningMoments:
+    """Welford mean and sum of squared deviations over vectors, with removal"""
+
+    def __init__(self, dims, n=0, mean=None, m2=None):
+        self.n = n
+        self.mean = np.zeros(dims) if mean is None else np.asarray(mean, dtype=float)
+        self.m2 = np.zeros(dims) if m2 is None else np.asarray(m2, dtype=float)
+
+    def add(self, x):
+        """Fold one observation in"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean = self.mean + delta / self.n
+        self.m2 = self.m2 + delta * (x - self.mean)
+
+    def remove(self, x):
+        """Take a previously added observation back out"""
+        if self.n <= 1:
+            self.n = 0
+            self.mean = np.zeros_like(self.mean)
+            self.m2 = np.zeros_like(self.m2)
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean = self.mean - delta / self.n
+        self.m2 = np.maximum(self.m2 - delta * (x - self.mean), 0)
+
+    def std(self):
+        """Sample standard deviation (NaN with fewer than two observations)"""
+        if self.n < 2:
+            return np.full_like(self.mean, np.nan)
+        return np.sqrt(self.m2 / (self.n - 1))
+
+
+class LeagueBaseline:
+    """Incrementally maintained, versioned league stat baselines"""
+
+    def __init__(self, store=None, min_games=DEFAULT_MIN_GAMES, min_minutes=DEFAULT_MIN_MINUTES):
+        """
+        Args:
+            store: GameLogStore to read games from (baseline tables live in the same file)
+            min_games: int, games a player needs to count toward the baseline
+            min_minutes: float, minutes per game a player needs to count
+        """
+        self.store = store or GameLogStore()
+        self.min_games = min_games
+        self.min_minutes = min_minutes
+        with self.store._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _eligible(self, games, minutes):
+        return games >= self.min_games and minutes / games >= self.min_minutes
+
+    def _load_moments(self, conn, season):
+        """Running moments for season; reset when the eligibility rules changed"""
+        row = conn.execute(
+            'SELECT min_games, min_minutes, n, mean, m2 FROM baseline_moments WHERE season = ?', (season,)
+        ).fetchone()
+        if row is not None and (row[0], row[1]) == (self.min_games, self.min_minutes):
+            return RunningMoments(len(PRICE_STATS), row[2], json.loads(row[3]), json.loads(row[4]))
+        conn.execute('DELETE FROM baseline_players WHERE season = ?', (season,))
+        return RunningMoments(len(PRICE_STATS))
+
+    def refresh(self, season="2023-24"):
+        """
+        Fold games stored since the last refresh into the season's baseline
+
+        Returns:
+            the latest snapshot version for season (new if anything changed),
+            or None while fewer than two players are eligible
+        """
+        with self.store._connect() as conn:
+            moments = self._load_moments(conn, season)
+            game_logs = read_game_logs(
+                conn,
+                f'SELECT {game_log_select()} FROM game_logs g '
+                'LEFT JOIN baseline_players b ON b.player_id = g.player_id AND b.season = g.season '
+                'WHERE g.season = ? AND (b.last_game_date IS NULL OR g.game_date > b.last_game_date) '
+                'ORDER BY g.player_id, g.game_date',
+                (season,)
+            )
+            if len(game_logs) == 0:
+                return self.latest_version(season)
+
+            stats = game_log_matrix(game_logs, _LOG_STATS)
+            minutes = _minutes(game_logs)
+            player_ids, inverse = np.unique(game_logs['Player_ID'].to_numpy(), return_inverse=True)
+
+            # New games per player, summed in one pass
+            new_sums = np.zeros((len(player_ids), len(PRICE_STATS)))
+            np.add.at(new_sums, inverse, stats)
+            new_games = np.bincount(inverse, minlength=len(player_ids))
+            new_minutes = np.bincount(inverse, weights=minutes, minlength=len(player_ids))
+            last_dates = dict(zip(game_logs['Player_ID'].tolist(), game_logs['GAME_DATE'].tolist()))
+
+            previous = {
+                row[0]: (row[1], row[2], np.asarray(json.loads(row[3])))
+                for row in conn.execute(
+                    'SELECT player_id, games, minutes, sums FROM baseline_players WHERE season = ?', (season,)
+                )
+            }
+
+            updates = []
+            baseline_changed = False
+            for i, player_id in enumerate(player_ids.tolist()):
+                games, total_minutes, sums = previous.get(player_id, (0, 0.0, np.zeros(len(PRICE_STATS))))
+                if games and self._eligible(games, total_minutes):
+                    moments.remove(sums / games)
+                    baseline_changed = True
+
+                games += int(new_games[i])
+                total_minutes += float(new_minutes[i])
+                sums = sums + new_sums[i]
+                if self._eligible(games, total_minutes):
+                    moments.add(sums / games)
+                    baseline_changed = True
+
+                updates.append((player_id, season, games, total_minutes,
+                                json.dumps(sums.tolist()), last_dates[player_id]))
+
+            conn.executemany(
+                'INSERT OR REPLACE INTO baseline_players '
+                '(player_id, season, games, minutes, sums, last_game_date) VALUES (?, ?, ?, ?, ?, ?)',
+                updates
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO baseline_moments (season, min_games, min_minutes, n, mean, m2) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (season, self.min_games, self.min_minutes, moments.n,
+                 json.dumps(moments.mean.tolist()), json.dumps(moments.m2.tolist()))
+            )
+
+            if moments.n < 2:
+                return None
+            # Only ineligible players got new games: the baseline is unchanged
+            if not baseline_changed:
+                latest = conn.execute(
+                    'SELECT MAX(version) FROM baseline_snapshots WHERE season = ?', (season,)
+                ).fetchone()[0]
+                if latest is not None:
+                    return latest
+            std = moments.std()
+            league_stats = {
+                stat: {'mean': float(moments.mean[i]), 'std': float(std[i])}
+                for i, stat in enumerate(PRICE_STATS)
+            }
+            cursor = conn.execute(
+                'INSERT INTO baseline_snapshots (season, created_at, players, stats) VALUES (?, ?, ?, ?)',
+                (season, time.time(), moments.n, json.dumps(league_stats))
+            )
+            return cursor.lastrowid
+
+    def rebuild(self, season="2023-24"):
+        """Recompute a season's baseline from scratch (clears accumulated float drift)"""
+        with self.store._connect() as conn:
+            conn.execute('DELETE FROM baseline_players WHERE season = ?', (season,))
+            conn.execute('DELETE FROM baseline_moments WHERE season = ?', (season,))
+        return self.refresh(season)
+
+    def latest_version(self, season=None):
+        """Newest snapshot version (for one season, or any), or None"""
+        with self.store._connect() as conn:
+            if season is None:
+                row = conn.execute('SELECT MAX(version) FROM baseline_snapshots').fetchone()
+            else:
+                row = conn.execute(
+                    'SELECT MAX(version) FROM baseline_snapshots WHERE season = ?', (season,)
+                ).fetchone()
+        return row[0]
+
+    def snapshot(self, version=None, season=None):
+        """
+        A stored baseline snapshot
+
+        Args:
+            version: int to pin, or None for the newest
+            season: restricts "newest" to one season
+
+        Returns:
+            dict with 'version', 'season', 'created_at', 'players' and
+            'league_stats', or None if there is no such snapshot
+        """
+        if version is None:
+            version = self.latest_version(season)
+            if version is None:
+                return None
+        with self.store._connect() as conn:
+            row = conn.execute(
+                'SELECT version, season, created_at, players, stats FROM baseline_snapshots WHERE version = ?',
+                (int(version),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'version': row[0],
+            'season': row[1],
+            'created_at': row[2],
+            'players': row[3],
+            'league_stats': json.loads(row[4])
+        }
+
+    def league_stats(self, version=None, season=None):
+        """league_stats dict for BasePriceAlgorithm, or None if no snapshot exists"""
+        snapshot = self.snapshot(version, season)
+        return snapshot['league_stats'] if snapshot else None
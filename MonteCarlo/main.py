@@ -11,9 +11,43 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from functools import partial
 import warnings
 warnings.filterwarnings('ignore')
 
+# Monte Carlo engine modules (same folder)
+try:
+    from .draw_engine import RATE_STATS, run_joint_draws, run_vectorized_draws
+    from .training_set import MARKET_STATS, WeightedTrainingSet
+    from .slate import project_slate
+    from .parallel import run_parallel_accumulated, run_parallel_draws
+    from .adaptive import run_adaptive_draws
+    from .histogram import summarize_values
+    from .streaming import DEFAULT_CHUNK_SIZE, StreamingAccumulator, run_streaming_draws, scale_draws
+    from .game_log_store import GameLogStore
+    from .player_index import get_player_index
+    from .rate_limit import TokenBucket, call_with_retry
+    from .replay import FixtureNotFoundError, frame_from_payload, frame_to_payload, get_replay_transport
+    from .team_index import TEAM_INDEX
+except ImportError:
+    from draw_engine import RATE_STATS, run_joint_draws, run_vectorized_draws
+    from training_set import MARKET_STATS, WeightedTrainingSet
+    from slate import project_slate
+    from parallel import run_parallel_accumulated, run_parallel_draws
+    from adaptive import run_adaptive_draws
+    from histogram import summarize_values
+    from streaming import DEFAULT_CHUNK_SIZE, StreamingAccumulator, run_streaming_draws, scale_draws
+    from game_log_store import GameLogStore
+    from player_index import get_player_index
+    from rate_limit import TokenBucket, call_with_retry
+    from replay import FixtureNotFoundError, frame_from_payload, frame_to_payload, get_replay_transport
+    from team_index import TEAM_INDEX
+
+# nba_api (stats.nba.com) limits per client, so every simulator and thread in
+# the process shares one token bucket; failed requests retry with jitter
+NBA_API_LIMITER = TokenBucket(rate=2.0, capacity=4)
+NBA_API_ATTEMPTS = 3
+
 # Import the original simulator as base
 try:
     # First try importing from the same directory (MonteCarlo folder)
@@ -56,9 +90,16 @@ except ImportError:
                 self.game_logs = {}
                 self.defensive_ratings = {}
                 self.pace_data = {}
+                if get_replay_transport().mode == 'off':
+                    self.game_log_store = GameLogStore()
+                else:
+                    # Record/replay runs start from an empty private store, so every
+                    # fetch is a full season (stable fixture keys) and replayed logs
+                    # never reach the user's store
+                    self.game_log_store = GameLogStore.temporary()
             
             def get_player_id(self, player_name):
-                if not NBA_API_AVAILABLE:
+                if not NBA_API_AVAILABLE and not get_replay_transport().active:
                     fallback_ids = {
                         'LeBron James': 2544,
                         'Stephen Curry': 201939,
@@ -69,79 +110,75 @@ except ImportError:
                     return fallback_ids.get(player_name, None)
                 
                 try:
-                    all_players = players.get_players()
-                    for player in all_players:
-                        if player_name.lower() in player['full_name'].lower():
-                            return player['id']
+                    # Prebuilt name index (exact / normalized / prefix, then substring)
+                    return get_player_index().get_id(player_name)
+                except FixtureNotFoundError:
+                    raise
                 except:
                     pass
                 return None
             
             def fetch_player_game_logs(self, player_name, season="2023-24"):
-                if not NBA_API_AVAILABLE:
+                if not NBA_API_AVAILABLE and not get_replay_transport().active:
                     return None
                 
                 player_id = self.get_player_id(player_name)
                 if not player_id:
                     return None
                 
-                try:
-                    game_logs = playergamelog.PlayerGameLog(
+                def request_logs(date_from):
+                    return playergamelog.PlayerGameLog(
                         player_id=player_id,
                         season=season,
-                        season_type_all_star=SeasonType.regular
+                        season_type_all_star=SeasonType.regular,
+                        date_from_nullable=date_from or ''
                     ).get_data_frames()[0]
-                    
-                    game_logs['GAME_DATE'] = pd.to_datetime(game_logs['GAME_DATE'])
-                    game_logs = game_logs.sort_values('GAME_DATE')
-                    return game_logs
-                except Exception as e:
-                    return None
+                
+                def fetch(date_from):
+                    # Full season, or only the games since the last stored date
+                    # (through the record/replay transport when one is configured;
+                    # replayed responses never reach nba_api, so they skip the limiter)
+                    transport = get_replay_transport()
+                    return call_with_retry(
+                        lambda: transport.call(
+                            'playergamelog',
+                            {'player_id': player_id, 'season': season, 'date_from': date_from},
+                            lambda: request_logs(date_from),
+                            encode=frame_to_payload, decode=frame_from_payload
+                        ),
+                        attempts=NBA_API_ATTEMPTS,
+                        limiter=None if transport.active else NBA_API_LIMITER,
+                        retry_on=(OSError, ValueError)
+                    )
+                
+                # Read through the on-disk store; nba_api is only hit when stale
+                return self.game_log_store.read_through(player_id, season, fetch)
+            
+            def opponent_multipliers(self, opponent_team, location='HOME'):
+                # Simple opponent adjustment fallback: no per-stat scaling
+                return {}
             
             def adjust_for_opponent(self, base_stats, opponent_team, location='HOME'):
-                # Simple opponent adjustment fallback
-                return base_stats
+                return scale_draws(base_stats, self.opponent_multipliers(opponent_team, location))
         
         def find_games_against_opponent(player_name, opponent_team, season="2023-24"):
-            if not NBA_API_AVAILABLE:
+            if not NBA_API_AVAILABLE and not get_replay_transport().active:
                 return None
             
             sim = NBAMonteCarloSimulator()
-            player_id = sim.get_player_id(player_name)
-            if not player_id:
-                return None
             
             try:
-                game_logs = playergamelog.PlayerGameLog(
-                    player_id=player_id,
-                    season=season,
-                    season_type_all_star=SeasonType.regular
-                ).get_data_frames()[0]
+                game_logs = sim.fetch_player_game_logs(player_name, season)
                 
-                if len(game_logs) == 0:
+                if game_logs is None or len(game_logs) == 0:
                     return None
                 
-                game_logs['GAME_DATE'] = pd.to_datetime(game_logs['GAME_DATE'])
-                game_logs = game_logs.sort_values('GAME_DATE')
-                
-                # Find games against opponent
-                team_variations = [
-                    opponent_team.upper(),
-                    f"vs. {opponent_team.upper()}",
-                    f"@ {opponent_team.upper()}",
-                ]
-                
-                opponent_games = pd.DataFrame()
-                for team_var in team_variations:
-                    games = game_logs[
-                        game_logs['MATCHUP'].str.contains(team_var, case=False, na=False)
-                    ]
-                    if len(games) > 0:
-                        opponent_games = games
-                        break
-                
-                return opponent_games
+                # Find games against opponent (MATCHUP holds abbreviations, e.g. 'LAL @ PHX')
+                vs_opponent = TEAM_INDEX.faces_opponent(game_logs['MATCHUP'], opponent_team)
+                return game_logs[np.asarray(vs_opponent, dtype=bool)]
                 
+            except FixtureNotFoundError:
+                raise
             except Exception as e:
                 return None
 
@@ -172,11 +209,21 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
             print(f"❌ No games found between {player_name} and {opponent_team}")
             return []
     
-    def get_rest_status(self, player_name, game_date, season="2023-24"):
+    def _fetch_logs_cached(self, player_name, season, log_cache=None):
+        """Fetch a season game log once per log_cache (a plain dict shared by the caller)"""
+        if log_cache is None:
+            return self.fetch_player_game_logs(player_name, season)
+        
+        key = (player_name, season)
+        if key not in log_cache:
+            log_cache[key] = self.fetch_player_game_logs(player_name, season)
+        return log_cache[key]
+    
+    def get_rest_status(self, player_name, game_date, season="2023-24", log_cache=None):
         """Check rest status: back-to-back, days of rest, etc."""
         try:
             # Get player's game log
-            game_logs = self.fetch_player_game_logs(player_name, season)
+            game_logs = self._fetch_logs_cached(player_name, season, log_cache)
             if game_logs is None or len(game_logs) == 0:
                 return {'days_rest': 2, 'is_back_to_back': False, 'rest_advantage': False}
             
@@ -203,13 +250,23 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
             
             return rest_status
             
+        except FixtureNotFoundError:
+            raise
         except Exception as e:
             print(f"⚠️  Could not determine rest status: {e}")
             return {'days_rest': 2, 'is_back_to_back': False, 'rest_advantage': False}
     
     def calculate_contextual_adjustments(self, player_name, player_team, opponent_team, 
-                                       game_date, location='HOME'):
-        """Calculate all contextual adjustments with detailed breakdown"""
+                                       game_date, location='HOME', log_cache=None,
+                                       injury_cache=None, rng=None):
+        """
+        Calculate all contextual adjustments with detailed breakdown
+        
+        log_cache / injury_cache are optional dicts shared across calls (e.g. a
+        whole slate) so game logs and team injury context are fetched once.
+        rng is an optional numpy Generator for the simulated injury roll
+        (defaults to the global random module).
+        """
         adjustments = {
             'injury_boost': 0.0,
             'rest_adjustment': 0.0,
@@ -230,7 +287,7 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
             adjustments['breakdown'].append(f"✈️  Away game penalty: {away_adj*100:.1f}%")
         
         # 2. Rest/Fatigue adjustment
-        rest_status = self.get_rest_status(player_name, game_date)
+        rest_status = self.get_rest_status(player_name, game_date, log_cache=log_cache)
         adjustments['details']['rest_status'] = rest_status
         
         if rest_status['is_back_to_back']:
@@ -248,9 +305,15 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
         # For now, simulate some injury impact
         if hasattr(self, 'injury_api') and self.injury_api:
             try:
-                injury_context = self.injury_api.get_injury_context_for_game(
-                    player_team, opponent_team, game_date
-                )
+                injury_key = (player_team, opponent_team, str(game_date))
+                if injury_cache is not None and injury_key in injury_cache:
+                    injury_context = injury_cache[injury_key]
+                else:
+                    injury_context = self.injury_api.get_injury_context_for_game(
+                        player_team, opponent_team, game_date
+                    )
+                    if injury_cache is not None:
+                        injury_cache[injury_key] = injury_context
                 adjustments['injury_boost'] = injury_context['total_boost']
                 adjustments['breakdown'].extend(injury_context['player_team_injuries'])
                 adjustments['details']['injury_context'] = injury_context
@@ -260,8 +323,9 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
         else:
             # Simulate injury impact for demo
             import random
-            if random.random() < 0.3:  # 30% chance of teammate injury
-                simulated_boost = random.choice([0.02, 0.05])  # 2% or 5%
+            roll = rng.random if rng is not None else random.random
+            if roll() < 0.3:  # 30% chance of teammate injury
+                simulated_boost = 0.02 if roll() < 0.5 else 0.05  # 2% or 5%
                 adjustments['injury_boost'] = simulated_boost
                 player_type = "starter" if simulated_boost == 0.02 else "superstar"
                 adjustments['breakdown'].append(f"🏥 Simulated teammate injury ({player_type}): +{simulated_boost*100:.1f}%")
@@ -277,10 +341,18 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
         
         return adjustments
     
-    def run_enhanced_monte_carlo_simulation(self, player_name, opponent_team, game_date, 
-                                          player_team=None, n_simulations=10000):
+    def _game_location(self, player_team, opponent_team):
+        """Home/away for a matchup"""
+        # This is a simplification - in reality you'd check the actual game location
+        return 'HOME' if not player_team or player_team.lower() in opponent_team.lower() else 'AWAY'
+    
+    def _load_training_set(self, player_name, opponent_team, game_date, stats=('PTS', 'REB', 'AST'),
+                           exact_weights=False, recency_half_life=None, log_cache=None):
         """
-        Enhanced Monte Carlo with tighter variance and contextual adjustments
+        Fetch, date-filter and weight a player's game logs for simulation
+        
+        Returns:
+            WeightedTrainingSet, or None if the date or data is unusable
         """
         # Validate inputs
         game_date_dt = pd.to_datetime(game_date)
@@ -288,15 +360,15 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
         
         if game_date_dt > current_date:
             print(f"❌ Future date provided: {game_date}. Please use a past date.")
-            return None, None, None
+            return None
         
         # Get historical data (same as original)
-        current_season_logs = self.fetch_player_game_logs(player_name, "2023-24")
-        last_season_logs = self.fetch_player_game_logs(player_name, "2022-23")
+        current_season_logs = self._fetch_logs_cached(player_name, "2023-24", log_cache)
+        last_season_logs = self._fetch_logs_cached(player_name, "2022-23", log_cache)
         
         if current_season_logs is None and last_season_logs is None:
             print(f"❌ No historical data available for {player_name}")
-            return None, None, None
+            return None
         
         # Filter data up to game date
         game_date_pd = pd.to_datetime(game_date)
@@ -307,118 +379,167 @@ class EnhancedNBAMonteCarloSimulator(NBAMonteCarloSimulator):
         if last_season_logs is not None:
             last_season_logs = last_season_logs[last_season_logs['GAME_DATE'] < game_date_pd]
         
-        # Build training dataset (same logic as original)
-        training_data = {'PTS': [], 'REB': [], 'AST': []}
+        # Build weighted training set: unique games plus a sampling weight each
+        training_set = WeightedTrainingSet.from_game_logs(
+            current_season_logs, last_season_logs, game_date_pd, opponent_team,
+            stats=stats, exact_weights=exact_weights, recency_half_life=recency_half_life
+        )
         
-        # Add current season data with exponential decay weighting
-        if current_season_logs is not None and len(current_season_logs) > 0:
-            current_games = current_season_logs.copy()
-            current_games['DAYS_AGO'] = (game_date_pd - current_games['GAME_DATE']).dt.days
-            
-            for _, game in current_games.iterrows():
-                days_ago = game['DAYS_AGO']
-                weight = max(1, int(np.exp(-days_ago / 30) * 5))
-                
-                context_multiplier = 1.0
-                if days_ago <= 1:
-                    context_multiplier *= 0.9
-                
-                if 'MATCHUP' in game and opponent_team.upper() in game['MATCHUP'].upper():
-                    context_multiplier *= 1.2
-                
-                final_weight = max(1, int(weight * context_multiplier))
-                
-                training_data['PTS'].extend([game['PTS']] * final_weight)
-                training_data['REB'].extend([game['REB']] * final_weight)
-                training_data['AST'].extend([game['AST']] * final_weight)
+        if training_set.is_empty():
+            print(f"❌ Insufficient training data for {player_name}")
+            return None
         
-        # Add last season data with reduced weight
-        if last_season_logs is not None and len(last_season_logs) > 0:
-            estimated_days_ago = 365 + (game_date_pd - pd.Timestamp('2023-10-01')).days
-            
-            for _, game in last_season_logs.iterrows():
-                weight = max(1, int(np.exp(-estimated_days_ago / 365) * 2))
-                
-                training_data['PTS'].extend([game['PTS']] * weight)
-                training_data['REB'].extend([game['REB']] * weight)
-                training_data['AST'].extend([game['AST']] * weight)
+        return training_set
+    
+    def run_enhanced_monte_carlo_simulation(self, player_name, opponent_team, game_date, 
+                                          player_team=None, n_simulations=10000,
+                                          exact_weights=False, recency_half_life=None,
+                                          joint=False, seed=None, n_workers=None,
+                                          adaptive=False, tolerance=0.01, sampling='iid',
+                                          streaming=False, chunk_size=None):
+        """
+        Enhanced Monte Carlo with tighter variance and contextual adjustments
         
-        if not any(training_data.values()):
-            print(f"❌ Insufficient training data for {player_name}")
+        exact_weights keeps the fractional recency weights instead of truncating
+        them to integers; recency_half_life (days) overrides the 30-day decay.
+        joint=True simulates all 7 market stats (PTS, REB, AST, TO, STOCKS, 3PM,
+        TS%) together by resampling whole games, keeping their correlations.
+        seed / n_workers switch to seeded shards (optionally across worker
+        processes); output is bit-identical for a seed whatever n_workers is.
+        adaptive=True draws in batches until every stat's mean and key
+        percentiles have a standard error within tolerance (relative to the
+        mean), with n_simulations as the cap; metadata reports the draws used
+        (it draws in-process, so it can't be combined with n_workers > 1).
+        sampling selects a variance-reduction mode for the draws: 'iid'
+        (default), 'antithetic', 'stratified' (Latin hypercube) or 'sobol'.
+        streaming=True draws in chunks of chunk_size into a StreamingAccumulator
+        (constant memory for any n_simulations) and returns it in place of
+        the result arrays; calculate_enhanced_percentiles accepts either.
+        """
+        if streaming and adaptive:
+            raise ValueError("adaptive and streaming modes cannot be combined")
+        if adaptive and n_workers and n_workers > 1:
+            # Batches are drawn one after another until convergence, in this process
+            raise ValueError("adaptive mode runs in-process; use n_workers=None or 1")
+        
+        # Seeded / parallel mode: one root SeedSequence feeds both the context
+        # roll and the draw shards, so nothing touches global random state
+        context_rng = None
+        if seed is not None or n_workers:
+            root_seed = np.random.SeedSequence(seed)
+            context_seed, draw_seed = root_seed.spawn(2)
+            context_rng = np.random.default_rng(context_seed)
+        
+        log_cache = {}
+        training_set = self._load_training_set(
+            player_name, opponent_team, game_date,
+            stats=MARKET_STATS if joint else ('PTS', 'REB', 'AST'),
+            exact_weights=exact_weights, recency_half_life=recency_half_life,
+            log_cache=log_cache
+        )
+        
+        if training_set is None:
             return None, None, None
         
         # Determine location
-        # This is a simplification - in reality you'd check the actual game location
-        location = 'HOME' if not player_team or player_team.lower() in opponent_team.lower() else 'AWAY'
+        location = self._game_location(player_team, opponent_team)
         
         # Calculate contextual adjustments
         adjustments = self.calculate_contextual_adjustments(
-            player_name, player_team, opponent_team, game_date, location
+            player_name, player_team, opponent_team, game_date, location,
+            log_cache=log_cache, rng=context_rng
         )
         
         # Get base projections from original algorithm
         base_projections = {}
-        for stat in ['PTS', 'REB', 'AST']:
-            base_projections[stat] = np.mean(training_data[stat])
+        for stat in training_set.values:
+            base_projections[stat] = training_set.weighted_mean(stat)
         
         # Apply contextual adjustments
         adjusted_projections = {}
         total_adj = adjustments['total_adjustment']
-        for stat in ['PTS', 'REB', 'AST']:
-            adjusted_projections[stat] = base_projections[stat] * (1 + total_adj)
-        
-        # Run enhanced Monte Carlo with TIGHTER variance
-        simulation_results = {'PTS': [], 'REB': [], 'AST': []}
+        for stat in training_set.values:
+            if stat in RATE_STATS:
+                adjusted_projections[stat] = base_projections[stat]
+            else:
+                adjusted_projections[stat] = base_projections[stat] * (1 + total_adj)
+        
+        # Run enhanced Monte Carlo with TIGHTER variance (vectorized draws)
+        n_used = n_simulations
+        converged = None
+        draw_fn = run_joint_draws if joint else run_vectorized_draws
+        if streaming:
+            # Opponent adjustment is applied chunk by chunk before accumulating; its
+            # multipliers are resolved here so worker shards never pickle the simulator
+            transform = partial(scale_draws, multipliers=self.opponent_multipliers(opponent_team, location))
+            chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+            if context_rng is not None:
+                simulation_results = run_parallel_accumulated(
+                    training_set, n_simulations, total_adj, draw_seed,
+                    joint=joint, n_workers=n_workers, sampling=sampling,
+                    chunk_size=chunk_size, transform=transform
+                )
+            else:
+                simulation_results = run_streaming_draws(
+                    lambda n: draw_fn(training_set, n, total_adj, sampling=sampling),
+                    n_simulations, list(training_set.values),
+                    chunk_size=chunk_size, transform=transform
+                )
+        elif adaptive:
+            draw_rng = np.random.default_rng(draw_seed) if context_rng is not None else None
+            draws, n_used, converged = run_adaptive_draws(
+                lambda n: draw_fn(training_set, n, total_adj, rng=draw_rng, sampling=sampling),
+                tolerance=tolerance, max_simulations=n_simulations
+            )
+        elif context_rng is not None:
+            draws = run_parallel_draws(
+                training_set, n_simulations, total_adj, draw_seed,
+                joint=joint, n_workers=n_workers, sampling=sampling
+            )
+        elif joint:
+            draws = run_joint_draws(training_set, n_simulations, total_adj, sampling=sampling)
+        else:
+            draws = run_vectorized_draws(training_set, n_simulations, total_adj, sampling=sampling)
         
-        for _ in range(n_simulations):
-            # Sample from historical performance distributions
-            pts_sample = np.random.choice([s for s in training_data['PTS'] if s > 0], 1)[0]
-            reb_sample = np.random.choice([s for s in training_data['REB'] if s > 0], 1)[0]
-            ast_sample = np.random.choice([s for s in training_data['AST'] if s > 0], 1)[0]
-            
-            # ENHANCED: Much tighter variance
-            pts_variance = pts_sample * 0.10  # Reduced from 0.15
-            reb_variance = reb_sample * 0.15  # Reduced from 0.25
-            ast_variance = ast_sample * 0.15  # Reduced from 0.25
-            
-            # Generate stats with tighter variance
-            pts = max(0, int(np.random.normal(pts_sample, pts_variance)))
-            reb = max(0, int(np.random.normal(reb_sample, reb_variance)))
-            ast = max(0, int(np.random.normal(ast_sample, ast_variance)))
-            
-            # Apply contextual adjustments
-            pts = max(0, int(pts * (1 + total_adj)))
-            reb = max(0, int(reb * (1 + total_adj)))
-            ast = max(0, int(ast * (1 + total_adj)))
-            
-            # Apply opponent adjustments (from original algorithm)
-            base_stats = {'PTS': pts, 'REB': reb, 'AST': ast}
-            adjusted_stats = self.adjust_for_opponent(base_stats, opponent_team, location)
-            
-            for stat in ['PTS', 'REB', 'AST']:
-                simulation_results[stat].append(adjusted_stats[stat])
+        if not streaming:
+            # Apply opponent adjustments (from original algorithm) to the full arrays
+            simulation_results = self.adjust_for_opponent(draws, opponent_team, location)
         
         return simulation_results, adjustments, {
             'base_projections': base_projections,
             'adjusted_projections': adjusted_projections,
-            'training_data_size': {stat: len(data) for stat, data in training_data.items()}
+            'training_data_size': {stat: training_set.total_weight() for stat in training_set.values},
+            'training_games': training_set.n_games(),
+            'seed': root_seed.entropy if context_rng is not None else None,
+            'n_simulations_used': n_used,
+            'converged': converged,
+            'sampling': sampling
         }
     
+    def project_slate(self, requests, n_simulations=10000, rng=None):
+        """
+        Project many (player, opponent, date) matchups in one batched run
+        
+        Each request is a dict with 'player_name', 'opponent_team', 'game_date'
+        and optionally 'player_team'. Returns columnar per-stat means, stds and
+        percentiles (see MonteCarlo/slate.py).
+        """
+        return project_slate(self, requests, n_simulations=n_simulations, rng=rng)
+    
     def calculate_enhanced_percentiles(self, simulation_results):
-        """Calculate enhanced confidence intervals with tighter ranges"""
+        """
+        Calculate enhanced confidence intervals with tighter ranges
+        
+        Integer draws are summarized from one histogram per stat (bincount +
+        cumulative sums); rate stats use a single np.percentile call. A
+        StreamingAccumulator (streaming mode) is summarized directly.
+        """
+        if isinstance(simulation_results, StreamingAccumulator):
+            return simulation_results.summary()
+        
         percentiles = {}
         for stat, values in simulation_results.items():
-            percentiles[stat] = {
-                '5th': np.percentile(values, 5),
-                '10th': np.percentile(values, 10),
-                '25th': np.percentile(values, 25),
-                '50th': np.percentile(values, 50),
-                '75th': np.percentile(values, 75),
-                '90th': np.percentile(values, 90),
-                '95th': np.percentile(values, 95),
-                'mean': np.mean(values),
-                'std': np.std(values)
-            }
+            percentiles[stat] = summarize_values(values)
         return percentiles
     
     def display_enhanced_breakdown(self, player_name, opponent_team, game_date, 
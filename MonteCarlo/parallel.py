@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Parallel Monte Carlo execution with deterministic seeding
+- Splits the simulations into fixed-size shards, independent of worker count
+- Every shard draws from its own numpy Generator spawned from one root
+  SeedSequence, so results are bit-identical for a seed however many
+  processes run them
+- Shards run on a ProcessPoolExecutor and are concatenated in shard order
+- Streaming mode returns one small accumulator per shard and merges them,
+  so no process ever holds more than a chunk of draws
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from .draw_engine import run_joint_draws, run_vectorized_draws
+    from .streaming import DEFAULT_CHUNK_SIZE, StreamingAccumulator, run_streaming_draws
+except ImportError:
+    from draw_engine import run_joint_draws, run_vectorized_draws
+    from streaming import DEFAULT_CHUNK_SIZE, StreamingAccumulator, run_streaming_draws
+
+# Draws per shard; fixed so the shard layout never depends on n_workers
+DEFAULT_SHARD_SIZE = 50000
+
+
+def shard_sizes(n_simulations, shard_size=DEFAULT_SHARD_SIZE):
+    """Split n_simulations into full shards plus one remainder shard"""
+    full, remainder = divmod(n_simulations, shard_size)
+    return [shard_size] * full + ([remainder] if remainder else [])
+
+
+def _draw_shard(task):
+    """Worker entry point: run one shard with its own Generator"""
+    training_set, n_simulations, total_adjustment, joint, sampling, seed_sequence = task
+    rng = np.random.default_rng(seed_sequence)
+    if joint:
+        return run_joint_draws(training_set, n_simulations, total_adjustment,
+                               rng=rng, sampling=sampling)
+    return run_vectorized_draws(training_set, n_simulations, total_adjustment,
+                                rng=rng, sampling=sampling)
+
+
+def _accumulate_shard(task):
+    """Worker entry point: stream one shard's draws into an accumulator"""
+    training_set, n_simulations, total_adjustment, joint, sampling, seed_sequence, chunk_size, transform = task
+    rng = np.random.default_rng(seed_sequence)
+    draw_fn = run_joint_draws if joint else run_vectorized_draws
+    return run_streaming_draws(
+        lambda n: draw_fn(training_set, n, total_adjustment, rng=rng, sampling=sampling),
+        n_simulations, list(training_set.values), chunk_size=chunk_size, transform=transform
+    )
+
+
+def run_parallel_draws(training_set, n_simulations, total_adjustment, seed,
+                       joint=False, n_workers=None, shard_size=DEFAULT_SHARD_SIZE,
+                       sampling='iid'):
+    """
+    Run the draws in seeded shards, optionally across worker processes
+
+    Args:
+        training_set: WeightedTrainingSet of historical games
+        n_simulations: int, total number of simulations
+        total_adjustment: float, contextual adjustment
+        seed: int or np.random.SeedSequence, root of every shard's stream
+        joint: bool, joint 7-stat draws instead of per-stat draws
+        n_workers: int, processes to use (1 or None runs in-process)
+        shard_size: int, draws per shard
+        sampling: variance-reduction mode, applied within each shard
+
+    Returns:
+        dict of stat -> array of length n_simulations (identical for a given
+        seed and shard_size regardless of n_workers)
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    sizes = shard_sizes(n_simulations, shard_size)
+    tasks = [
+        (training_set, size, total_adjustment, joint, sampling, child)
+        for size, child in zip(sizes, seed.spawn(len(sizes)))
+    ]
+
+    if not n_workers or n_workers == 1 or len(tasks) <= 1:
+        results = [_draw_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_draw_shard, tasks))
+
+    if not results:
+        return {stat: np.empty(0) for stat in training_set.values}
+    return {stat: np.concatenate([result[stat] for result in results]) for stat in results[0]}
+
+
+def run_parallel_accumulated(training_set, n_simulations, total_adjustment, seed,
+                             joint=False, n_workers=None, shard_size=DEFAULT_SHARD_SIZE,
+                             sampling='iid', chunk_size=DEFAULT_CHUNK_SIZE, transform=None):
+    """
+    Streaming counterpart of run_parallel_draws
+
+    Each seeded shard is drawn chunk by chunk into its own accumulator
+    (transform, e.g. the opponent adjustment, is applied to every chunk and
+    must be picklable when n_workers > 1); the shard accumulators are merged
+    in shard order.
+
+    Returns:
+        StreamingAccumulator over all n_simulations draws
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    sizes = shard_sizes(n_simulations, shard_size)
+    tasks = [
+        (training_set, size, total_adjustment, joint, sampling, child, chunk_size, transform)
+        for size, child in zip(sizes, seed.spawn(len(sizes)))
+    ]
+
+    if not n_workers or n_workers == 1 or len(tasks) <= 1:
+        results = [_accumulate_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(_accumulate_shard, tasks))
+
+    accumulator = StreamingAccumulator(list(training_set.values))
+    for result in results:
+        accumulator.merge(result)
+    return accumulator
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Prebuilt player-name index
+- Built once from nba_api's static player list (or any list of names) and
+  cached on disk, so lookups never rescan thousands of players
+- Constant-time exact, normalized (accent/case/punctuation-folded) and
+  prefix lookups through plain dicts
+- Ambiguous names resolve deterministically: exact full name, then exact
+  last name, exact first name, full-name prefix, name-part prefix and
+  finally substring; ties prefer active players, then an explicit rank,
+  then the most recent (highest) player id, then the name
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import unicodedata
+
+try:
+    from .replay import FixtureNotFoundError, get_replay_transport
+except ImportError:
+    from replay import FixtureNotFoundError, get_replay_transport
+
+DEFAULT_INDEX_PATH = os.environ.get(
+    'SPORTS_MARKET_PLAYER_INDEX',
+    os.path.join(os.path.expanduser('~'), '.cache', 'sports_market', 'player_index.pkl')
+)
+
+# Match tiers, best first
+EXACT, NORMALIZED, LAST_NAME, FIRST_NAME, PREFIX, PART_PREFIX, SUBSTRING = range(7)
+
+
+def normalize_name(name):
+    """Fold accents, case and punctuation: 'Nikola Jokić' -> 'nikola jokic', "De'Aaron" -> 'deaaron'"""
+    folded = unicodedata.normalize('NFKD', name)
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch)).lower()
+    folded = re.sub(r"[.'`’]", '', folded)
+    folded = re.sub(r'[^a-z0-9]+', ' ', folded)
+    return folded.strip()
+
+
+class PlayerIndex:
+    """Name -> player lookups over a fixed player list"""
+
+    def __init__(self, players):
+        """
+        Args:
+            players: list of dicts with 'id', 'full_name' and optionally
+                'is_active' (the nba_api static players format) and 'rank'
+                (lower wins ties)
+        """
+        self.players = {player['id']: player for player in players}
+        self.source_digest = player_list_digest(players)
+        self._exact = {}
+        self._normalized = {}
+        self._last_name = {}
+        self._first_name = {}
+        self._prefix = {}
+        self._part_prefix = {}
+
+        for player in players:
+            player_id = player['id']
+            normalized = normalize_name(player['full_name'])
+            parts = normalized.split()
+            self._exact.setdefault(player['full_name'], []).append(player_id)
+            self._normalized.setdefault(normalized, []).append(player_id)
+            if parts:
+                self._last_name.setdefault(parts[-1], []).append(player_id)
+                self._first_name.setdefault(parts[0], []).append(player_id)
+            for end in range(1, len(normalized) + 1):
+                self._prefix.setdefault(normalized[:end], []).append(player_id)
+            for part in parts[1:]:
+                for end in range(1, len(part) + 1):
+                    self._part_prefix.setdefault(part[:end], []).append(player_id)
+
+        # Sort every bucket once so lookups are a dict access plus a slice
+        for table in (self._exact, self._normalized, self._last_name, self._first_name,
+                      self._prefix, self._part_prefix):
+            for key, ids in table.items():
+                table[key] = sorted(set(ids), key=self._tiebreak)
+
+    @classmethod
+    def from_names(cls, names):
+        """Index over plain names; ids are list positions and earlier names win ties"""
+        return cls([{'id': i, 'full_name': name, 'is_active': True, 'rank': i} for i, name in enumerate(names)])
+
+    def _tiebreak(self, player_id):
+        """Deterministic order within a tier: active, explicit rank, most recent id, name"""
+        player = self.players[player_id]
+        return (not player.get('is_active', False), player.get('rank', 0), -player_id, player['full_name'])
+
+    def _tiers(self, name):
+        """(tier, ids) pairs for every constant-time table that matches name"""
+        normalized = normalize_name(name)
+        return [
+            (EXACT, self._exact.get(name, [])),
+            (NORMALIZED, self._normalized.get(normalized, [])),
+            (LAST_NAME, self._last_name.get(normalized, [])),
+            (FIRST_NAME, self._first_name.get(normalized, [])),
+            (PREFIX, self._prefix.get(normalized, [])),
+            (PART_PREFIX, self._part_prefix.get(normalized, [])),
+        ]
+
+    def lookup(self, name):
+        """
+        Best match for a name, or None
+
+        Only falls back to a substring scan when no constant-time tier
+        matches (the behaviour of the old linear lookup).
+        """
+        for _, ids in self._tiers(name):
+            if ids:
+                return self.players[ids[0]]
+        matches = self._substring_matches(normalize_name(name))
+        return self.players[matches[0]] if matches else None
+
+    def get_id(self, name):
+        """Player id of the best match, or None"""
+        player = self.lookup(name)
+        return player['id'] if player else None
+
+    def search(self, term, limit=None):
+        """
+        Every player matching term, best match first
+
+        Returns:
+            list of player dicts ordered by match tier, then tiebreak
+        """
+        ordered = []
+        seen = set()
+        for _, ids in self._tiers(term):
+            for player_id in ids:
+                if player_id not in seen:
+                    seen.add(player_id)
+                    ordered.append(player_id)
+        for player_id in self._substring_matches(normalize_name(term)):
+            if player_id not in seen:
+                seen.add(player_id)
+                ordered.append(player_id)
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [self.players[player_id] for player_id in ordered]
+
+    def _substring_matches(self, normalized):
+        """Linear substring fallback over normalized names"""
+        if not normalized:
+            return []
+        ids = [player_id for key, bucket in self._normalized.items() if normalized in key for player_id in bucket]
+        return sorted(set(ids), key=self._tiebreak)
+
+    def save(self, path):
+        """Pickle the built tables so other processes can load them directly"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            # Plain dicts only, so the file loads whichever way this module was imported
+            pickle.dump(self.__dict__, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved index, or None if it is missing or unreadable"""
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception:
+            return None
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
+
+
+def player_list_digest(players):
+    """Hash of every field the index and its tiebreak depend on (id, name, active, rank)"""
+    key = sorted(
+        (player['id'], player['full_name'], bool(player.get('is_active', False)), player.get('rank', 0))
+        for player in players
+    )
+    return hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+
+
+def load_or_build_index(players, path=DEFAULT_INDEX_PATH):
+    """The pickled index at path if it was built from exactly these players, else a rebuilt (and saved) one"""
+    index = PlayerIndex.load(path)
+    if index is None or getattr(index, 'source_digest', None) != player_list_digest(players):
+        index = PlayerIndex(players)
+        try:
+            index.save(path)
+        except OSError:
+            pass
+    return index
+
+
+_PLAYER_INDEX = None
+_PLAYER_INDEX_LOCK = threading.Lock()
+
+
+def get_player_index(path=DEFAULT_INDEX_PATH):
+    """
+    Process-wide index over nba_api's static player list
+
+    Loaded from the on-disk pickle when it matches the installed player list,
+    otherwise built once and saved for the next process. Returns None when
+    nba_api is not installed (and no replay fixtures stand in for it); a
+    replay run without a recorded player list raises FixtureNotFoundError.
+    Concurrent first callers (e.g. prefetch threads) wait for one build.
+    """
+    global _PLAYER_INDEX
+    if _PLAYER_INDEX is not None:
+        return _PLAYER_INDEX
+
+    def request_players():
+        from nba_api.stats.static import players
+        return players.get_players()
+
+    with _PLAYER_INDEX_LOCK:
+        if _PLAYER_INDEX is not None:
+            return _PLAYER_INDEX
+        try:
+            all_players = get_replay_transport().call('players', {}, request_players)
+        except FixtureNotFoundError:
+            # A replay run missing its fixture should fail, not silently lose every player
+            raise
+        except (ImportError, LookupError, OSError):
+            return None
+
+        _PLAYER_INDEX = load_or_build_index(all_players, path)
+        return _PLAYER_INDEX
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Rate limiting and retry helpers for outbound API calls
+- TokenBucket: thread-safe token bucket shared by every caller of an API;
+  reserve() never blocks, so the same bucket works from threads (acquire)
+  and asyncio code (acquire_async)
+- call_with_retry: bounded retries with full-jitter exponential backoff
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate: float, sustained requests per second
+            capacity: float, burst size (defaults to max(1, rate))
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens now and return how long the caller must wait before using them
+
+        Never blocks: the balance may go negative, which queues later callers
+        behind this one in reservation order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self, tokens=1):
+        """Take tokens only if they are available right now"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1):
+        """Wait (blocking this thread only) until tokens are available"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens=1):
+        """Wait without blocking the event loop until tokens are available"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def backoff_delay(attempt, base_delay=0.5, max_delay=8.0, rng=random):
+    """Full-jitter exponential backoff: uniform(0, min(max_delay, base_delay * 2**attempt))"""
+    return rng.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retry(fn, attempts=3, base_delay=0.5, max_delay=8.0,
+                    retry_on=(Exception,), limiter=None):
+    """
+    Call fn(), retrying failures with jittered exponential backoff
+
+    Args:
+        fn: zero-argument callable
+        attempts: int, total tries (1 = no retry)
+        base_delay / max_delay: float seconds for the backoff schedule
+        retry_on: exception types that trigger a retry
+        limiter: optional TokenBucket acquired before every try
+
+    Returns:
+        fn()'s result; the last exception is re-raised once attempts run out
+    """
+    for attempt in range(attempts):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fn()
+        except retry_on:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(backoff_delay(attempt, base_delay, max_delay))
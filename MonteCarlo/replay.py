@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Record / replay stand-in for the live data services (nba_api, Sportradar)
+- 'record': every live call runs normally and its response is written to a
+  JSON fixture keyed by (namespace, request parameters)
+- 'replay': responses come from the fixtures only - no network and no
+  nba_api install needed - with optional injected latency and errors
+- 'off' (default): calls go straight to the live service
+- Configured from SPORTS_MARKET_REPLAY_MODE / SPORTS_MARKET_REPLAY_DIR /
+  SPORTS_MARKET_REPLAY_LATENCY (seconds) / SPORTS_MARKET_REPLAY_ERROR_RATE,
+  or programmatically with set_replay_transport()
+- Injected latency and errors come from a seeded generator, so load tests
+  replay identically in CI and on air-gapped machines
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+try:
+    from requests.exceptions import ConnectionError as _TransportError
+except ImportError:
+    _TransportError = ConnectionError
+
+# MonteCarlo modules fall back to top-level imports (from replay import ...)
+# when run from inside the folder, which would load this file a second time
+# with its own _TRANSPORT; whichever copy loads second hands back the first
+_OTHER_NAME = {'MonteCarlo.replay': 'replay', 'replay': 'MonteCarlo.replay'}.get(__name__)
+_LOADED = sys.modules.get(_OTHER_NAME) if _OTHER_NAME else None
+if _LOADED is not None and os.path.abspath(getattr(_LOADED, '__file__', '')) == os.path.abspath(__file__):
+    sys.modules[__name__] = _LOADED
+
+REPLAY_MODES = ('off', 'record', 'replay')
+
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class ReplayInjectedError(_TransportError):
+    """Transport failure injected by the replay stand-in (looks like a dropped connection)"""
+
+
+class FixtureNotFoundError(LookupError):
+    """Replay mode was asked for a request that was never recorded"""
+
+
+def frame_to_payload(frame):
+    """JSON-safe payload for a pandas DataFrame response"""
+    return json.loads(frame.to_json(orient='split', date_format='iso'))
+
+
+def frame_from_payload(payload):
+    """DataFrame back from frame_to_payload's output"""
+    import pandas as pd
+    return pd.DataFrame(payload['data'], index=payload['index'], columns=payload['columns'])
+
+
+class ReplayTransport:
+    """Routes service calls to the live function, a recorder, or recorded fixtures"""
+
+    def __init__(self, mode='off', fixture_dir=DEFAULT_FIXTURE_DIR, latency=0.0,
+                 latency_jitter=0.0, error_rate=0.0, seed=0):
+        """
+        Args:
+            mode: 'off', 'record' or 'replay'
+            fixture_dir: str, directory holding one sub-directory per namespace
+            latency: float seconds added to every replayed call
+            latency_jitter: float seconds, replayed latency varies uniformly by +/- this
+            error_rate: float in [0, 1], share of replayed calls that fail
+            seed: int, seeds the latency / error draws
+        """
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unknown replay mode '{mode}', expected one of {REPLAY_MODES}")
+        self.mode = mode
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        """True when calls may be answered without the live service"""
+        return self.mode == 'replay'
+
+    def _fixture_path(self, namespace, params):
+        key = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.fixture_dir, namespace, f"{digest}.json")
+
+    def call(self, namespace, params, live_fn, encode=None, decode=None):
+        """
+        Answer one service call
+
+        Args:
+            namespace: str, service/endpoint name (fixture sub-directory)
+            params: JSON-serializable dict identifying the request
+            live_fn: zero-argument callable performing the real call
+            encode / decode: optional converters between the live response
+                and a JSON-safe payload (e.g. frame_to_payload / frame_from_payload)
+
+        Returns:
+            the live or replayed response
+        """
+        if self.mode == 'off':
+            return live_fn()
+
+        path = self._fixture_path(namespace, params)
+        if self.mode == 'record':
+            response = live_fn()
+            payload = encode(response) if encode else response
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'namespace': namespace, 'params': params, 'payload': payload}, f, default=str)
+            os.replace(tmp_path, path)
+            return response
+
+        # Replay: injected latency and failures first, then the fixture
+        with self._lock:
+            delay = self.latency + self._rng.uniform(-self.latency_jitter, self.latency_jitter)
+            fail = self._rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            raise ReplayInjectedError(f"Injected failure for {namespace} {params}")
+
+        try:
+            with open(path) as f:
+                payload = json.load(f)['payload']
+        except FileNotFoundError:
+            raise FixtureNotFoundError(f"No recorded response for {namespace} {params}")
+        return decode(payload) if decode else payload
+
+
+_TRANSPORT = None
+
+
+def get_replay_transport():
+    """Process-wide transport, configured from the environment on first use"""
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        _TRANSPORT = ReplayTransport(
+            mode=os.environ.get('SPORTS_MARKET_REPLAY_MODE', 'off'),
+            fixture_dir=os.environ.get('SPORTS_MARKET_REPLAY_DIR', DEFAULT_FIXTURE_DIR),
+            latency=float(os.environ.get('SPORTS_MARKET_REPLAY_LATENCY', 0.0)),
+            error_rate=float(os.environ.get('SPORTS_MARKET_REPLAY_ERROR_RATE', 0.0)),
+            seed=int(os.environ.get('SPORTS_MARKET_REPLAY_SEED', 0))
+        )
+    return _TRANSPORT
+
+
+def set_replay_transport(transport):
+    """Install a transport for the whole process (e.g. replay with injected latency)"""
+    global _TRANSPORT
+    _TRANSPORT = transport
+    return transport
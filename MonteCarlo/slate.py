@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Slate-level batch projections
+- Projects many (player, opponent, date) matchups in one call
+- Game logs, rest lookups and injury context are fetched once per
+  player/season and team/date across the whole slate
+- All simulations run as stacked array computations, chunked to bound memory
+- Counting stats are summarized from per-request integer histograms
+"""
+
+import numpy as np
+
+try:
+    from .draw_engine import PERCENTILE_LEVELS, run_stacked_joint_draws
+    from .histogram import summarize_rows
+    from .training_set import MARKET_STATS
+except ImportError:
+    from draw_engine import PERCENTILE_LEVELS, run_stacked_joint_draws
+    from histogram import summarize_rows
+    from training_set import MARKET_STATS
+
+# Upper bound on simulated values held in memory per stacked chunk
+MAX_CHUNK_ELEMENTS = 5_000_000
+
+
+def project_slate(simulator, requests, n_simulations=10000, rng=None):
+    """
+    Project a whole slate of matchups with one batched simulation
+
+    Args:
+        simulator: EnhancedNBAMonteCarloSimulator (provides data and context)
+        requests: list of dicts with 'player_name', 'opponent_team',
+            'game_date' and optionally 'player_team'
+        n_simulations: int, draws per request
+        rng: numpy Generator or the np.random module (default); drives both
+            the context rolls and the draws, so a seeded Generator reproduces
+            the whole slate
+
+    Returns:
+        dict of columnar results, one entry per request in input order:
+            'requests': the input requests
+            'valid': bool array, False where no projection could be made
+            'total_adjustment': float array of contextual adjustments
+            'adjustments': list of adjustment dicts (None when invalid)
+            'stats': stat -> {'mean', 'std', '5th' ... '95th'} arrays (NaN when invalid)
+    """
+    n_requests = len(requests)
+    log_cache = {}
+    injury_cache = {}
+
+    valid = np.zeros(n_requests, dtype=bool)
+    total_adjustment = np.full(n_requests, np.nan)
+    adjustments_list = [None] * n_requests
+    training_sets = []
+    locations = []
+    valid_indices = []
+
+    # Shared data and context for every request
+    for i, request in enumerate(requests):
+        player_name = request['player_name']
+        opponent_team = request['opponent_team']
+        game_date = request['game_date']
+        player_team = request.get('player_team')
+
+        training_set = simulator._load_training_set(
+            player_name, opponent_team, game_date, stats=MARKET_STATS, log_cache=log_cache
+        )
+        if training_set is None:
+            continue
+
+        location = simulator._game_location(player_team, opponent_team)
+        adjustments = simulator.calculate_contextual_adjustments(
+            player_name, player_team, opponent_team, game_date, location,
+            log_cache=log_cache, injury_cache=injury_cache, rng=rng
+        )
+
+        valid[i] = True
+        total_adjustment[i] = adjustments['total_adjustment']
+        adjustments_list[i] = adjustments
+        training_sets.append(training_set)
+        locations.append(location)
+        valid_indices.append(i)
+
+    summary_keys = list(PERCENTILE_LEVELS) + ['mean', 'std']
+    stats = {stat: {key: np.full(n_requests, np.nan) for key in summary_keys} for stat in MARKET_STATS}
+
+    # Stacked simulation, chunked so a chunk holds at most MAX_CHUNK_ELEMENTS values
+    chunk_size = max(1, MAX_CHUNK_ELEMENTS // max(1, n_simulations * len(MARKET_STATS)))
+    for start in range(0, len(training_sets), chunk_size):
+        chunk_sets = training_sets[start:start + chunk_size]
+        chunk_indices = valid_indices[start:start + chunk_size]
+        draws = run_stacked_joint_draws(
+            chunk_sets, n_simulations, total_adjustment[chunk_indices], rng=rng
+        )
+
+        # Opponent adjustments (from original algorithm), one request at a time
+        for row, i in enumerate(chunk_indices):
+            request_draws = {stat: draws[stat][row] for stat in draws}
+            adjusted = simulator.adjust_for_opponent(
+                request_draws, requests[i]['opponent_team'], locations[start + row]
+            )
+            for stat in draws:
+                draws[stat][row] = adjusted[stat]
+
+        for stat, values in draws.items():
+            for key, column in summarize_rows(values).items():
+                stats[stat][key][chunk_indices] = column
+
+    return {
+        'requests': requests,
+        'valid': valid,
+        'total_adjustment': total_adjustment,
+        'adjustments': adjustments_list,
+        'stats': stats
+    }
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Streaming Monte Carlo accumulation
+- Draws are generated in fixed-size chunks and folded into an online
+  accumulator, so memory stays constant however many simulations run
+- Moments use Welford's algorithm (Chan et al. pairwise merge for shards)
+- Percentiles come from a mergeable IntegerHistogram; float stats such as
+  TS% are binned at a fixed resolution before counting
+- Accumulators from parallel shards merge exactly into one result
+"""
+
+import numpy as np
+
+try:
+    from .histogram import IntegerHistogram
+    from .draw_engine import PERCENTILE_LEVELS, RATE_STATS
+except ImportError:
+    from histogram import IntegerHistogram
+    from draw_engine import PERCENTILE_LEVELS, RATE_STATS
+
+# Draws generated per chunk in streaming mode
+DEFAULT_CHUNK_SIZE = 10000
+
+# Bin width used to histogram float (rate) stats
+RATE_STAT_RESOLUTION = 0.001
+
+
+class StatAccumulator:
+    """Online moments and histogram of one stat's draws"""
+
+    def __init__(self, resolution=None):
+        """
+        Args:
+            resolution: None for integer stats, else the bin width used to
+                histogram float draws (percentiles are exact to within it)
+        """
+        self.resolution = resolution
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.histogram = IntegerHistogram()
+
+    def update(self, values):
+        """
+        Fold a chunk of draws into the moments and the histogram
+
+        Integer stats scaled by a float multiplier (e.g. scale_draws) are
+        rounded to whole numbers first, so the moments and the percentiles
+        describe the same values.
+        """
+        values = np.asarray(values).ravel()
+        if values.size == 0:
+            return self
+        if self.resolution is None and not np.issubdtype(values.dtype, np.integer):
+            values = np.rint(values)
+
+        # Welford update with a whole chunk (Chan et al. combination)
+        n_chunk = values.size
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        self._combine(n_chunk, chunk_mean, chunk_m2)
+
+        if self.resolution is None:
+            self.histogram.update(values)
+        else:
+            self.histogram.update(np.rint(np.maximum(values, 0) / self.resolution))
+        return self
+
+    def _combine(self, n_other, mean_other, m2_other):
+        """Combine running moments with another set of moments"""
+        n_total = self.n + n_other
+        delta = mean_other - self.mean
+        self.mean += delta * n_other / n_total
+        self.m2 += m2_other + delta * delta * self.n * n_other / n_total
+        self.n = n_total
+
+    def merge(self, other):
+        """Merge another accumulator of the same stat into this one"""
+        if other.n:
+            self._combine(other.n, other.mean, other.m2)
+            self.histogram.merge(other.histogram)
+        return self
+
+    def std(self):
+        """Population standard deviation (as np.std)"""
+        return float(np.sqrt(self.m2 / self.n)) if self.n else np.nan
+
+    def summary(self):
+        """Percentile bands, mean and std (calculate_enhanced_percentiles keys)"""
+        levels = self.histogram.percentiles(list(PERCENTILE_LEVELS.values()))
+        if self.resolution is not None:
+            levels = levels * self.resolution
+        summary = {key: float(levels[i]) for i, key in enumerate(PERCENTILE_LEVELS)}
+        summary['mean'] = self.mean if self.n else np.nan
+        summary['std'] = self.std()
+        return summary
+
+
+class StreamingAccumulator:
+    """Per-stat online accumulators for a whole simulation"""
+
+    def __init__(self, stats):
+        """
+        Args:
+            stats: stats being simulated (rate stats get a binned histogram)
+        """
+        self.stats = {
+            stat: StatAccumulator(RATE_STAT_RESOLUTION if stat in RATE_STATS else None)
+            for stat in stats
+        }
+
+    @property
+    def n(self):
+        """Number of simulations accumulated"""
+        return next(iter(self.stats.values())).n if self.stats else 0
+
+    def update(self, draws):
+        """Fold a chunk of draws (dict of stat -> array) into the accumulators"""
+        for stat, values in draws.items():
+            self.stats[stat].update(values)
+        return self
+
+    def merge(self, other):
+        """Merge another accumulator (e.g. from a parallel shard) into this one"""
+        for stat, accumulator in other.stats.items():
+            self.stats[stat].merge(accumulator)
+        return self
+
+    def summary(self):
+        """Per-stat percentile bands, mean and std"""
+        return {stat: accumulator.summary() for stat, accumulator in self.stats.items()}
+
+
+def run_streaming_draws(draw_batch, n_simulations, stats, chunk_size=DEFAULT_CHUNK_SIZE,
+                        transform=None):
+    """
+    Run n_simulations draws chunk by chunk into a StreamingAccumulator
+
+    Args:
+        draw_batch: callable(n) -> dict of stat -> array of n draws
+        n_simulations: int, total number of simulations
+        stats: stats produced by draw_batch
+        chunk_size: int, draws held in memory at once
+        transform: optional callable applied to each chunk's draws before
+            accumulation (e.g. the opponent adjustment)
+
+    Returns:
+        StreamingAccumulator holding every draw's moments and histogram
+    """
+    accumulator = StreamingAccumulator(stats)
+    remaining = n_simulations
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        draws = draw_batch(n)
+        if transform is not None:
+            draws = transform(draws)
+        accumulator.update(draws)
+        remaining -= n
+    return accumulator
+
+
+def scale_draws(draws, multipliers):
+    """
+    Scale each stat's draws by a precomputed multiplier (stats without one pass through)
+
+    A module-level function, so partial(scale_draws, multipliers=...) is a
+    picklable chunk transform for worker processes.
+    """
+    return {stat: values * multipliers[stat] if stat in multipliers else values
+            for stat, values in draws.items()}
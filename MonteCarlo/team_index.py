@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Team identity resolver
+- Every NBA team has one canonical ID (its current three-letter abbreviation)
+- Names, cities, nicknames, abbreviations (including historical and
+  broadcast variants such as 'PHO', 'GS', 'NOH') resolve to that ID with one
+  dict lookup on the normalized string, built once at import
+- Ambiguous aliases are never indexed: 'LA' / 'Los Angeles' alone (Lakers
+  or Clippers) don't resolve, so the two teams can't collide
+- MATCHUP strings ('LAL vs. NOP', 'LAL @ PHX') parse into team IDs directly
+"""
+
+try:
+    from .player_index import normalize_name
+except ImportError:
+    from player_index import normalize_name
+
+# (canonical ID, city, nickname, extra aliases)
+NBA_TEAMS = (
+    ('ATL', 'Atlanta', 'Hawks', ()),
+    ('BOS', 'Boston', 'Celtics', ()),
+    ('BKN', 'Brooklyn', 'Nets', ('BRK', 'NJN', 'New Jersey Nets')),
+    ('CHA', 'Charlotte', 'Hornets', ('CHO', 'CHH', 'Charlotte Bobcats', 'Bobcats')),
+    ('CHI', 'Chicago', 'Bulls', ()),
+    ('CLE', 'Cleveland', 'Cavaliers', ('Cavs',)),
+    ('DAL', 'Dallas', 'Mavericks', ('Mavs',)),
+    ('DEN', 'Denver', 'Nuggets', ()),
+    ('DET', 'Detroit', 'Pistons', ()),
+    ('GSW', 'Golden State', 'Warriors', ('GS',)),
+    ('HOU', 'Houston', 'Rockets', ()),
+    ('IND', 'Indiana', 'Pacers', ()),
+    ('LAC', 'LA', 'Clippers', ('Los Angeles Clippers',)),
+    ('LAL', 'Los Angeles', 'Lakers', ('LA Lakers',)),
+    ('MEM', 'Memphis', 'Grizzlies', ()),
+    ('MIA', 'Miami', 'Heat', ()),
+    ('MIL', 'Milwaukee', 'Bucks', ()),
+    ('MIN', 'Minnesota', 'Timberwolves', ('Wolves',)),
+    ('NOP', 'New Orleans', 'Pelicans', ('NO', 'NOH', 'NOK', 'New Orleans Hornets')),
+    ('NYK', 'New York', 'Knicks', ('NY',)),
+    ('OKC', 'Oklahoma City', 'Thunder', ('OKL',)),
+    ('ORL', 'Orlando', 'Magic', ()),
+    ('PHI', 'Philadelphia', '76ers', ('Sixers',)),
+    ('PHX', 'Phoenix', 'Suns', ('PHO',)),
+    ('POR', 'Portland', 'Trail Blazers', ('Blazers',)),
+    ('SAC', 'Sacramento', 'Kings', ()),
+    ('SAS', 'San Antonio', 'Spurs', ('SA',)),
+    ('TOR', 'Toronto', 'Raptors', ()),
+    ('UTA', 'Utah', 'Jazz', ('UTAH',)),
+    ('WAS', 'Washington', 'Wizards', ('WSH',)),
+)
+
+# Cities shared by more than one team; only their full names resolve
+_SHARED_CITIES = ('LA', 'Los Angeles')
+
+
+class TeamIndex:
+    """Alias -> canonical team ID lookups over a fixed team table"""
+
+    def __init__(self, teams=NBA_TEAMS):
+        """
+        Args:
+            teams: tuple of (team_id, city, nickname, aliases) rows
+        """
+        self.teams = {team_id: {'id': team_id, 'city': city, 'nickname': nickname}
+                      for team_id, city, nickname, _ in teams}
+        shared = {normalize_name(city) for city in _SHARED_CITIES}
+        self._aliases = {}
+        for team_id, city, nickname, aliases in teams:
+            names = [team_id, nickname, f"{city} {nickname}", *aliases]
+            if normalize_name(city) not in shared:
+                names.append(city)
+            for name in names:
+                self._aliases[normalize_name(name)] = team_id
+        # A player's season has only ~30 distinct MATCHUP strings
+        self._matchups = {}
+
+    def resolve(self, name):
+        """Canonical team ID for any known alias, or None (unknown or ambiguous)"""
+        if not name:
+            return None
+        return self._aliases.get(normalize_name(name))
+
+    def same_team(self, first, second):
+        """True when both names resolve to the same team"""
+        team_id = self.resolve(first)
+        return team_id is not None and team_id == self.resolve(second)
+
+    def nickname(self, team_id):
+        """Display nickname for a canonical ID ('LAL' -> 'Lakers')"""
+        return self.teams[team_id]['nickname']
+
+    def nicknames(self):
+        """Every team's nickname, in table order (for pickers)"""
+        return [team['nickname'] for team in self.teams.values()]
+
+    def parse_matchup(self, matchup):
+        """
+        Team IDs from an nba_api MATCHUP string
+
+        Returns:
+            (team_id, opponent_id, is_home) - 'LAL vs. NOP' is a home game,
+            'LAL @ PHX' an away game; (None, None, None) if unparseable
+        """
+        if not isinstance(matchup, str):
+            return None, None, None
+        parsed = self._matchups.get(matchup)
+        if parsed is None:
+            parsed = (None, None, None)
+            for separator, is_home in ((' vs. ', True), (' @ ', False)):
+                if separator in matchup:
+                    team, opponent = matchup.split(separator, 1)
+                    parsed = (self.resolve(team), self.resolve(opponent), is_home)
+                    break
+            self._matchups[matchup] = parsed
+        return parsed
+
+    def matchup_opponents(self, matchups):
+        """Opponent team ID for each MATCHUP string (None where unparseable)"""
+        return [self.parse_matchup(matchup)[1] for matchup in matchups]
+
+    def faces_opponent(self, matchups, opponent):
+        """
+        For each MATCHUP string, whether the game was against opponent
+
+        Args:
+            matchups: iterable of MATCHUP strings
+            opponent: any team alias; names the index can't resolve fall back
+                to a case-insensitive substring test
+
+        Returns:
+            list of bools
+        """
+        opponent_id = self.resolve(opponent)
+        if opponent_id is None:
+            needle = str(opponent).upper()
+            return [needle in str(matchup).upper() for matchup in matchups]
+        return [opponent_id == team_id for team_id in self.matchup_opponents(matchups)]
+
+
+TEAM_INDEX = TeamIndex()
+
+
+def resolve_team(name):
+    """Canonical team ID for a name/city/abbreviation via the shared index"""
+    return TEAM_INDEX.resolve(name)
+
+
+def same_team(first, second):
+    """True when both names resolve to the same team"""
+    return TEAM_INDEX.same_team(first, second)
+
+
+def team_nickname(name):
+    """Display nickname for any alias, or the name itself when it doesn't resolve"""
+    team_id = TEAM_INDEX.resolve(name)
+    return TEAM_INDEX.nickname(team_id) if team_id else name
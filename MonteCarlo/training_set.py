@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Weighted Monte Carlo training set
+- One row per unique historical game plus a sampling weight per game
+- Replaces replicating each game up to ~6 times into Python lists
+- Supports the legacy integer weights or exact fractional decay weights
+- Can carry the full 7-stat market vector so whole game rows are resampled
+- game_log_matrix is the shared, vectorized game-log -> stat matrix step
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .team_index import TEAM_INDEX
+except ImportError:
+    from team_index import TEAM_INDEX
+
+# Default recency decay: weight = 5 * exp(-days_ago / 30)
+DEFAULT_DECAY_DAYS = 30
+CURRENT_SEASON_WEIGHT = 5
+LAST_SEASON_WEIGHT = 2
+LAST_SEASON_START = pd.Timestamp('2023-10-01')
+
+# Full stat vector consumed by the intragame algorithm, in tuple order
+MARKET_STATS = ('PTS', 'REB', 'AST', 'TO', 'STOCKS', '3PM', 'TS%')
+
+
+# Raw nba_api box-score columns the market stats are derived from
+RAW_LOG_COLUMNS = ('PTS', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'FG3M', 'FGA', 'FTA')
+
+
+def _raw_log_columns(game_logs):
+    """Every raw column as a float array in one conversion (missing values/columns are 0)"""
+    names = list(RAW_LOG_COLUMNS) + (['TS_PCT'] if 'TS_PCT' in game_logs else [])
+    raw = game_logs.reindex(columns=names, fill_value=0).to_numpy(dtype=float, na_value=0.0)
+    return dict(zip(names, raw.T))
+
+
+def _stat_from_columns(columns, stat):
+    """Market stat values from raw column arrays (STOCKS, TS% with zero-attempt guard)"""
+    if stat == 'TO':
+        return columns['TOV']
+    if stat == 'STOCKS':
+        return columns['STL'] + columns['BLK']
+    if stat == '3PM':
+        return columns['FG3M']
+    if stat == 'TS%':
+        if 'TS_PCT' in columns:
+            return columns['TS_PCT']
+        attempts = columns['FGA'] + 0.44 * columns['FTA']
+        points = columns['PTS']
+        return np.divide(points, 2 * attempts, out=np.zeros_like(points), where=attempts > 0)
+    return columns[stat]
+
+
+def game_log_stat_values(game_logs, stat):
+    """Per-game values of a market stat from an nba_api game log frame"""
+    return _stat_from_columns(_raw_log_columns(game_logs), stat)
+
+
+def game_log_matrix(game_logs, stats=MARKET_STATS):
+    """
+    Normalize an nba_api game log frame to a (games, len(stats)) float matrix
+
+    The raw columns are converted to floats once, then every stat is column
+    arithmetic (STOCKS = STL + BLK, TS% with a zero-attempt guard); the
+    canonical 7-stat market matrix by default.
+    """
+    if game_logs is None or len(game_logs) == 0:
+        return np.empty((0, len(stats)))
+    columns = _raw_log_columns(game_logs)
+    return np.column_stack([_stat_from_columns(columns, stat) for stat in stats])
+
+
+class WeightedTrainingSet:
+    """Unique historical games with per-game sampling weights"""
+
+    def __init__(self, values, weights):
+        """
+        Args:
+            values: dict of stat -> array of per-game values (one entry per game)
+            weights: array of per-game weights (same length as each value array)
+        """
+        self.values = {stat: np.asarray(v, dtype=float) for stat, v in values.items()}
+        self.weights = np.asarray(weights, dtype=float)
+
+    @classmethod
+    def from_game_logs(cls, current_season_logs, last_season_logs, game_date, opponent_team,
+                       stats=('PTS', 'REB', 'AST'), exact_weights=False, recency_half_life=None):
+        """
+        Build the training set from game logs already filtered to before game_date
+
+        Args:
+            current_season_logs: DataFrame or None
+            last_season_logs: DataFrame or None
+            game_date: date of the projected game
+            opponent_team: str, opponent (games against them get a 1.2x weight)
+            stats: market stats to keep (PTS/REB/AST by default, MARKET_STATS for joint runs)
+            exact_weights: bool, keep fractional decay weights instead of
+                truncating them to integers (with a floor of 1)
+            recency_half_life: optional float, half-life in days for the recency
+                decay (default decay constant is 30 days)
+        """
+        game_date = pd.to_datetime(game_date)
+        decay_days = DEFAULT_DECAY_DAYS if recency_half_life is None else recency_half_life / np.log(2)
+
+        frames = []
+        weight_parts = []
+
+        # Current season data with exponential decay weighting
+        if current_season_logs is not None and len(current_season_logs) > 0:
+            days_ago = (game_date - current_season_logs['GAME_DATE']).dt.days.to_numpy()
+            weight = np.exp(-days_ago / decay_days) * CURRENT_SEASON_WEIGHT
+
+            context_multiplier = np.where(days_ago <= 1, 0.9, 1.0)
+            if 'MATCHUP' in current_season_logs:
+                vs_opponent = np.asarray(
+                    TEAM_INDEX.faces_opponent(current_season_logs['MATCHUP'], opponent_team), dtype=bool
+                )
+                context_multiplier = context_multiplier * np.where(vs_opponent, 1.2, 1.0)
+
+            if exact_weights:
+                final_weight = weight * context_multiplier
+            else:
+                weight = np.maximum(1, weight.astype(np.int64))
+                final_weight = np.maximum(1, (weight * context_multiplier).astype(np.int64))
+
+            frames.append(current_season_logs)
+            weight_parts.append(final_weight)
+
+        # Last season data with reduced weight
+        if last_season_logs is not None and len(last_season_logs) > 0:
+            estimated_days_ago = 365 + (game_date - LAST_SEASON_START).days
+            weight = np.exp(-estimated_days_ago / 365) * LAST_SEASON_WEIGHT
+            if not exact_weights:
+                weight = max(1, int(weight))
+
+            frames.append(last_season_logs)
+            weight_parts.append(np.full(len(last_season_logs), weight, dtype=float))
+
+        matrix = np.vstack([game_log_matrix(frame, stats) for frame in frames]) if frames \
+            else np.empty((0, len(stats)))
+        values = {stat: matrix[:, col] for col, stat in enumerate(stats)}
+        weights = np.concatenate(weight_parts) if weight_parts else np.empty(0)
+        return cls(values, weights)
+
+    def is_empty(self):
+        """True when there are no games to sample from"""
+        return len(self.weights) == 0 or self.weights.sum() <= 0
+
+    def n_games(self):
+        """Number of unique games in the training set"""
+        return len(self.weights)
+
+    def total_weight(self):
+        """Total weight (equals the old replicated list length for integer weights)"""
+        total = self.weights.sum()
+        return int(total) if float(total).is_integer() else float(total)
+
+    def weighted_mean(self, stat):
+        """Weighted mean of a stat over all games"""
+        if self.is_empty():
+            return 0.0
+        return float(np.average(self.values[stat], weights=self.weights))
+
+    def sampling_distribution(self, stat):
+        """
+        Positive values of a stat and their sampling probabilities
+
+        Returns:
+            (values, probabilities) - both empty if the stat is never positive
+        """
+        values = self.values[stat]
+        mask = values > 0
+        weights = self.weights[mask]
+        if weights.sum() <= 0:
+            return np.empty(0), np.empty(0)
+        return values[mask], weights / weights.sum()
+
+    def stat_matrix(self):
+        """(games, stats) matrix of every stat, columns in self.values order"""
+        return np.column_stack([self.values[stat] for stat in self.values])
+
+    def joint_sampling_distribution(self):
+        """
+        Whole-game rows and their sampling probabilities for joint draws
+
+        Rows with no production at all (e.g. DNPs) are excluded; zero values
+        in individual stats are kept so the stat correlations stay intact.
+
+        Returns:
+            (row_indices, probabilities) - both empty if no row qualifies
+        """
+        if self.n_games() == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        mask = (self.stat_matrix() > 0).any(axis=1)
+        weights = self.weights[mask]
+        if weights.sum() <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        return np.flatnonzero(mask), weights / weights.sum()
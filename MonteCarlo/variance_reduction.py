@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Variance-reduction sampling for the Monte Carlo draw engine
+- Every draw is driven by uniforms: one column picks the historical game
+  (inverse CDF over games sorted by value), the others become normal noise
+- 'iid': independent uniforms (plain Monte Carlo)
+- 'antithetic': each uniform row u is paired with 1 - u, so game picks and
+  normal noise come in mirrored pairs
+- 'stratified': Latin hypercube - every column has exactly one draw in
+  each of n equal-probability strata
+- 'sobol': scrambled Sobol quasi-random points (scipy.stats.qmc)
+"""
+
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+SAMPLING_MODES = ('iid', 'antithetic', 'stratified', 'sobol')
+
+# Keeps uniforms strictly inside (0, 1) before the normal inverse CDF
+_UNIFORM_EPS = 1e-12
+
+
+def _generator(rng):
+    """numpy Generator from a Generator or the np.random module"""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(int(rng.random() * 2**32))
+
+
+def uniform_matrix(sampling, n_simulations, dims, rng=None):
+    """
+    (n_simulations, dims) uniforms in (0, 1) for the chosen sampling mode
+
+    Args:
+        sampling: one of SAMPLING_MODES
+        n_simulations: int, number of rows
+        dims: int, number of uniform columns per draw
+        rng: numpy Generator or the np.random module (default)
+    """
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode '{sampling}', expected one of {SAMPLING_MODES}")
+    if rng is None:
+        rng = np.random
+
+    if sampling == 'antithetic':
+        half = rng.random(((n_simulations + 1) // 2, dims))
+        u = np.vstack([half, 1 - half])[:n_simulations]
+    elif sampling == 'stratified':
+        generator = _generator(rng)
+        strata = np.argsort(generator.random((n_simulations, dims)), axis=0)
+        u = (strata + generator.random((n_simulations, dims))) / n_simulations
+    elif sampling == 'sobol':
+        # Balance properties hold for powers of two, so draw the next one up
+        engine = qmc.Sobol(d=dims, scramble=True, seed=_generator(rng))
+        m = max(0, int(np.ceil(np.log2(max(n_simulations, 1)))))
+        u = engine.random_base2(m)[:n_simulations]
+    else:
+        u = rng.random((n_simulations, dims))
+
+    return np.clip(u, _UNIFORM_EPS, 1 - _UNIFORM_EPS)
+
+
+def sorted_inverse_cdf(sort_key, probabilities, u):
+    """
+    Indices into the original arrays picked by inverse CDF over sort_key order
+
+    Sorting by value first makes the pick monotone in u, which is what lets
+    stratified, antithetic and quasi-random uniforms reduce variance.
+    """
+    order = np.argsort(sort_key, kind='stable')
+    cdf = np.cumsum(probabilities[order])
+    cdf[-1] = 1.0
+    return order[np.minimum(np.searchsorted(cdf, u, side='right'), len(order) - 1)]
+
+
+def normal_scores(u):
+    """Standard normal variates from uniforms (inverse normal CDF)"""
+    return ndtri(u)
@@ -14,6 +14,7 @@ from Core.base_price_algorithm import BasePriceAlgorithm
 from Core.intragame_algorithm_real import IntragameAlgorithmReal
 from Core.timeframe_algorithm import TimeframeAlgorithm
 from Data.nba_data_bridge import NBADataBridge
+from MonteCarlo.team_index import same_team
 
 # Page config
 st.set_page_config(
@@ -216,8 +217,8 @@ elif selected == "🎯 Intragame Simulation":
         
         # Filter out player's own team
         player_team = player_team_mapping.get(selected_player, {}).get("team")
-        if player_team and player_team in all_teams:
-            opponent_teams = [t for t in all_teams if t != player_team]
+        if player_team and any(same_team(t, player_team) for t in all_teams):
+            opponent_teams = [t for t in all_teams if not same_team(t, player_team)]
         else:
             opponent_teams = all_teams
             
@@ -482,7 +483,7 @@ elif selected == "🎮 Live Demo":
             # Random opponent (not player's team)
             all_teams = ["Lakers", "Warriors", "Celtics", "Heat", "Nuggets", "Bucks"]
             player_team = player_team_mapping.get(player, {}).get("team")
-            opponent_teams = [t for t in all_teams if t != player_team]
+            opponent_teams = [t for t in all_teams if not same_team(t, player_team)]
             opponent = random.choice(opponent_teams)
             
             # Random date
@@ -14,6 +14,7 @@ from Core.base_price_algorithm import BasePriceAlgorithm  # Changed from core to
 from Core.intragame_algorithm_real import IntragameAlgorithmReal
 from Core.timeframe_algorithm import TimeframeAlgorithm
 from Data.nba_data_bridge import NBADataBridge
+from MonteCarlo.team_index import same_team
 from datetime import datetime, timedelta
 import pandas as pd
 import random
@@ -151,8 +152,8 @@ class IntegratedSportsMarketSimulator:
         ]
         
         # Filter out player's own team if known
-        if player_team and player_team in all_teams:
-            teams = [t for t in all_teams if t != player_team]
+        if player_team and any(same_team(t, player_team) for t in all_teams):
+            teams = [t for t in all_teams if not same_team(t, player_team)]
             print(f"(Excluding {player_team} - {player_name}'s team)")
         else:
             teams = all_teams
@@ -388,7 +389,7 @@ class IntegratedSportsMarketSimulator:
         player_team = player_team_mapping[player_name]
         
         # Select opponent team (NOT the player's own team)
-        opponent_teams = [team for team in all_teams if team != player_team]
+        opponent_teams = [team for team in all_teams if not same_team(team, player_team)]
         opponent_team = random.choice(opponent_teams)
         
         # Generate a PAST date from the 2023-24 season
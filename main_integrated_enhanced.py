@@ -32,6 +32,7 @@ from Data.real_sports_market import RealSportsMarket
 from Core.base_price_algorithm import BasePriceAlgorithm
 from Core.intragame_algorithm_real import IntragameAlgorithmReal
 from Core.timeframe_algorithm import TimeframeAlgorithm
+from MonteCarlo.team_index import same_team
 from datetime import datetime, timedelta
 import pandas as pd
 import random
@@ -324,7 +325,7 @@ class EnhancedIntegratedSportsMarketSimulator:
         
         # Try a few different opponent teams
         potential_opponents = ["Warriors", "Lakers", "Celtics", "Heat", "Nuggets", "Bucks", "Suns"]
-        opponent_teams = [t for t in potential_opponents if t != player_team]
+        opponent_teams = [t for t in potential_opponents if not same_team(t, player_team)]
         
         real_games_found = []
         
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from MonteCarlo.adaptive import run_adaptive_draws
+
+
+def _draw_batch(n, rng=np.random.default_rng(0)):
+    return {'PTS': rng.poisson(25, n)}
+
+
+@pytest.mark.parametrize('max_simulations', [0, -5])
+def test_rejects_empty_simulation_cap(max_simulations):
+    with pytest.raises(ValueError):
+        run_adaptive_draws(_draw_batch, max_simulations=max_simulations)
+
+
+def test_cap_below_one_batch_draws_the_cap():
+    draws, n_used, converged = run_adaptive_draws(_draw_batch, max_simulations=10, batch_size=1000)
+    assert n_used == 10
+    assert len(draws['PTS']) == 10
+    assert not converged
+
+
+def test_simulator_rejects_adaptive_with_worker_processes():
+    from MonteCarlo.main import EnhancedNBAMonteCarloSimulator
+
+    with pytest.raises(ValueError):
+        EnhancedNBAMonteCarloSimulator().run_enhanced_monte_carlo_simulation(
+            'LeBron James', 'Warriors', '2024-03-16', adaptive=True, n_workers=2
+        )
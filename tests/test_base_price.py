@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from Core.base_price_algorithm import PRICE_STATS, BasePriceAlgorithm
+
+CUSTOM_LEAGUE_STATS = {
+    'pts': {'mean': 11.2, 'std': 6.9},
+    'ast': {'mean': 2.6, 'std': 2.1},
+    'reb': {'mean': 4.3, 'std': 2.8},
+    'to': {'mean': 1.3, 'std': 0.9},
+    'stocks': {'mean': 1.4, 'std': 0.8},
+    'ts%': {'mean': 0.57, 'std': 0.06}
+}
+
+
+@pytest.mark.parametrize('league_stats', [None, CUSTOM_LEAGUE_STATS])
+def test_price_batch_matches_scalar_prices(league_stats):
+    pricer = BasePriceAlgorithm(league_stats)
+    rng = np.random.default_rng(0)
+    stats = np.column_stack([
+        rng.uniform(0, 40, 200), rng.uniform(0, 15, 200), rng.uniform(0, 12, 200),
+        rng.uniform(0, 6, 200), rng.uniform(0, 5, 200), rng.uniform(0.3, 0.8, 200)
+    ])
+    # Extremes that hit the PRS clip at both ends
+    stats[0] = [0, 0, 0, 10, 0, 0]
+    stats[1] = [60, 25, 20, 0, 8, 1]
+
+    batch = pricer.price_batch(stats)
+    for i, row in enumerate(stats):
+        scalar = pricer.calculate_base_price(player_stats=tuple(row))
+        assert batch['base_price'][i] == pytest.approx(scalar['base_price'], rel=1e-12)
+        assert batch['prs'][i] == pytest.approx(scalar['prs'], rel=1e-12, abs=1e-15)
+        for j, stat in enumerate(PRICE_STATS):
+            assert batch['z_scores'][i, j] == pytest.approx(scalar['z_scores'][stat], rel=1e-12)
+            assert batch['percentiles'][i, j] == pytest.approx(scalar['percentiles'][stat], rel=1e-12)
+
+
+def test_rookie_price_batch_matches_scalar_prices():
+    pricer = BasePriceAlgorithm()
+    picks = np.arange(1, 61)
+
+    batch = pricer.rookie_price_batch(picks)
+    for i, pick in enumerate(picks):
+        scalar = pricer.calculate_base_price(draft_pick=int(pick), is_rookie=True)
+        assert batch['base_price'][i] == pytest.approx(scalar['base_price'], rel=1e-12)
+        assert batch['drs'][i] == pytest.approx(scalar['drs'], rel=1e-12)
+    assert batch['draft_pick'].tolist() == picks.tolist()
@@ -0,0 +1,44 @@
+import numpy as np
+
+from MonteCarlo.draw_engine import run_joint_draws, run_stacked_joint_draws, run_vectorized_draws
+from MonteCarlo.training_set import MARKET_STATS, WeightedTrainingSet
+
+
+def _training_set(n_games=60, seed=7):
+    """Games where every stat is positive, so joint and per-stat pools match"""
+    rng = np.random.default_rng(seed)
+    values = {
+        'PTS': rng.integers(12, 38, n_games),
+        'REB': rng.integers(3, 12, n_games),
+        'AST': rng.integers(2, 10, n_games),
+        'TO': rng.integers(1, 5, n_games),
+        'STOCKS': rng.integers(1, 4, n_games),
+        '3PM': rng.integers(1, 6, n_games),
+        'TS%': rng.uniform(0.45, 0.7, n_games)
+    }
+    return WeightedTrainingSet(values, rng.integers(1, 6, n_games))
+
+
+def test_joint_and_per_stat_marginal_means_agree():
+    training_set = _training_set()
+    n_simulations = 200_000
+    per_stat = run_vectorized_draws(training_set, n_simulations, 0.03, rng=np.random.default_rng(1))
+    joint = run_joint_draws(training_set, n_simulations, 0.03, rng=np.random.default_rng(2))
+    stacked = run_stacked_joint_draws([training_set], n_simulations, [0.03], rng=np.random.default_rng(3))
+
+    for stat in MARKET_STATS:
+        if stat == 'TS%':
+            continue
+        standard_error = per_stat[stat].std() / np.sqrt(n_simulations)
+        assert abs(joint[stat].mean() - per_stat[stat].mean()) < 6 * standard_error, stat
+        assert abs(stacked[stat][0].mean() - per_stat[stat].mean()) < 6 * standard_error, stat
+
+
+def test_joint_counting_stats_are_truncated():
+    values = {stat: np.full(4, 2.9 if stat != 'TS%' else 0.5) for stat in MARKET_STATS}
+    training_set = WeightedTrainingSet(values, np.ones(4))
+    # Zero noise: every draw is the game itself, truncated like int()
+    draws = run_joint_draws(training_set, 1000, 0.0, variance={stat: 0.0 for stat in MARKET_STATS},
+                            rng=np.random.default_rng(0))
+    assert (draws['PTS'] == 2).all()
+    assert (draws['STOCKS'] == 2).all()
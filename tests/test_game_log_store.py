@@ -0,0 +1,79 @@
+import json
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from MonteCarlo.game_log_store import GameLogStore
+
+
+def _logs(dates, start_id=1):
+    return pd.DataFrame({
+        'SEASON_ID': '22023',
+        'Player_ID': 2544,
+        'Game_ID': [f"00223{start_id + i:05d}" for i in range(len(dates))],
+        'GAME_DATE': dates,
+        'MATCHUP': 'LAL vs. GSW',
+        'MIN': 35,
+        'PTS': [25 + i for i in range(len(dates))],
+        'FG_PCT': 0.512,
+        'CUSTOM': 'x'
+    })
+
+
+def test_round_trip_keeps_typed_and_extra_columns(tmp_path):
+    store = GameLogStore(str(tmp_path / 'logs.sqlite'))
+    store.append(2544, '2023-24', _logs(['2024-01-03', '2024-01-01']))
+
+    game_logs = store.load(2544, '2023-24')
+    assert game_logs['GAME_DATE'].dt.strftime('%Y-%m-%d').tolist() == ['2024-01-01', '2024-01-03']
+    assert game_logs['PTS'].tolist() == [26, 25]
+    assert game_logs['PTS'].dtype.kind == 'i'
+    assert game_logs['FG_PCT'].tolist() == [0.512, 0.512]
+    assert game_logs['CUSTOM'].tolist() == ['x', 'x']
+    # Columns the source never had are not invented
+    assert 'REB' not in game_logs
+
+
+def test_version_1_store_is_migrated(tmp_path):
+    path = str(tmp_path / 'logs.sqlite')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE game_logs (player_id INTEGER NOT NULL, season TEXT NOT NULL, game_id TEXT NOT NULL,
+            game_date TEXT NOT NULL, row_json TEXT NOT NULL, PRIMARY KEY (player_id, season, game_id));
+        CREATE TABLE log_meta (player_id INTEGER NOT NULL, season TEXT NOT NULL, fetched_at REAL NOT NULL,
+            last_game_date TEXT, complete INTEGER NOT NULL, PRIMARY KEY (player_id, season));
+    """)
+    row = {'Game_ID': '0022300001', 'GAME_DATE': '2024-01-01', 'MATCHUP': 'LAL @ PHX', 'PTS': 31}
+    conn.execute('INSERT INTO game_logs VALUES (?, ?, ?, ?, ?)',
+                 (2544, '2023-24', '0022300001', '2024-01-01', json.dumps(row)))
+    conn.execute('INSERT INTO log_meta VALUES (?, ?, ?, ?, ?)', (2544, '2023-24', 0.0, '2024-01-01', 1))
+    conn.commit()
+    conn.close()
+
+    game_logs = GameLogStore(path).load(2544, '2023-24')
+    assert game_logs['PTS'].tolist() == [31]
+    assert game_logs['MATCHUP'].tolist() == ['LAL @ PHX']
+
+
+def test_read_through_falls_back_to_stored_logs_on_fetch_errors(tmp_path, capsys):
+    # A season that is still in progress, with logs already stale
+    store = GameLogStore(str(tmp_path / 'logs.sqlite'), max_age_hours=0)
+    store.append(2544, '2099-00', _logs(['2024-01-01']))
+
+    def unavailable(date_from):
+        raise ConnectionError("stats.nba.com timed out")
+
+    game_logs = store.read_through(2544, '2099-00', unavailable)
+    assert len(game_logs) == 1
+    assert 'using stored logs' in capsys.readouterr().out
+
+
+def test_read_through_propagates_programming_errors(tmp_path):
+    store = GameLogStore(str(tmp_path / 'logs.sqlite'))
+
+    def broken(date_from):
+        raise KeyError('resultSets')
+
+    with pytest.raises(KeyError):
+        store.read_through(2544, '2099-00', broken)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from Core.intragame_algorithm import IntragameAlgorithm
+
+
+def test_batch_details_match_scalar_simulation():
+    rng = np.random.default_rng(5)
+    n_players = 200
+    season_avg = rng.uniform(0, 30, (n_players, 7))
+    season_avg[:, 6] = rng.uniform(0.4, 0.7, n_players)
+    last_5_avg = season_avg * rng.uniform(0.5, 1.5, (n_players, 7))
+    actual = season_avg * rng.uniform(0, 2, (n_players, 7))
+    old_prices = rng.uniform(5, 200, n_players)
+
+    algorithm = IntragameAlgorithm()
+    batch = algorithm.simulate_intragame_batch(actual, season_avg, last_5_avg, old_prices)
+    for i in range(n_players):
+        scalar = algorithm.simulate_intragame(
+            tuple(actual[i]), tuple(season_avg[i]), tuple(last_5_avg[i]), old_prices[i]
+        )
+        details = batch.details(i)
+        assert details['projected_stats'] == scalar['projected_stats']
+        assert details['standard_deviations'] == scalar['standard_deviations']
+        assert details['z_scores'] == scalar['z_scores']
+        for key in ('pps', 'dis', 'raw_delta', 'dampened_delta', 'new_price', 'price_change_pct'):
+            assert details[key] == scalar[key], key
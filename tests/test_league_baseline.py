@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from MonteCarlo.game_log_store import GameLogStore
+from MonteCarlo.league_baseline import LeagueBaseline
+
+
+def _games(player_id, start, n_games, minutes, seed):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, periods=n_games, freq='2D')
+    return pd.DataFrame({
+        'Game_ID': [f"{player_id}-{date:%Y%m%d}" for date in dates],
+        'GAME_DATE': dates,
+        'MIN': minutes,
+        'PTS': rng.integers(5, 35, n_games),
+        'REB': rng.integers(1, 12, n_games),
+        'AST': rng.integers(1, 10, n_games),
+        'TOV': rng.integers(0, 5, n_games),
+        'STL': rng.integers(0, 3, n_games),
+        'BLK': rng.integers(0, 3, n_games),
+        'FGA': rng.integers(8, 22, n_games),
+        'FTA': rng.integers(0, 8, n_games)
+    })
+
+
+def test_refresh_snapshots_only_when_the_baseline_changes(tmp_path):
+    store = GameLogStore(str(tmp_path / 'logs.sqlite'))
+    baseline = LeagueBaseline(store, min_games=5, min_minutes=15.0)
+    for player_id in (1, 2, 3):
+        store.append(player_id, '2023-24', _games(player_id, '2023-11-01', 10, 30, seed=player_id))
+    # A bench player below the minutes cutoff
+    store.append(9, '2023-24', _games(9, '2023-11-01', 10, 6, seed=9))
+
+    first = baseline.refresh('2023-24')
+    assert first is not None
+    assert baseline.refresh('2023-24') == first
+
+    # New games for the ineligible player only: no new snapshot
+    store.append(9, '2023-24', _games(9, '2024-01-01', 3, 6, seed=19))
+    assert baseline.refresh('2023-24') == first
+    assert baseline.latest_version('2023-24') == first
+
+    # New games for an eligible player change the baseline
+    store.append(2, '2023-24', _games(2, '2024-01-01', 3, 30, seed=12))
+    second = baseline.refresh('2023-24')
+    assert second > first
+    assert baseline.league_stats(second) != baseline.league_stats(first)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from Data.player_games import GAME_STAT_COLUMNS, PlayerGames
+
+
+def make_games(n_games, seed=0, shuffle=False):
+    rng = np.random.default_rng(seed)
+    stats = rng.integers(0, 30, size=(n_games, len(GAME_STAT_COLUMNS))).astype(float)
+    dates = np.datetime64('2024-10-22') + np.arange(n_games) * 2
+    if shuffle:
+        order = rng.permutation(n_games)
+        return stats[order], dates[order], stats, dates
+    return stats, dates, stats, dates
+
+
+def test_out_of_order_dates_are_sorted_with_their_rows():
+    stats, dates, sorted_stats, sorted_dates = make_games(12, shuffle=True)
+    games = PlayerGames(stats, dates=dates)
+
+    np.testing.assert_array_equal(games.matrix, sorted_stats)
+    np.testing.assert_array_equal(games.dates, sorted_dates.astype('datetime64[ns]'))
+    # Newest-first input (the raw nba_api order) answers date windows correctly
+    newest_first = PlayerGames(sorted_stats[::-1], dates=sorted_dates[::-1])
+    assert newest_first.index_before(sorted_dates[5]) == 5
+    assert newest_first[-1] == tuple(sorted_stats[-1])
+
+
+def test_mismatched_dates_are_rejected():
+    with pytest.raises(ValueError):
+        PlayerGames(np.zeros((3, len(GAME_STAT_COLUMNS))), dates=np.array(['2024-01-01'], dtype='datetime64[D]'))
+
+
+def naive_window(stats, dates, n, before=None):
+    rows = [row for row, date in zip(stats, dates) if before is None or date < before]
+    if n > 0:
+        rows = rows[-n:]
+    if not rows:
+        zeros = np.zeros(len(GAME_STAT_COLUMNS))
+        return zeros, zeros
+    rows = np.array(rows)
+    return rows.mean(axis=0), rows.std(axis=0)
+
+
+@pytest.mark.parametrize('n', [0, 1, 5, 10, 40])
+def test_window_moments_match_a_per_game_loop(n):
+    stats, dates, sorted_stats, sorted_dates = make_games(25, seed=n, shuffle=True)
+    games = PlayerGames(stats, dates=dates)
+
+    for before in [None, sorted_dates[0], sorted_dates[7], sorted_dates[-1] + 1]:
+        expected_mean, expected_std = naive_window(sorted_stats, sorted_dates, n, before)
+        mean, std = games.window_moments(n, before)
+        np.testing.assert_allclose(mean, expected_mean, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(std, expected_std, rtol=1e-9, atol=1e-9)
+        expected_average = tuple(expected_mean.tolist()) if before is None or before > sorted_dates[0] \
+            else (0, 0, 0, 0, 0, 0, 0)
+        np.testing.assert_allclose(games.last_n_averages(n, before), expected_average, rtol=1e-12, atol=1e-12)
+
+
+def test_rolling_moments_match_a_per_game_loop():
+    stats, dates, _, _ = make_games(20, seed=3)
+    games = PlayerGames(stats, dates=dates)
+    means, stds = games.rolling_moments(5)
+
+    assert np.all(np.isnan(means[0]))
+    for i in range(1, len(stats)):
+        window = stats[max(0, i - 5):i]
+        np.testing.assert_allclose(means[i], window.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(stds[i], window.std(axis=0), rtol=1e-9, atol=1e-9)
@@ -0,0 +1,34 @@
+import os
+
+from MonteCarlo.player_index import PlayerIndex, load_or_build_index
+
+PLAYERS = [
+    {'id': 1, 'full_name': 'Marcus Thornton', 'is_active': True},
+    {'id': 2, 'full_name': 'Marcus Morris', 'is_active': False}
+]
+
+
+def test_saved_index_is_reused_for_the_same_player_list(tmp_path):
+    path = str(tmp_path / 'index.pkl')
+    load_or_build_index(PLAYERS, path)
+    mtime = os.stat(path).st_mtime_ns
+
+    index = load_or_build_index([dict(player) for player in PLAYERS], path)
+    assert os.stat(path).st_mtime_ns == mtime
+    assert index.get_id('Marcus') == 1
+
+
+def test_saved_index_is_rebuilt_when_is_active_changes(tmp_path):
+    path = str(tmp_path / 'index.pkl')
+    load_or_build_index(PLAYERS, path)
+
+    # Same player count, different activity: the tiebreak must follow it
+    flipped = [dict(PLAYERS[0], is_active=False), dict(PLAYERS[1], is_active=True)]
+    assert load_or_build_index(flipped, path).get_id('Marcus') == 2
+    assert PlayerIndex.load(path).get_id('Marcus') == 2
+
+
+def test_save_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / 'index.pkl')
+    PlayerIndex(PLAYERS).save(path)
+    assert os.listdir(tmp_path) == ['index.pkl']
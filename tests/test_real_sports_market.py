@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip('nba_api')
+
+from Data.real_sports_market import RealSportsMarket
+from MonteCarlo.player_index import PlayerIndex
+
+PLAYERS = ["LeBron James", "Stephen Curry", "Nikola Jokic"]
+
+
+@pytest.fixture
+def market():
+    # Only the player list and index; no data bridge or network needed
+    market = RealSportsMarket.__new__(RealSportsMarket)
+    market.available_players = list(PLAYERS)
+    market._player_index = PlayerIndex.from_names(PLAYERS)
+    return market
+
+
+@pytest.mark.parametrize('search_term', ['', '   '])
+def test_empty_search_returns_every_available_player(market, search_term):
+    assert market.search_player(search_term) == PLAYERS
+
+
+def test_search_matches_by_name(market):
+    assert market.search_player('jokic') == ["Nikola Jokic"]
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from MonteCarlo import replay
+from MonteCarlo.game_log_store import DEFAULT_STORE_PATH
+from MonteCarlo.main import NBAMonteCarloSimulator
+from MonteCarlo.replay import FixtureNotFoundError, ReplayTransport, frame_to_payload
+
+LOGS = pd.DataFrame({
+    'Player_ID': [2544, 2544],
+    'Game_ID': ['0021500001', '0021500002'],
+    'GAME_DATE': ['2015-10-28', '2015-10-30'],
+    'MATCHUP': ['CLE @ CHI', 'CLE vs. MEM'],
+    'PTS': [25, 31]
+})
+
+
+@pytest.fixture
+def replayed_simulator(tmp_path, monkeypatch):
+    # Record one season's fixture, then replay it through the simulator
+    recorder = ReplayTransport('record', fixture_dir=str(tmp_path))
+    recorder.call('playergamelog', {'player_id': 2544, 'season': '2015-16', 'date_from': None},
+                  lambda: LOGS, encode=frame_to_payload)
+
+    # Installed through MonteCarlo.replay; the fetch path imports replay top-level
+    monkeypatch.setattr(replay, '_TRANSPORT', ReplayTransport('replay', fixture_dir=str(tmp_path)))
+    simulator = NBAMonteCarloSimulator()
+    monkeypatch.setattr(simulator, 'get_player_id', lambda player_name: 2544)
+    return simulator
+
+
+def test_replay_serves_recorded_logs_from_a_private_store(replayed_simulator):
+    game_logs = replayed_simulator.fetch_player_game_logs('LeBron James', '2015-16')
+
+    assert game_logs['PTS'].tolist() == [25, 31]
+    assert replayed_simulator.game_log_store.path != DEFAULT_STORE_PATH
+    assert not replayed_simulator.game_log_store.path.startswith(DEFAULT_STORE_PATH)
+
+
+def test_replay_raises_for_unrecorded_requests(replayed_simulator):
+    with pytest.raises(FixtureNotFoundError):
+        replayed_simulator.fetch_player_game_logs('LeBron James', '2016-17')
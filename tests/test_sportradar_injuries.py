@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip('requests')
+
+from Data.sportradar_injuries_api import SportradarInjuriesAPI
+from MonteCarlo.injury_cache import InjuryCache
+
+
+def test_injected_empty_cache_receives_entries(tmp_path, monkeypatch):
+    # An empty cache has len() == 0; it must still be the one the client uses
+    cache = InjuryCache(str(tmp_path / 'injuries.sqlite'))
+    assert len(cache) == 0
+
+    with SportradarInjuriesAPI('test-key', cache=cache) as api:
+        assert api.cache is cache
+        monkeypatch.setattr(api, '_make_request', lambda endpoint: {'teams': []})
+        assert api.get_current_injuries() == {'teams': []}
+
+    assert 'current_injuries' in cache
+    assert len(InjuryCache(str(tmp_path / 'injuries.sqlite'))) == 1
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from MonteCarlo.histogram import IntegerHistogram
+from MonteCarlo.streaming import StatAccumulator, StreamingAccumulator, scale_draws
+
+
+def test_integer_histogram_rejects_fractional_draws():
+    with pytest.raises(ValueError):
+        IntegerHistogram().update(np.array([1.0, 2.5]))
+    # Whole-number floats are fine
+    assert IntegerHistogram.from_values(np.array([1.0, 2.0, 2.0])).counts.tolist() == [0, 1, 2]
+
+
+def test_scaled_integer_draws_keep_moments_and_percentiles_consistent():
+    rng = np.random.default_rng(0)
+    draws = {'PTS': rng.integers(0, 40, 50_000)}
+    scaled = scale_draws(draws, {'PTS': 1.07})
+
+    accumulator = StreamingAccumulator(['PTS']).update(scaled)
+    stat = accumulator.stats['PTS']
+    rounded = np.rint(scaled['PTS'])
+    assert stat.mean == pytest.approx(rounded.mean(), rel=1e-12)
+    assert stat.histogram.mean() == pytest.approx(stat.mean, rel=1e-12)
+    assert stat.summary()['50th'] == np.percentile(rounded, 50)
+
+
+def test_rate_stats_are_binned_not_rounded():
+    stat = StatAccumulator(resolution=0.001).update(np.array([0.512, 0.534]))
+    assert stat.mean == pytest.approx(0.523)
@@ -0,0 +1,47 @@
+import threading
+
+import numpy as np
+
+from MonteCarlo.main import EnhancedNBAMonteCarloSimulator
+from MonteCarlo.streaming import StreamingAccumulator
+from MonteCarlo.training_set import WeightedTrainingSet
+
+
+class LockedInjuryAPI:
+    """Stands in for SportradarInjuriesAPI: holds a lock, so it can't be pickled"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def get_injury_context_for_game(self, player_team, opponent_team, date):
+        return {'total_boost': 0.02, 'player_team_injuries': []}
+
+
+class OfflineSimulator(EnhancedNBAMonteCarloSimulator):
+    """Simulator with a fixed training set instead of fetched game logs"""
+
+    def _load_training_set(self, *args, **kwargs):
+        rng = np.random.default_rng(3)
+        return WeightedTrainingSet(
+            {'PTS': rng.integers(10, 35, 40), 'REB': rng.integers(2, 12, 40), 'AST': rng.integers(1, 9, 40)},
+            np.ones(40)
+        )
+
+
+def test_streaming_with_parallel_workers_and_injury_api():
+    simulator = OfflineSimulator()
+    simulator.injury_api = LockedInjuryAPI()
+    kwargs = dict(player_team='Lakers', n_simulations=120_000, seed=11, streaming=True, chunk_size=20_000)
+
+    parallel, adjustments, _ = simulator.run_enhanced_monte_carlo_simulation(
+        'LeBron James', 'Warriors', '2024-03-16', n_workers=2, **kwargs
+    )
+    serial, _, _ = simulator.run_enhanced_monte_carlo_simulation(
+        'LeBron James', 'Warriors', '2024-03-16', n_workers=1, **kwargs
+    )
+
+    assert isinstance(parallel, StreamingAccumulator)
+    assert parallel.n == 120_000
+    assert adjustments['injury_boost'] == 0.02
+    # Same seed, same shards: worker count doesn't change the result
+    assert parallel.summary() == serial.summary()
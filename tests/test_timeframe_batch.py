@@ -0,0 +1,50 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from Core.timeframe_algorithm import TimeframeAlgorithm
+
+
+def test_batch_matches_scalar_for_every_archetype_and_timeframe():
+    algorithm = TimeframeAlgorithm()
+    tables = algorithm.tables
+    # Every table row plus no archetype and an unknown one (both map to the default row)
+    archetypes = list(tables.archetypes) + [None, 'Unlisted']
+    combos = list(itertools.product(archetypes, tables.timeframes)) * 4
+    n = len(combos)
+
+    rng = np.random.default_rng(11)
+    season_avg = rng.uniform(0.5, 30, (n, 7))
+    season_avg[:, 6] = rng.uniform(0.4, 0.7, n)
+    recent_avg = season_avg * rng.uniform(0.5, 1.5, (n, 7))
+    num_games = rng.integers(1, 20, n)
+    actual_totals = season_avg * rng.uniform(0, 2, (n, 7)) * num_games[:, None]
+    old_prices = rng.uniform(5, 200, n)
+    player_archetypes = [archetype for archetype, _ in combos]
+    timeframes = [timeframe for _, timeframe in combos]
+
+    batch = algorithm.simulate_timeframe_batch(
+        actual_totals, num_games, season_avg, recent_avg, old_prices, timeframes, player_archetypes
+    )
+    for i, (archetype, timeframe) in enumerate(combos):
+        scalar = algorithm.simulate_timeframe(
+            tuple(actual_totals[i]), int(num_games[i]), tuple(season_avg[i]), tuple(recent_avg[i]),
+            old_prices[i], timeframe, player_archetype=archetype
+        )
+        for key in ('projected_stats', 'standard_deviations', 'actual_averages', 'z_scores'):
+            expected = scalar[key]
+            if isinstance(expected, dict):
+                expected = [expected[stat] for stat in tables.stats]
+            np.testing.assert_allclose(batch[key][i], expected, rtol=1e-12, err_msg=f"{key} {archetype} {timeframe}")
+        for key in ('pps', 'dis', 'raw_delta', 'dampened_delta', 'new_price', 'price_change_pct'):
+            assert batch[key][i] == pytest.approx(scalar[key], rel=1e-12, abs=1e-12), (key, archetype, timeframe)
+
+
+def test_batch_rejects_zero_games_like_the_scalar_path():
+    algorithm = TimeframeAlgorithm()
+    stats = np.full((2, 7), 10.0)
+    with pytest.raises(ZeroDivisionError):
+        algorithm.simulate_timeframe((10.0,) * 7, 0, (10.0,) * 7, (10.0,) * 7, 50.0, 'weekly')
+    with pytest.raises(ZeroDivisionError):
+        algorithm.simulate_timeframe_batch(stats, [3, 0], stats, stats, [50.0, 60.0], 'weekly')
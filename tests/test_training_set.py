@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from MonteCarlo.training_set import MARKET_STATS, game_log_matrix
+
+
+def naive_market_row(game):
+    attempts = game['FGA'] + 0.44 * game['FTA']
+    ts_pct = game['PTS'] / (2 * attempts) if attempts > 0 else 0.0
+    return [game['PTS'], game['REB'], game['AST'], game['TOV'],
+            game['STL'] + game['BLK'], game['FG3M'], ts_pct]
+
+
+def test_game_log_matrix_matches_a_per_game_loop():
+    rng = np.random.default_rng(0)
+    columns = ['PTS', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'FG3M', 'FGA', 'FTA']
+    game_logs = pd.DataFrame(rng.integers(0, 25, size=(30, len(columns))), columns=columns)
+    # Zero-attempt games: a DNP-style line and free points with no attempts recorded
+    game_logs.loc[3, ['PTS', 'FGA', 'FTA']] = 0
+    game_logs.loc[8, ['PTS', 'FGA', 'FTA']] = [2, 0, 0]
+
+    expected = np.array([naive_market_row(game) for _, game in game_logs.iterrows()], dtype=float)
+    matrix = game_log_matrix(game_logs)
+
+    assert matrix.shape == (30, len(MARKET_STATS))
+    np.testing.assert_allclose(matrix, expected, rtol=1e-12)
+    assert matrix[3, -1] == 0.0 and matrix[8, -1] == 0.0
+
+
+def test_game_log_matrix_prefers_ts_pct_and_fills_missing_columns():
+    game_logs = pd.DataFrame({'PTS': [10, 20], 'FGA': [8, 0], 'FTA': [2, 0], 'TS_PCT': [0.55, None]})
+    matrix = game_log_matrix(game_logs, stats=('PTS', 'REB', 'TS%'))
+
+    np.testing.assert_allclose(matrix, [[10, 0, 0.55], [20, 0, 0.0]])
+    assert game_log_matrix(game_logs.iloc[:0]).shape == (0, len(MARKET_STATS))